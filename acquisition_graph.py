@@ -0,0 +1,249 @@
+# acquisition_graph.py
+# Acquisitions as a directed graph, acquirer -> target. Lineage ("everything X bought,
+# directly or through what it bought, and everyone who bought X") and the largest
+# consolidators are recursive CTEs in MySQL 8. The app answers them from an in-process copy
+# instead: adjacency lists built once per version of the acquisitions, with each startup's
+# closure (reachable startups and their depth) cached on first lookup, so a repeat lookup
+# costs only the size of its result. The copy is rebuilt after the Acquisitions tabs write,
+# or when change_log shows an acquisition changed outside the app.
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+import streamlit as st
+
+from change_feed import FEEDS, change_log_installed, get_frame
+from config import ACQUISITION_GRAPH_CONFIG
+from db import read_df, execute_query, query_cache
+
+# Longest chain followed; also what stops the CTEs on a cycle (A bought B, B later bought A)
+MAX_DEPTH = 32
+
+# The recursive members use UNION (DISTINCT), not UNION ALL: a startup reached along several
+# paths of one length (A bought B and C, both bought D) is one row per level, so the work
+# grows with startups x levels rather than with the number of paths, as the BFS closure does
+
+LINEAGE_QUERY = """
+WITH RECURSIVE
+acquired (Startup_ID, Depth) AS (
+    SELECT Target_Startup_ID, 1
+    FROM acquisitions
+    WHERE Acquirer_Startup_ID = %s AND Target_Startup_ID IS NOT NULL
+    UNION
+    SELECT a.Target_Startup_ID, d.Depth + 1
+    FROM acquired d
+    JOIN acquisitions a ON a.Acquirer_Startup_ID = d.Startup_ID
+    WHERE a.Target_Startup_ID IS NOT NULL AND d.Depth < %s
+),
+acquirers (Startup_ID, Depth) AS (
+    SELECT Acquirer_Startup_ID, 1
+    FROM acquisitions
+    WHERE Target_Startup_ID = %s AND Acquirer_Startup_ID IS NOT NULL
+    UNION
+    SELECT a.Acquirer_Startup_ID, u.Depth + 1
+    FROM acquirers u
+    JOIN acquisitions a ON a.Target_Startup_ID = u.Startup_ID
+    WHERE a.Acquirer_Startup_ID IS NOT NULL AND u.Depth < %s
+)
+SELECT l.Direction, l.Startup_ID, s.Name AS Startup, l.Depth
+FROM (
+    SELECT 'Acquirer' AS Direction, Startup_ID, MIN(Depth) AS Depth FROM acquirers GROUP BY Startup_ID
+    UNION ALL
+    SELECT 'Acquired' AS Direction, Startup_ID, MIN(Depth) AS Depth FROM acquired GROUP BY Startup_ID
+) l
+JOIN startups s ON l.Startup_ID = s.Startup_ID
+WHERE l.Startup_ID <> %s
+ORDER BY l.Direction DESC, l.Depth, l.Startup_ID
+"""
+
+# Acquirers by how many startups they control, directly or through their acquisitions
+CONSOLIDATORS_QUERY = """
+WITH RECURSIVE reach (Root_ID, Startup_ID, Depth) AS (
+    SELECT Acquirer_Startup_ID, Target_Startup_ID, 1
+    FROM acquisitions
+    WHERE Acquirer_Startup_ID IS NOT NULL AND Target_Startup_ID IS NOT NULL
+    UNION
+    SELECT r.Root_ID, a.Target_Startup_ID, r.Depth + 1
+    FROM reach r
+    JOIN acquisitions a ON a.Acquirer_Startup_ID = r.Startup_ID
+    WHERE a.Target_Startup_ID IS NOT NULL AND r.Depth < %s
+)
+SELECT s.Startup_ID, s.Name AS Startup,
+       SUM(r.Depth = 1) AS Direct,
+       COUNT(*) AS Controlled,
+       MAX(r.Depth) AS Levels
+FROM (
+    SELECT Root_ID, Startup_ID, MIN(Depth) AS Depth
+    FROM reach
+    WHERE Startup_ID <> Root_ID
+    GROUP BY Root_ID, Startup_ID
+) r
+JOIN startups s ON r.Root_ID = s.Startup_ID
+GROUP BY s.Startup_ID, s.Name
+ORDER BY Controlled DESC, s.Startup_ID
+LIMIT %s
+"""
+
+WATCHED_TABLES = {'acquisitions', 'startups'}
+
+
+def lineage_params(startup_id):
+    return (startup_id, MAX_DEPTH, startup_id, MAX_DEPTH, startup_id)
+
+
+class AcquisitionGraph:
+    # `acquisitions`: Acquirer_Startup_ID, Acquirer, Target_Startup_ID, Target (change_feed's frame)
+    def __init__(self, acquisitions):
+        edges = acquisitions.dropna(subset=['Acquirer_Startup_ID', 'Target_Startup_ID'])
+        self.children = {}
+        self.parents = {}
+        for acquirer, target in zip(edges['Acquirer_Startup_ID'].astype(int), edges['Target_Startup_ID'].astype(int)):
+            self.children.setdefault(acquirer, []).append(target)
+            self.parents.setdefault(target, []).append(acquirer)
+        self.names = dict(zip(edges['Target_Startup_ID'].astype(int), edges['Target']))
+        self.names.update(zip(edges['Acquirer_Startup_ID'].astype(int), edges['Acquirer']))
+        self.edges = len(edges)
+        self.loaded_at = time.monotonic()
+        self._closures = {}     # (adjacency name, startup) -> {reachable startup: depth}
+        self._lineages = {}     # startup -> lineage frame
+        self._lock = threading.Lock()
+        self._consolidators = None
+
+    # Breadth-first, so each startup gets its shortest depth; cached for this version
+    def closure(self, startup_id, direction='children'):
+        key = (direction, startup_id)
+        cached = self._closures.get(key)
+        if cached is not None:
+            return cached
+        adjacency = getattr(self, direction)
+        depths = {}
+        queue = deque([(startup_id, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if depth == MAX_DEPTH:
+                continue
+            for nxt in adjacency.get(node, ()):
+                if nxt not in depths and nxt != startup_id:
+                    depths[nxt] = depth + 1
+                    queue.append((nxt, depth + 1))
+        with self._lock:
+            self._closures[key] = depths
+        return depths
+
+    def lineage(self, startup_id):
+        cached = self._lineages.get(startup_id)
+        if cached is not None:
+            return cached
+        # Same order as LINEAGE_QUERY: acquirers, then acquired, each by depth and ID
+        parents = sorted((d, s) for s, d in self.closure(startup_id, 'parents').items())
+        children = sorted((d, s) for s, d in self.closure(startup_id, 'children').items())
+        rows = [('Acquirer', s, d) for d, s in parents] + [('Acquired', s, d) for d, s in children]
+        df = pd.DataFrame({
+            'Direction': [r[0] for r in rows],
+            'Startup_ID': pd.array([r[1] for r in rows], dtype='int64'),
+            'Startup': [self.names.get(r[1]) for r in rows],
+            'Depth': pd.array([r[2] for r in rows], dtype='int64'),
+        })
+        with self._lock:
+            self._lineages[startup_id] = df
+        return df
+
+    def consolidators(self, k=10):
+        if self._consolidators is None:
+            rows = []
+            for acquirer in self.children:
+                depths = self.closure(acquirer)
+                if depths:
+                    levels = list(depths.values())
+                    rows.append((acquirer, self.names.get(acquirer), levels.count(1), len(levels), max(levels)))
+            df = pd.DataFrame(rows, columns=['Startup_ID', 'Startup', 'Direct', 'Controlled', 'Levels'])
+            self._consolidators = df.sort_values(['Controlled', 'Startup_ID'], ascending=[False, True], ignore_index=True)
+        return self._consolidators.head(k)
+
+    def stats(self):
+        return {'edges': self.edges, 'acquirers': len(self.children), 'targets': len(self.parents),
+                'closures_cached': len(self._closures)}
+
+
+class AcquisitionGraphCache:
+    def __init__(self, refresh_every=30):
+        self.refresh_every = refresh_every
+        self._graph = None
+        self._source = None         # the change_feed frame the graph was built from
+        self._change_log = None
+        self._stale = False
+        self._lock = threading.Lock()
+        self._stats = {'builds': 0, 'build_ms': 0.0}
+        query_cache.add_listener(self._on_write)
+
+    def _on_write(self, tables):
+        if tables & WATCHED_TABLES:
+            self._stale = True
+
+    def _build(self, acquisitions):
+        start = time.perf_counter()
+        graph = AcquisitionGraph(acquisitions)
+        self._stats['builds'] += 1
+        self._stats['build_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        return graph
+
+    def graph(self):
+        with self._lock:
+            if self._change_log is None:
+                self._change_log = change_log_installed()
+            stale, self._stale = self._stale, False
+            try:
+                if self._change_log:
+                    # get_frame re-reads only logged changes, and returns a new frame only if
+                    # something changed
+                    frame = get_frame('acquisitions')
+                    if frame is not self._source:
+                        self._graph, self._source = self._build(frame), frame
+                elif self._graph is None or stale or time.monotonic() - self._graph.loaded_at > self.refresh_every:
+                    self._graph = self._build(read_df(FEEDS['acquisitions'].select, ttl=0))
+            except Exception:
+                self._stale = self._stale or stale
+                raise
+            return self._graph
+
+    def stats(self):
+        graph = self._graph
+        return {**self._stats, **(graph.stats() if graph is not None else {}), 'change_log': bool(self._change_log)}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_graph_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AcquisitionGraphCache(ACQUISITION_GRAPH_CONFIG['refresh_every'])
+        return _cache
+
+
+def _graph():
+    if not ACQUISITION_GRAPH_CONFIG['cached']:
+        return None
+    try:
+        return get_graph_cache().graph()
+    except Exception as e:
+        st.warning(f"Acquisition graph cache unavailable, using SQL: {e}")
+        return None
+
+
+# Page-side: lineage of one startup, from the cached graph or the recursive CTE
+def lineage(startup_id):
+    graph = _graph()
+    if graph is not None:
+        return graph.lineage(startup_id)
+    return execute_query(LINEAGE_QUERY, lineage_params(startup_id), prepared=True)
+
+
+def consolidators(k=10):
+    graph = _graph()
+    if graph is not None:
+        return graph.consolidators(k)
+    return execute_query(CONSOLIDATORS_QUERY, (MAX_DEPTH, k), prepared=True)
@@ -0,0 +1,59 @@
+# analytics.py
+# Queries behind the Analytics page. The chart queries read the trigger-maintained rollups.
+
+INDUSTRY_FUNDING_QUERY = """
+SELECT i.Sector, COALESCE(SUM(f.Startups), 0) AS Startups, 
+       COALESCE(SUM(f.Total_Funding), 0) AS Total_Funding
+FROM industries i
+LEFT JOIN industry_funding_summary f ON i.Industry_ID = f.Industry_ID
+GROUP BY i.Sector
+ORDER BY Total_Funding DESC
+"""
+
+TOP_STARTUPS_QUERY = """
+SELECT s.Name, f.Total_Funding, f.Rounds
+FROM startup_funding_totals f
+JOIN startups s ON f.Startup_ID = s.Startup_ID
+ORDER BY f.Total_Funding DESC
+LIMIT 10
+"""
+
+STAGE_DISTRIBUTION_QUERY = """
+SELECT Stage, Rounds AS Count, Total_Funding AS Total
+FROM stage_funding_summary
+WHERE Rounds > 0
+ORDER BY Total DESC
+"""
+
+CITY_STARTUPS_QUERY = """
+SELECT c.Name AS City, COALESCE(SUM(f.Startups), 0) AS Startups
+FROM cities c
+LEFT JOIN city_funding_summary f ON c.City_ID = f.City_ID
+GROUP BY c.Name
+ORDER BY Startups DESC
+"""
+
+# Startups with at least one round above the average round, with their totals, milestone
+# count and the average itself in one statement; a round above the average is the same as
+# the startup's largest round being above it, which the funding totals already hold (a
+# range on idx_sfs_max)
+NESTED_QUERY = """
+SELECT s.Name AS Startup_Name,
+       s.Founded_Year,
+       c.Name AS City,
+       t.Total_Funding,
+       t.Rounds,
+       COALESCE(m.Milestones, 0) AS Milestones,
+       a.Avg_Funding
+FROM funding_average a
+JOIN startup_funding_totals t ON t.Max_Funding > a.Avg_Funding
+JOIN startups s ON t.Startup_ID = s.Startup_ID
+JOIN cities c ON s.City_ID = c.City_ID
+LEFT JOIN startup_milestone_counts m ON s.Startup_ID = m.Startup_ID
+ORDER BY t.Total_Funding DESC
+"""
+
+SECTORS_QUERY = "SELECT DISTINCT Sector FROM industries ORDER BY Sector"
+
+# Aggregate Query metric -> column it sorts by
+AGGREGATE_METRICS = {'Total Funding': 'Total_Funding', 'Avg Funding': 'Avg_Funding', 'Count': 'Total_Rounds'}
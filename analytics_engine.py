@@ -0,0 +1,372 @@
+# analytics_engine.py
+# Optional in-process engine for the Analytics page (ANALYTICS_ENGINE=1). The funding rounds,
+# denormalized with their startup's sector and city, are held once per process in columnar
+# form: categorical codes for Sector/City/Stage, float64 amounts, datetime64 dates. Every
+# group-by the page offers is then a few NumPy bincounts instead of a MySQL round trip.
+# With db/change_log.sql installed, startups and rounds are patched from change_log
+# (change_feed.py); without it, new rounds are appended by Round_ID watermark and anything
+# else reloads the whole set.
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics import SECTORS_QUERY, AGGREGATE_METRICS
+from change_feed import FEEDS, FeedSpec, IncrementalFrame, change_log_installed
+from config import ANALYTICS_ENGINE_CONFIG, FUNDING_STAGES
+from db import read_df, query_cache, PoolExhaustedError, DatabaseUnavailableError
+
+STARTUPS_QUERY = """
+SELECT s.Startup_ID, s.Name, s.Founded_Year, i.Sector, c.Name AS City
+FROM startups s
+LEFT JOIN industries i ON s.Industry_ID = i.Industry_ID
+LEFT JOIN cities c ON s.City_ID = c.City_ID
+ORDER BY s.Startup_ID
+"""
+
+ROUNDS_QUERY = """
+SELECT Round_ID, Startup_ID, Stage, Amount, Date
+FROM funding_rounds
+WHERE Round_ID > %s
+ORDER BY Round_ID
+"""
+
+ROUNDS_FEED = FeedSpec(
+    table='funding_rounds',
+    key='Round_ID',
+    select="SELECT Round_ID, Startup_ID, Stage, Amount, Date FROM funding_rounds",
+    key_expr='Round_ID',
+    dtypes={'Date': 'datetime64'},
+)
+
+# Rounds arrive with Date already datetime64 (Amount is float64 by default)
+ROUNDS_DTYPES = ROUNDS_FEED.dtypes
+
+CITIES_QUERY = "SELECT DISTINCT Name FROM cities ORDER BY Name"
+
+# Trigger-maintained per-stage totals; if ours match, no round was deleted or edited
+STAGE_CHECK_QUERY = "SELECT Stage, Rounds, Total_Funding FROM stage_funding_summary"
+
+# Writes to these change sectors/cities of existing rounds, so they force a full reload
+# (startups only without change_log, which otherwise carries startup edits)
+RELOAD_TABLES = {'startups', 'industries', 'cities'}
+FEED_RELOAD_TABLES = {'industries', 'cities'}
+WATCHED_TABLES = RELOAD_TABLES | {'funding_rounds'}
+
+GROUPS = {'Industry': 'Sector', 'City': 'City', 'Funding Stage': 'Stage'}
+
+
+class FactSet:
+    # Immutable snapshot; a refresh builds a new one, so readers never see a half-applied update
+    def __init__(self, startups, rounds, watermark):
+        self.startups = startups      # Startup_ID, Name, Founded_Year, Sector, City (one row per startup)
+        self.rounds = rounds          # Round_ID, Startup_Pos, Stage, Sector, City, Amount, Date
+        self.watermark = watermark    # highest Round_ID loaded
+        self.loaded_at = time.monotonic()
+        self._memo = {}               # unfiltered results; safe because the snapshot never changes
+
+    @classmethod
+    def build(cls, startups, rounds, sectors, cities):
+        startups = pd.DataFrame({
+            'Startup_ID': startups['Startup_ID'].to_numpy(dtype='int64'),
+            'Name': startups['Name'].astype(str).to_numpy(),
+            'Founded_Year': startups['Founded_Year'],
+            'Sector': pd.Categorical(startups['Sector'], categories=sectors),
+            'City': pd.Categorical(startups['City'], categories=cities),
+        })
+        facts = cls(startups, _empty_rounds(startups), 0)
+        return facts.append(rounds)
+
+    # Startup_ID -> row position in self.startups, -1 where unknown
+    def positions(self, startup_ids):
+        ids = self.startups['Startup_ID'].to_numpy()
+        startup_ids = np.asarray(startup_ids, dtype='int64')
+        pos = np.searchsorted(ids, startup_ids)
+        pos = np.minimum(pos, max(len(ids) - 1, 0))
+        found = (ids[pos] == startup_ids) if len(ids) else np.zeros(len(startup_ids), dtype=bool)
+        return np.where(found, pos, -1)
+
+    def append(self, new_rounds):
+        if len(new_rounds) == 0:
+            return self
+        pos = self.positions(new_rounds['Startup_ID'])
+        if (pos < 0).any():
+            raise KeyError("Rounds reference startups that are not loaded")
+        sector = self.startups['Sector'].cat
+        city = self.startups['City'].cat
+        added = pd.DataFrame({
+            'Round_ID': new_rounds['Round_ID'].to_numpy(dtype='int64'),
+            'Startup_Pos': pos.astype('int32'),
+            'Stage': pd.Categorical(new_rounds['Stage'], categories=FUNDING_STAGES),
+            'Sector': pd.Categorical.from_codes(sector.codes.to_numpy()[pos], categories=sector.categories),
+            'City': pd.Categorical.from_codes(city.codes.to_numpy()[pos], categories=city.categories),
+            'Amount': new_rounds['Amount'].to_numpy(dtype='float64'),
+            'Date': pd.to_datetime(new_rounds['Date']),
+        })
+        rounds = pd.concat([self.rounds, added], ignore_index=True) if len(self.rounds) else added
+        appended = FactSet(self.startups, rounds, int(added['Round_ID'].max()))
+        appended.loaded_at = self.loaded_at
+        return appended
+
+    def nbytes(self):
+        return int(self.rounds.memory_usage(deep=True).sum() + self.startups.memory_usage(deep=True).sum())
+
+    def mask(self, sector=None, stage=None, years=None):
+        keep = np.ones(len(self.rounds), dtype=bool)
+        if sector:
+            keep &= (self.rounds['Sector'] == sector).to_numpy()
+        if stage:
+            keep &= (self.rounds['Stage'] == stage).to_numpy()
+        if years:
+            year = self.rounds['Date'].dt.year.to_numpy()
+            keep &= (year >= years[0]) & (year <= years[1])
+        return keep
+
+    # Per-category stats of the rounds in `keep`, one row for every category
+    def group_stats(self, column, keep=None, startups=True):
+        if keep is None:
+            key = ('group_stats', column, startups)
+            if key not in self._memo:
+                self._memo[key] = self._group_stats(column, None, startups)
+            return self._memo[key]
+        return self._group_stats(column, keep, startups)
+
+    def _group_stats(self, column, keep, with_startups):
+        values = self.rounds[column].cat
+        labels = values.categories
+        codes = values.codes.to_numpy()
+        amount = self.rounds['Amount'].to_numpy()
+        pos = self.rounds['Startup_Pos'].to_numpy()
+        selected = codes >= 0 if keep is None else keep & (codes >= 0)
+        codes, amount, pos = codes[selected], amount[selected], pos[selected]
+
+        # Amount is nullable: like the rollups, a NULL round counts as a round and adds 0 to the
+        # total; the average and extrema are over the rounds with an amount (fmin/fmax skip NaN)
+        n = len(labels)
+        priced = ~np.isnan(amount)
+        rounds = np.bincount(codes, minlength=n)
+        priced_rounds = np.bincount(codes[priced], minlength=n)
+        total = np.bincount(codes, weights=np.where(priced, amount, 0.0), minlength=n)
+        low = np.full(n, np.inf)
+        high = np.full(n, -np.inf)
+        np.fmin.at(low, codes, amount)
+        np.fmax.at(high, codes, amount)
+
+        if not with_startups:
+            startups = np.zeros(n, dtype='int64')
+        elif keep is None and column in ('Sector', 'City'):
+            # Unfiltered, like the rollups: every startup in the group, with or without rounds
+            startup_codes = self.startups[column].cat.codes.to_numpy()
+            startups = np.bincount(startup_codes[startup_codes >= 0], minlength=n)
+        else:
+            pairs = np.unique(codes.astype('int64') * len(self.startups) + pos)
+            startups = np.bincount(pairs // len(self.startups), minlength=n) if len(self.startups) else np.zeros(n, int)
+
+        return pd.DataFrame({
+            'Category': labels.astype(str),
+            'Total_Startups': startups,
+            'Total_Rounds': rounds,
+            'Total_Funding': total,
+            'Avg_Funding': np.divide(total, priced_rounds, out=np.zeros(n), where=priced_rounds > 0),
+            'Min_Funding': np.where(priced_rounds > 0, low, 0.0),
+            'Max_Funding': np.where(priced_rounds > 0, high, 0.0),
+        })
+
+    # Same columns and order as the Aggregate Query SQL for each grouping
+    def aggregate(self, group_by, metric='Total Funding', top_n=10, sector=None, stage=None, years=None):
+        filtered = sector or stage or years
+        keep = self.mask(sector, stage, years) if filtered else None
+        df = self.group_stats(GROUPS[group_by], keep, startups=group_by != 'Funding Stage')
+        if group_by == 'City':
+            df = df.drop(columns=['Min_Funding', 'Max_Funding'])
+        elif group_by == 'Funding Stage':
+            df = df[df['Total_Rounds'] > 0].drop(columns=['Total_Startups'])
+        df = df.sort_values(AGGREGATE_METRICS[metric], ascending=False, kind='stable')
+        return df.head(top_n).reset_index(drop=True)
+
+    def industry_funding(self):
+        df = self.group_stats('Sector')
+        df = df.rename(columns={'Category': 'Sector', 'Total_Startups': 'Startups'})
+        df = df[['Sector', 'Startups', 'Total_Funding']].sort_values('Total_Funding', ascending=False, kind='stable')
+        return df.reset_index(drop=True)
+
+    # Per-startup (total, rounds), for every loaded startup; NULL amounts add 0, as in the rollup
+    def startup_totals(self):
+        if 'startup_totals' not in self._memo:
+            pos = self.rounds['Startup_Pos'].to_numpy()
+            amount = np.nan_to_num(self.rounds['Amount'].to_numpy(), nan=0.0)
+            self._memo['startup_totals'] = (np.bincount(pos, weights=amount, minlength=len(self.startups)),
+                                            np.bincount(pos, minlength=len(self.startups)))
+        return self._memo['startup_totals']
+
+    def top_startups(self, n=10):
+        total, rounds = self.startup_totals()
+        top = np.argsort(-total, kind='stable')[:n]
+        return pd.DataFrame({
+            'Name': self.startups['Name'].to_numpy()[top],
+            'Total_Funding': total[top],
+            'Rounds': rounds[top],
+        })
+
+    def stage_distribution(self):
+        df = self.group_stats('Stage', startups=False)
+        df = df[df['Total_Rounds'] > 0].rename(columns={'Category': 'Stage', 'Total_Rounds': 'Count', 'Total_Funding': 'Total'})
+        return df[['Stage', 'Count', 'Total']].sort_values('Total', ascending=False, kind='stable').reset_index(drop=True)
+
+    def city_startups(self):
+        df = self.group_stats('City').rename(columns={'Category': 'City', 'Total_Startups': 'Startups'})
+        return df[['City', 'Startups']].sort_values('Startups', ascending=False, kind='stable').reset_index(drop=True)
+
+    # Per-stage (rounds, total) for comparing with stage_funding_summary
+    def stage_totals(self):
+        df = self.group_stats('Stage', startups=False)
+        return df.set_index('Category')[['Total_Rounds', 'Total_Funding']]
+
+
+def _empty_rounds(startups):
+    return pd.DataFrame({
+        'Round_ID': np.empty(0, dtype='int64'),
+        'Startup_Pos': np.empty(0, dtype='int32'),
+        'Stage': pd.Categorical([], categories=FUNDING_STAGES),
+        'Sector': pd.Categorical([], categories=startups['Sector'].cat.categories),
+        'City': pd.Categorical([], categories=startups['City'].cat.categories),
+        'Amount': np.empty(0, dtype='float64'),
+        'Date': pd.to_datetime(pd.Series([], dtype='object')),
+    })
+
+
+class AnalyticsEngine:
+    def __init__(self, refresh_every=30, full_reload_every=900):
+        self.refresh_every = refresh_every
+        self.full_reload_every = full_reload_every
+        self._facts = None
+        self._feeds = None      # (startups, rounds) IncrementalFrames; False without change_log
+        self._checked_at = 0.0
+        self._stale = set()
+        self._stale_lock = threading.Lock()   # writers only take this one, never the load lock
+        self._lock = threading.Lock()
+        self._stats = {'loads': 0, 'refreshes': 0, 'appended': 0, 'patched': 0, 'load_ms': 0.0}
+        query_cache.add_listener(self._on_write)
+
+    def _on_write(self, tables):
+        with self._stale_lock:
+            self._stale |= tables & WATCHED_TABLES
+
+    def _take_stale(self):
+        with self._stale_lock:
+            stale, self._stale = self._stale, set()
+        return stale
+
+    def _load(self):
+        start = time.perf_counter()
+        if self._feeds is None:
+            self._feeds = (IncrementalFrame(FEEDS['startups']), IncrementalFrame(ROUNDS_FEED)) \
+                if change_log_installed() else False
+        if self._feeds:
+            startups = self._feeds[0].load()
+            rounds = self._feeds[1].load()
+        else:
+            startups = read_df(STARTUPS_QUERY, ttl=0)
+            rounds = read_df(ROUNDS_QUERY, (0,), ttl=0, dtypes=ROUNDS_DTYPES)
+        sectors = read_df(SECTORS_QUERY, ttl=0)['Sector'].astype(str)
+        cities = read_df(CITIES_QUERY, ttl=0)['Name'].astype(str)
+        facts = FactSet.build(startups, rounds, sectors, cities)
+        self._stats['loads'] += 1
+        self._stats['load_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        return facts
+
+    def _consistent(self, facts):
+        expected = read_df(STAGE_CHECK_QUERY, ttl=0).set_index('Stage')
+        ours = facts.stage_totals().reindex(expected.index, fill_value=0)
+        return (np.array_equal(ours['Total_Rounds'].to_numpy(), expected['Rounds'].to_numpy(dtype='int64'))
+                and np.allclose(ours['Total_Funding'].to_numpy(), expected['Total_Funding'].to_numpy(dtype='float64'),
+                                rtol=1e-9, atol=0.01))
+
+    def _patch(self, facts):
+        startups, rounds = self._feeds
+        changed = startups.refresh()
+        changed = rounds.refresh() or changed
+        if not changed:
+            return facts
+        # Rebuilding from the patched frames is all vectorized; only changed rows came from MySQL
+        self._stats['patched'] += 1
+        patched = FactSet.build(startups.df, rounds.df, facts.startups['Sector'].cat.categories,
+                                facts.startups['City'].cat.categories)
+        patched.loaded_at = facts.loaded_at
+        return patched
+
+    def _refresh(self, facts):
+        if self._feeds:
+            return self._patch(facts)
+        new = read_df(ROUNDS_QUERY, (facts.watermark,), ttl=0, dtypes=ROUNDS_DTYPES)
+        try:
+            refreshed = facts.append(new)
+        except KeyError:
+            return self._load()
+        # Appends cover inserts; deletes and edits of older rounds show up as a total mismatch
+        if not self._consistent(refreshed):
+            return self._load()
+        self._stats['refreshes'] += 1
+        self._stats['appended'] += len(new)
+        return refreshed
+
+    def facts(self):
+        with self._lock:
+            stale = self._take_stale()
+            now = time.monotonic()
+            facts = self._facts
+            try:
+                reload_tables = FEED_RELOAD_TABLES if self._feeds else RELOAD_TABLES
+                if facts is None or stale & reload_tables or now - facts.loaded_at > self.full_reload_every:
+                    facts = self._load()
+                elif stale or now - self._checked_at > self.refresh_every:
+                    facts = self._refresh(facts)
+            except Exception:
+                # Try again on the next call
+                self._on_write(stale)
+                raise
+            self._facts = facts
+            self._checked_at = now
+            return facts
+
+    def stats(self):
+        facts = self._facts
+        return {
+            **self._stats,
+            'rounds': 0 if facts is None else len(facts.rounds),
+            'startups': 0 if facts is None else len(facts.startups),
+            'watermark': 0 if facts is None else facts.watermark,
+            'change_log': bool(self._feeds),
+            'memory_mb': 0.0 if facts is None else round(facts.nbytes() / 1024 / 1024, 2),
+        }
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    global _engine
+    if not ANALYTICS_ENGINE_CONFIG['enabled']:
+        return None
+    with _engine_lock:
+        if _engine is None:
+            _engine = AnalyticsEngine(ANALYTICS_ENGINE_CONFIG['refresh_every'], ANALYTICS_ENGINE_CONFIG['full_reload_every'])
+        return _engine
+
+
+# Page-side: the current FactSet, or None so the page falls back to its SQL queries
+def load_facts():
+    engine = get_engine()
+    if engine is None:
+        return None
+    try:
+        return engine.facts()
+    except (PoolExhaustedError, DatabaseUnavailableError):
+        # The SQL fallback reports these
+        return None
+    except Exception as e:
+        st.warning(f"Analytics engine unavailable, using SQL: {e}")
+        return None
@@ -1,9 +1,25 @@
 # app.py
 import streamlit as st
-import mysql.connector
 import pandas as pd
 import plotly.express as px
-from config import DB_CONFIG, APP_TITLE, APP_ICON
+from config import APP_TITLE, APP_ICON, LOOKUP_TTL, FUNDING_STAGES, IMPORT_CHUNK_SIZE
+from db import pool_stats, cache_stats, start_run_counts
+from dashboard import load_dashboard
+from pagination import paginated_table
+from export import export_panel
+from table_specs import STARTUPS_TABLE, INVESTORS_TABLE, FUNDING_TABLE, FOUNDERS_TABLE, ACQUISITIONS_TABLE
+from pickers import entity_picker, entity_multipicker
+from funding import add_funding_round
+from dimensions import load_dimension
+from lazy_tabs import lazy_tabs, session_query
+from analytics_engine import load_facts, get_engine
+from coinvest import load_network, get_network, with_names
+from acquisition_graph import lineage, consolidators, get_graph_cache
+from trends import FREQUENCIES, BREAKDOWNS, METRICS, load_trends, filter_trends, trend, stage_mix, long_form
+from statements import STATEMENTS, named_query, named_write, join_statement, aggregate_statement
+from chart_cache import plotly_chart, chart_cache_stats
+from instrumentation import query_log, set_tag
+from bulk_import import SPECS as IMPORT_SPECS, METHODS as IMPORT_METHODS, run_import
 from datetime import datetime
 import time
 
@@ -24,59 +40,35 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Database connection (NO CACHING - fresh connection each time)
-def get_connection():
-    try:
-        conn = mysql.connector.connect(**DB_CONFIG)
-        return conn
-    except mysql.connector.Error as err:
-        st.error(f"❌ Database Connection Failed: {err}")
-        st.info("Make sure:\n- MySQL is running\n- Password in .env is correct\n- Database is 'mini_project'")
-        return None
-
-def execute_query(query):
-    try:
-        conn = get_connection()
-        if conn is None:
-            return None
-        df = pd.read_sql(query, conn)
-        conn.close()
-        return df
-    except Exception as e:
-        st.error(f"❌ Query Error: {e}")
-        return None
-
-def execute_insert_update(query, params=None):
-    try:
-        conn = get_connection()
-        if conn is None:
-            return False
-        cursor = conn.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return True
-    except mysql.connector.Error as err:
-        st.error(f"❌ Operation Failed: {err}")
-        return False
-
 # Sidebar Navigation
 st.sidebar.title("Navigation")
 st.sidebar.markdown("---")
 
-page = st.sidebar.radio("Go to", [
+pages = [
     "Dashboard", 
     "Startups", 
     "Investors", 
     "Funding Rounds",
     "Founders",
     "Analytics",
-    "Acquisitions"
-])
+    "Acquisitions",
+    "Bulk Import"
+]
+# Hidden page: open the app with ?diagnostics=1
+if "diagnostics" in st.query_params:
+    pages.append("Diagnostics")
+page = st.sidebar.radio("Go to", pages)
+set_tag(page)
+
+with st.sidebar.expander("Connection Pool"):
+    st.json(pool_stats())
+
+with st.sidebar.expander("Query Cache"):
+    st.json(cache_stats())
+
+# Filled in at the end of the script with the queries this rerun issued
+run_counts = start_run_counts()
+run_counts_box = st.sidebar.empty()
 
 # ===== DASHBOARD =====
 if page == "Dashboard":
@@ -85,865 +77,829 @@ if page == "Dashboard":
     col1, col2, col3, col4 = st.columns(4)
     
     try:
-        conn = get_connection()
-        if conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM startups")
-            col1.metric("Total Startups", cursor.fetchone()[0])
-            
-            cursor.execute("SELECT COALESCE(SUM(Amount), 0) FROM funding_rounds")
-            result = cursor.fetchone()[0]
-            total_funding = float(result) if result else 0
-            col2.metric("Total Funding", f"₹{total_funding/1e7:.1f}Cr")
-            
-            cursor.execute("SELECT COUNT(*) FROM investors")
-            col3.metric("Total Investors", cursor.fetchone()[0])
-            
-            cursor.execute("SELECT COUNT(*) FROM acquisitions")
-            col4.metric("Acquisitions", cursor.fetchone()[0])
-            
-            cursor.close()
-            conn.close()
+        snapshot = load_dashboard()
     except Exception as e:
-        st.error(f"❌ Error loading metrics: {e}")
-    
-    st.markdown("---")
-    
-    st.subheader("Recent Funding Rounds (Top 10)")
-    query = """
-    SELECT s.Name AS Startup, fr.Date, fr.Amount, fr.Stage
-    FROM funding_rounds fr
-    JOIN startups s ON fr.Startup_ID = s.Startup_ID
-    ORDER BY fr.Date DESC
-    LIMIT 10
-    """
-    df = execute_query(query)
-    if df is not None:
-        st.dataframe(df, use_container_width=True, hide_index=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Industry Distribution")
-        query = """
-        SELECT i.Sector, COUNT(s.Startup_ID) as Count
-        FROM industries i
-        LEFT JOIN startups s ON i.Industry_ID = s.Industry_ID
-        GROUP BY i.Sector
-        ORDER BY Count DESC
-        """
-        df = execute_query(query)
-        if df is not None and len(df) > 0:
-            fig = px.pie(df, values='Count', names='Sector')
-            st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.subheader("Funding by Stage")
-        query = """
-        SELECT Stage, SUM(Amount) as Total
-        FROM funding_rounds
-        GROUP BY Stage
-        ORDER BY Total DESC
-        """
-        df = execute_query(query)
-        if df is not None and len(df) > 0:
-            fig = px.pie(df, values='Total', names='Stage')
-            st.plotly_chart(fig, use_container_width=True)
+        snapshot = None
+        st.error(f"❌ Error loading dashboard: {e}")
+    
+    if snapshot is not None:
+        col1.metric("Total Startups", snapshot.total_startups)
+        col2.metric("Total Funding", f"₹{snapshot.total_funding/1e7:.1f}Cr")
+        col3.metric("Total Investors", snapshot.total_investors)
+        col4.metric("Acquisitions", snapshot.total_acquisitions)
+        for failure in snapshot.failures:
+            st.warning(f"⚠️ Dashboard section skipped: {failure.message()}")
+        
+        st.markdown("---")
+        
+        st.subheader("Recent Funding Rounds (Top 10)")
+        if snapshot.recent_rounds is not None:
+            st.dataframe(snapshot.recent_rounds, use_container_width=True, hide_index=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("Industry Distribution")
+            df = snapshot.industry_distribution
+            if df is not None and len(df) > 0:
+                plotly_chart('pie', df, values='Count', names='Sector')
+        
+        with col2:
+            st.subheader("Funding by Stage")
+            df = snapshot.stage_funding
+            if df is not None and len(df) > 0:
+                plotly_chart('pie', df, values='Total', names='Stage')
 
 # ===== STARTUPS =====
 elif page == "Startups":
     st.markdown("<h1 class='header-style'> Startup Management</h1>", unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4 = st.tabs(["View All", "Add New", "Update", "Delete"])
+    tab1, tab2, tab3, tab4 = lazy_tabs(["View All", "Add New", "Update", "Delete"], key="startups_tabs")
     
     with tab1:
-        st.subheader("All Startups")
-        query = """
-        SELECT s.Startup_ID, s.Name, s.Founded_Year, c.Name AS City, i.Sector
-        FROM startups s
-        LEFT JOIN cities c ON s.City_ID = c.City_ID
-        LEFT JOIN industries i ON s.Industry_ID = i.Industry_ID
-        ORDER BY s.Startup_ID ASC
-        """
-        df = execute_query(query)
-        if df is not None:
-            st.dataframe(df, use_container_width=True, hide_index=True)
+        if tab1.open:
+            st.subheader("All Startups")
+            paginated_table(STARTUPS_TABLE)
     
     with tab2:
-        st.subheader("Add New Startup")
-        with st.form("add_startup"):
-            col1, col2 = st.columns(2)
+        if tab2.open:
+            st.subheader("Add New Startup")
+            with st.form("add_startup"):
+                col1, col2 = st.columns(2)
             
-            with col1:
-                startup_id = st.number_input("Startup ID", min_value=101, step=1)
-                name = st.text_input("Name")
-                founded_year = st.number_input("Founded Year", min_value=1990, max_value=2025, value=2023)
+                with col1:
+                    startup_id = st.number_input("Startup ID", min_value=101, step=1)
+                    name = st.text_input("Name")
+                    founded_year = st.number_input("Founded Year", min_value=1990, max_value=2025, value=2023)
             
-            with col2:
-                cities_query = "SELECT City_ID, Name FROM cities ORDER BY Name"
-                cities_df = execute_query(cities_query)
-                if cities_df is not None:
-                    cities_dict = dict(zip(cities_df['Name'], cities_df['City_ID']))
-                    city = st.selectbox("City", list(cities_dict.keys()))
+                with col2:
+                    cities = load_dimension('cities')
+                    city_id = st.selectbox("City", cities.ids, format_func=cities.label) if cities else None
                 
-                industries_query = "SELECT Industry_ID, Sector FROM industries ORDER BY Sector"
-                industries_df = execute_query(industries_query)
-                if industries_df is not None:
-                    industries_dict = dict(zip(industries_df['Sector'], industries_df['Industry_ID']))
-                    industry = st.selectbox("Industry", list(industries_dict.keys()))
-            
-            if st.form_submit_button("Add Startup", use_container_width=True):
-                if not name:
-                    st.error("Name is required")
-                else:
-                    query = "INSERT INTO startups (Startup_ID, Name, Founded_Year, City_ID, Industry_ID) VALUES (%s, %s, %s, %s, %s)"
-                    if execute_insert_update(query, (startup_id, name, founded_year, cities_dict[city], industries_dict[industry])):
-                        msg = st.success("Added!")
-                        time.sleep(2)
-                        st.rerun()
+                    industries = load_dimension('industries')
+                    industry_id = st.selectbox("Industry", industries.ids, format_func=industries.label) if industries else None
+            
+                if st.form_submit_button("Add Startup", use_container_width=True):
+                    if not name:
+                        st.error("Name is required")
+                    else:
+                        if named_write('startup_insert', (startup_id, name, founded_year, city_id, industry_id)):
+                            msg = st.success("Added!")
+                            time.sleep(2)
+                            st.rerun()
     
     with tab3:
-        st.subheader("Update Startup")
-        startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Startup_ID"
-        startups_df = execute_query(startups_query)
+        if tab3.open:
+            st.subheader("Update Startup")
+            startup_id = entity_picker("Select Startup", "startup", key="update_select")
         
-        if startups_df is not None and len(startups_df) > 0:
-            selected = st.selectbox("Select Startup", startups_df['Name'].tolist(), key="update_select")
-            startup_id = int(startups_df[startups_df['Name'] == selected]['Startup_ID'].values[0])
+            if startup_id is not None:
+                current_df = named_query('startup_by_id', (startup_id,))
             
-            current_query = f"SELECT * FROM startups WHERE Startup_ID = {startup_id}"
-            current_df = execute_query(current_query)
-            
-            if current_df is not None and len(current_df) > 0:
-                current = current_df.iloc[0]
+                if current_df is not None and len(current_df) > 0:
+                    current = current_df.iloc[0]
+                    cities = load_dimension('cities')
+                    industries = load_dimension('industries')
                 
-                with st.form("update_startup_form"):
-                    col1, col2 = st.columns(2)
+                    with st.form("update_startup_form"):
+                        col1, col2 = st.columns(2)
                     
-                    with col1:
-                        new_name = st.text_input("Name", value=str(current['Name']))
-                        new_year = st.number_input("Founded Year", value=int(current['Founded_Year']), min_value=1990, max_value=2025)
+                        with col1:
+                            new_name = st.text_input("Name", value=str(current['Name']))
+                            new_year = st.number_input("Founded Year", value=int(current['Founded_Year']) if pd.notna(current['Founded_Year']) else None, min_value=1990, max_value=2025)
                     
-                    with col2:
-                        # Get current city
-                        cities_query = "SELECT City_ID, Name FROM cities ORDER BY Name"
-                        cities_df = execute_query(cities_query)
-                        if cities_df is not None and len(cities_df) > 0:
-                            cities_dict = dict(zip(cities_df['Name'], cities_df['City_ID']))
-                            current_city_id = int(current['City_ID']) if current['City_ID'] else None
-                            
-                            # Find current city name
-                            city_query = f"SELECT Name FROM cities WHERE City_ID = {current_city_id}" if current_city_id else None
-                            if city_query:
-                                city_result = execute_query(city_query)
-                                current_city_name = city_result.iloc[0]['Name'] if city_result is not None and len(city_result) > 0 else list(cities_dict.keys())[0]
-                            else:
-                                current_city_name = list(cities_dict.keys())[0]
-                            
-                            try:
-                                city_index = list(cities_dict.keys()).index(current_city_name)
-                            except:
-                                city_index = 0
-                            
-                            selected_city = st.selectbox("City", list(cities_dict.keys()), index=city_index, key="update_city")
+                        with col2:
+                            new_city_id = int(current['City_ID']) if pd.notna(current['City_ID']) else None
+                            if cities:
+                                new_city_id = st.selectbox("City", cities.ids, index=cities.index(current['City_ID']), format_func=cities.label, key="update_city")
                         
-                        # Get current industry
-                        industries_query = "SELECT Industry_ID, Sector FROM industries ORDER BY Sector"
-                        industries_df = execute_query(industries_query)
-                        if industries_df is not None and len(industries_df) > 0:
-                            industries_dict = dict(zip(industries_df['Sector'], industries_df['Industry_ID']))
-                            current_industry_id = int(current['Industry_ID']) if current['Industry_ID'] else None
-                            
-                            # Find current industry name
-                            industry_query = f"SELECT Sector FROM industries WHERE Industry_ID = {current_industry_id}" if current_industry_id else None
-                            if industry_query:
-                                industry_result = execute_query(industry_query)
-                                current_industry_name = industry_result.iloc[0]['Sector'] if industry_result is not None and len(industry_result) > 0 else list(industries_dict.keys())[0]
-                            else:
-                                current_industry_name = list(industries_dict.keys())[0]
-                            
-                            try:
-                                industry_index = list(industries_dict.keys()).index(current_industry_name)
-                            except:
-                                industry_index = 0
-                            
-                            selected_industry = st.selectbox("Industry", list(industries_dict.keys()), index=industry_index, key="update_industry")
+                            new_industry_id = int(current['Industry_ID']) if pd.notna(current['Industry_ID']) else None
+                            if industries:
+                                new_industry_id = st.selectbox("Industry", industries.ids, index=industries.index(current['Industry_ID']), format_func=industries.label, key="update_industry")
                     
-                    # SUBMIT BUTTON HERE
-                    if st.form_submit_button("Update Startup", use_container_width=True):
-                        query = "UPDATE startups SET Name = %s, Founded_Year = %s, City_ID = %s, Industry_ID = %s WHERE Startup_ID = %s"
-                        if execute_insert_update(query, (new_name, int(new_year), int(cities_dict[selected_city]), int(industries_dict[selected_industry]), startup_id)):
-                            msg = st.success("Updated!")
-                            time.sleep(2)
-                            st.rerun()
+                        # SUBMIT BUTTON HERE
+                        if st.form_submit_button("Update Startup", use_container_width=True):
+                            if named_write('startup_update', (new_name, int(new_year) if new_year is not None else None, new_city_id, new_industry_id, startup_id)):
+                                msg = st.success("Updated!")
+                                time.sleep(2)
+                                st.rerun()
     
     with tab4:
-        st.subheader("Delete Startup")
-        st.warning("⚠️ This will delete the startup!")
-        startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Startup_ID"
-        startups_df = execute_query(startups_query)
-        
-        if startups_df is not None and len(startups_df) > 0:
-            selected = st.selectbox("Select Startup", startups_df['Name'].tolist(), key="delete")
-            startup_id = int(startups_df[startups_df['Name'] == selected]['Startup_ID'].values[0])  # Convert to int
-            
-            if st.button("🗑️ Delete", use_container_width=True):
-                if execute_insert_update("DELETE FROM startups WHERE Startup_ID = %s", (startup_id,)):
-                    msg = st.success("Deleted!")
-                    time.sleep(2)
-                    st.rerun()
+        if tab4.open:
+            st.subheader("Delete Startup")
+            st.warning("⚠️ This will delete the startup!")
+            startup_id = entity_picker("Select Startup", "startup", key="delete")
+        
+            if startup_id is not None:
+                if st.button("🗑️ Delete", use_container_width=True):
+                    if named_write('startup_delete', (startup_id,)):
+                        msg = st.success("Deleted!")
+                        time.sleep(2)
+                        st.rerun()
 
 # ===== INVESTORS =====
 elif page == "Investors":
     st.markdown("<h1 class='header-style'>Investor Management</h1>", unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4 = st.tabs(["View All", "Add New", "Update", "Delete"])
+    tab1, tab2, tab3, tab4, tab5 = lazy_tabs(["View All", "Add New", "Update", "Delete", "Network"], key="investors_tabs")
     
     with tab1:
-        st.subheader("All Investors")
-        query = """
-        SELECT i.Investor_ID, i.Name, i.Type, c.Name AS Country
-        FROM investors i
-        LEFT JOIN countries c ON i.Country_ID = c.Country_ID
-        ORDER BY i.Investor_ID ASC
-        """
-        df = execute_query(query)
-        if df is not None:
-            st.dataframe(df, use_container_width=True, hide_index=True)
+        if tab1.open:
+            st.subheader("All Investors")
+            paginated_table(INVESTORS_TABLE)
     
     with tab2:
-        st.subheader("Add New Investor")
-        with st.form("add_investor"):
-            col1, col2 = st.columns(2)
+        if tab2.open:
+            st.subheader("Add New Investor")
+            with st.form("add_investor"):
+                col1, col2 = st.columns(2)
             
-            with col1:
-                investor_id = st.number_input("Investor ID", min_value=51, step=1)
-                name = st.text_input("Name")
+                with col1:
+                    investor_id = st.number_input("Investor ID", min_value=51, step=1)
+                    name = st.text_input("Name")
             
-            with col2:
-                investor_type = st.selectbox("Type", ["VC Firm", "Angel", "PE Firm", "Corporate VC", "Bank"])
+                with col2:
+                    investor_type = st.selectbox("Type", ["VC Firm", "Angel", "PE Firm", "Corporate VC", "Bank"])
                 
-                countries_query = "SELECT Country_ID, Name FROM countries ORDER BY Name"
-                countries_df = execute_query(countries_query)
-                if countries_df is not None:
-                    countries_dict = dict(zip(countries_df['Name'], countries_df['Country_ID']))
-                    country = st.selectbox("Country", list(countries_dict.keys()))
-            
-            if st.form_submit_button("Add Investor", use_container_width=True):
-                if not name:
-                    st.error("Name is required")
-                else:
-                    query = "INSERT INTO investors (Investor_ID, Name, Type, Country_ID) VALUES (%s, %s, %s, %s)"
-                    if execute_insert_update(query, (int(investor_id), name, investor_type, int(countries_dict[country]))):
-                        msg = st.success("Added!")
-                        time.sleep(2)
-                        st.rerun()
+                    countries = load_dimension('countries')
+                    country_id = st.selectbox("Country", countries.ids, format_func=countries.label) if countries else None
+            
+                if st.form_submit_button("Add Investor", use_container_width=True):
+                    if not name:
+                        st.error("Name is required")
+                    else:
+                        if named_write('investor_insert', (int(investor_id), name, investor_type, country_id)):
+                            msg = st.success("Added!")
+                            time.sleep(2)
+                            st.rerun()
     
     with tab3:
-        st.subheader("Update Investor")
-        investors_query = "SELECT Investor_ID, Name FROM investors ORDER BY Investor_ID"
-        investors_df = execute_query(investors_query)
+        if tab3.open:
+            st.subheader("Update Investor")
+            investor_id = entity_picker("Select Investor", "investor", key="update_investor")
         
-        if investors_df is not None and len(investors_df) > 0:
-            selected = st.selectbox("Select Investor", investors_df['Name'].tolist(), key="update_investor")
-            investor_id = int(investors_df[investors_df['Name'] == selected]['Investor_ID'].values[0])
-            
-            current_query = f"SELECT * FROM investors WHERE Investor_ID = {investor_id}"
-            current_df = execute_query(current_query)
+            if investor_id is not None:
+                current_df = named_query('investor_by_id', (investor_id,))
             
-            if current_df is not None and len(current_df) > 0:
-                current = current_df.iloc[0]
+                if current_df is not None and len(current_df) > 0:
+                    current = current_df.iloc[0]
+                    countries = load_dimension('countries')
                 
-                with st.form("update_investor_form"):
-                    col1, col2 = st.columns(2)
+                    with st.form("update_investor_form"):
+                        col1, col2 = st.columns(2)
                     
-                    with col1:
-                        new_name = st.text_input("Name", value=str(current['Name']))
-                        type_options = ["VC Firm", "Angel", "PE Firm", "Corporate VC", "Bank"]
-                        current_type = current['Type']
+                        with col1:
+                            new_name = st.text_input("Name", value=str(current['Name']))
+                            type_options = ["VC Firm", "Angel", "PE Firm", "Corporate VC", "Bank"]
+                            current_type = current['Type']
                         
-                        # Find index safely
-                        try:
-                            type_index = type_options.index(current_type)
-                        except ValueError:
-                            type_index = 0
-                        
-                        new_type = st.selectbox("Type", type_options, index=type_index)
-                    
-                    with col2:
-                        countries_query = "SELECT Country_ID, Name FROM countries ORDER BY Name"
-                        countries_df = execute_query(countries_query)
-                        if countries_df is not None:
-                            countries_dict = dict(zip(countries_df['Name'], countries_df['Country_ID']))
-                            current_country_id = int(current['Country_ID']) if current['Country_ID'] else None
-                            
-                            country_query = f"SELECT Name FROM countries WHERE Country_ID = {current_country_id}" if current_country_id else None
-                            if country_query:
-                                country_result = execute_query(country_query)
-                                current_country_name = country_result.iloc[0]['Name'] if country_result is not None and len(country_result) > 0 else list(countries_dict.keys())[0]
-                            else:
-                                current_country_name = list(countries_dict.keys())[0]
-                            
+                            # Find index safely
                             try:
-                                country_index = list(countries_dict.keys()).index(current_country_name)
+                                type_index = type_options.index(current_type)
                             except ValueError:
-                                country_index = 0
-                            
-                            selected_country = st.selectbox("Country", list(countries_dict.keys()), index=country_index, key="update_investor_country")
+                                type_index = 0
+                        
+                            new_type = st.selectbox("Type", type_options, index=type_index)
                     
-                    if st.form_submit_button("Update Investor", use_container_width=True):
-                        query = "UPDATE investors SET Name = %s, Type = %s, Country_ID = %s WHERE Investor_ID = %s"
-                        if execute_insert_update(query, (new_name, new_type, int(countries_dict[selected_country]), investor_id)):
-                            msg = st.success("Updated!")
-                            time.sleep(2)
-                            st.rerun()
+                        with col2:
+                            new_country_id = int(current['Country_ID']) if pd.notna(current['Country_ID']) else None
+                            if countries:
+                                new_country_id = st.selectbox("Country", countries.ids, index=countries.index(current['Country_ID']), format_func=countries.label, key="update_investor_country")
+                    
+                        if st.form_submit_button("Update Investor", use_container_width=True):
+                            if named_write('investor_update', (new_name, new_type, new_country_id, investor_id)):
+                                msg = st.success("Updated!")
+                                time.sleep(2)
+                                st.rerun()
     
     with tab4:
-        st.subheader("Delete Investor")
-        st.warning("This will delete the investor!")
-        investors_query = "SELECT Investor_ID, Name FROM investors ORDER BY Investor_ID"
-        investors_df = execute_query(investors_query)
-        
-        if investors_df is not None and len(investors_df) > 0:
-            selected = st.selectbox("Select Investor", investors_df['Name'].tolist(), key="delete_investor")
-            investor_id = int(investors_df[investors_df['Name'] == selected]['Investor_ID'].values[0])
-            
-            if st.button("🗑️ Delete Investor", use_container_width=True):
-                if execute_insert_update("DELETE FROM investors WHERE Investor_ID = %s", (investor_id,)):
-                    msg = st.success("Deleted!")
-                    time.sleep(2)
-                    st.rerun()
+        if tab4.open:
+            st.subheader("Delete Investor")
+            st.warning("This will delete the investor!")
+            investor_id = entity_picker("Select Investor", "investor", key="delete_investor")
+        
+            if investor_id is not None:
+                if st.button("🗑️ Delete Investor", use_container_width=True):
+                    if named_write('investor_delete', (investor_id,)):
+                        msg = st.success("Deleted!")
+                        time.sleep(2)
+                        st.rerun()
+
+    with tab5:
+        if tab5.open:
+            st.subheader("Co-Investment Network")
+            # Answered from the in-memory network (coinvest.py), not self-joins in MySQL
+            network = load_network()
+            if network is not None:
+                summary = network.summary()
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Investors", f"{summary['investors']:,}")
+                col2.metric("Rounds", f"{summary['rounds']:,}")
+                col3.metric("Co-Investor Links", f"{summary['links']:,}")
+                col4.metric("Avg Syndicate", f"{summary['avg_syndicate']:.2f}")
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("#### Investors per Round")
+                    plotly_chart('bar', network.syndicate_sizes(), x='Syndicate_Size', y='Rounds')
+                with col2:
+                    st.markdown("#### Strongest Pairs")
+                    pairs = with_names(network.top_pairs(10), {'Investor_A': 'Name_A', 'Investor_B': 'Name_B'})
+                    st.dataframe(pairs, use_container_width=True, hide_index=True)
+                    st.markdown("#### Most Connected")
+                    connected = with_names(network.most_connected(10), {'Investor_ID': 'Investor'})
+                    st.dataframe(connected, use_container_width=True, hide_index=True)
+
+                st.markdown("#### Top Co-Investors")
+                investor_id = entity_picker("Select Investor", "investor", key="network_investor")
+                if investor_id is not None:
+                    top = network.top_coinvestors(investor_id, 10)
+                    if len(top) > 0:
+                        st.dataframe(with_names(top, {'Investor_ID': 'Investor'}), use_container_width=True, hide_index=True,
+                                     column_config={'Portfolio_Overlap': st.column_config.NumberColumn(format="percent")})
+                    else:
+                        st.info("No co-investors")
+
+                    other_id = entity_picker("Compare With", "investor", key="network_compare")
+                    if other_id == investor_id:
+                        st.info("Select a different investor to compare")
+                    elif other_id is not None:
+                        overlap = network.overlap(investor_id, other_id)
+                        col1, col2, col3 = st.columns(3)
+                        col1.metric("Shared Rounds", overlap['shared_rounds'])
+                        col2.metric("Shared Startups", overlap['shared_startups'])
+                        col3.metric("Portfolio Overlap", f"{overlap['jaccard']:.1%}")
+                        st.caption(f"{overlap['rounds_a']} vs {overlap['rounds_b']} rounds, "
+                                   f"{overlap['startups_a']} vs {overlap['startups_b']} startups")
 
 # ===== FUNDING ROUNDS =====
 elif page == "Funding Rounds":
     st.markdown("<h1 class='header-style'>Funding Rounds</h1>", unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4 = st.tabs(["View All", "Add New", "Update", "Delete"])
+    tab1, tab2, tab3, tab4 = lazy_tabs(["View All", "Add New", "Update", "Delete"], key="funding_rounds_tabs")
     
     with tab1:
-        st.subheader("All Funding Rounds")
-        query = """
-        SELECT fr.Round_ID, s.Name AS Startup, fr.Date, fr.Amount, fr.Stage
-        FROM funding_rounds fr
-        JOIN startups s ON fr.Startup_ID = s.Startup_ID
-        ORDER BY fr.Round_ID ASC
-        """
-        df = execute_query(query)
-        if df is not None:
-            st.dataframe(df, use_container_width=True, hide_index=True)
+        if tab1.open:
+            st.subheader("All Funding Rounds")
+            paginated_table(FUNDING_TABLE)
     
     with tab2:
-        st.subheader("Add New Funding Round")
-        with st.form("add_funding"):
-            round_id = st.number_input("Round ID", min_value=151, step=1)
-            funding_date = st.date_input("Date")
-            amount = st.number_input("Amount (₹)", min_value=0.0, step=100000.0)
-            stage = st.selectbox("Stage", ["Pre-Seed", "Seed", "Series A", "Series B", "Series C", "Series D", "Series E+", "IPO"])
-            
-            startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Name"
-            startups_df = execute_query(startups_query)
-            if startups_df is not None:
-                startups_dict = dict(zip(startups_df['Name'], startups_df['Startup_ID']))
-                startup = st.selectbox("Startup", list(startups_dict.keys()), key="funding_startup")
-            
-            if st.form_submit_button("Add Funding", use_container_width=True):
-                query = "INSERT INTO funding_rounds (Round_ID, Startup_ID, Date, Amount, Stage) VALUES (%s, %s, %s, %s, %s)"
-                if execute_insert_update(query, (int(round_id), int(startups_dict[startup]), funding_date, float(amount), stage)):
-                    msg = st.success("Added!")
-                    time.sleep(2)
-                    st.rerun()
+        if tab2.open:
+            st.subheader("Add New Funding Round")
+            col1, col2 = st.columns(2)
+            with col1:
+                startup_id = entity_picker("Startup", "startup", key="funding_startup")
+            with col2:
+                investor_ids = entity_multipicker("Investors", "investor", key="funding_investors")
+            with st.form("add_funding"):
+                round_id = st.number_input("Round ID", min_value=151, step=1)
+                funding_date = st.date_input("Date")
+                amount = st.number_input("Amount (₹)", min_value=0.0, step=100000.0)
+                stage = st.selectbox("Stage", FUNDING_STAGES)
+            
+                if st.form_submit_button("Add Funding", use_container_width=True):
+                    if startup_id is None:
+                        st.error("Select a startup")
+                    else:
+                        # Round and investor links go in together, in one transaction
+                        try:
+                            add_funding_round(int(round_id), startup_id, funding_date, float(amount), stage, investor_ids)
+                            added = True
+                        except ValueError as e:
+                            added = False
+                            st.error(f"❌ {e}")
+                        except Exception as e:
+                            added = False
+                            st.error(f"❌ Operation Failed: {e}")
+                        if added:
+                            msg = st.success(f"Added with {len(investor_ids)} investor(s)!")
+                            time.sleep(2)
+                            st.rerun()
     
     with tab3:
-        st.subheader("Update Funding Round")
-        rounds_query = "SELECT Round_ID, Round_ID FROM funding_rounds ORDER BY Round_ID"
-        rounds_df = execute_query(rounds_query)
-        
-        if rounds_df is not None and len(rounds_df) > 0:
-            round_options = [f"Round {r}" for r in rounds_df.iloc[:, 0]]
-            selected = st.selectbox("Select Funding Round", round_options, key="update_round")
-            round_id = int(selected.split()[-1])
+        if tab3.open:
+            st.subheader("Update Funding Round")
+            owner_id = entity_picker("Startup", "startup", key="update_round_owner")
+            rounds_df = named_query('round_ids_for_startup', (owner_id,)) if owner_id is not None else None
+        
+            if rounds_df is not None and len(rounds_df) == 0:
+                st.info("This startup has no funding rounds")
+            elif rounds_df is not None:
+                round_id = int(st.selectbox("Select Funding Round", rounds_df['Round_ID'].tolist(), format_func=lambda r: f"Round {r}", key="update_round"))
+                round_date = rounds_df.loc[rounds_df['Round_ID'] == round_id, 'Date'].iloc[0]
             
-            current_query = f"SELECT * FROM funding_rounds WHERE Round_ID = {round_id}"
-            current_df = execute_query(current_query)
+                current_df = named_query('round_by_id', (round_id, round_date))
             
-            if current_df is not None and len(current_df) > 0:
-                current = current_df.iloc[0]
+                if current_df is not None and len(current_df) > 0:
+                    current = current_df.iloc[0]
+                    new_startup_id = entity_picker("Startup", "startup", key="update_funding_startup", default_id=current['Startup_ID'], default_label=current['Startup_Name'])
                 
-                with st.form("update_funding_form"):
-                    col1, col2 = st.columns(2)
+                    with st.form("update_funding_form"):
+                        col1, col2 = st.columns(2)
                     
-                    with col1:
-                        new_date = st.date_input("Date", value=current['Date'])
-                        new_amount = st.number_input("Amount (₹)", value=float(current['Amount']), min_value=0.0, step=100000.0)
+                        with col1:
+                            new_date = st.date_input("Date", value=current['Date'])
+                            new_amount = st.number_input("Amount (₹)", value=float(current['Amount']), min_value=0.0, step=100000.0)
                     
-                    with col2:
-                        stage_options = ["Pre-Seed", "Seed", "Series A", "Series B", "Series C", "Series D", "Series E+", "IPO"]
-                        try:
-                            stage_index = stage_options.index(current['Stage'])
-                        except ValueError:
-                            stage_index = 0
-                        new_stage = st.selectbox("Stage", stage_options, index=stage_index)
-                        
-                        startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Name"
-                        startups_df = execute_query(startups_query)
-                        if startups_df is not None:
-                            startups_dict = dict(zip(startups_df['Name'], startups_df['Startup_ID']))
-                            startup_query = f"SELECT Name FROM startups WHERE Startup_ID = {int(current['Startup_ID'])}"
-                            startup_result = execute_query(startup_query)
-                            current_startup_name = startup_result.iloc[0]['Name'] if startup_result is not None and len(startup_result) > 0 else list(startups_dict.keys())[0]
-                            selected_startup = st.selectbox("Startup", list(startups_dict.keys()), index=list(startups_dict.keys()).index(current_startup_name) if current_startup_name in startups_dict else 0, key="update_funding_startup")
+                        with col2:
+                            stage_options = FUNDING_STAGES
+                            try:
+                                stage_index = stage_options.index(current['Stage'])
+                            except ValueError:
+                                stage_index = 0
+                            new_stage = st.selectbox("Stage", stage_options, index=stage_index)
                     
-                    if st.form_submit_button("Update Funding", use_container_width=True):
-                        query = "UPDATE funding_rounds SET Date = %s, Amount = %s, Stage = %s, Startup_ID = %s WHERE Round_ID = %s"
-                        if execute_insert_update(query, (new_date, float(new_amount), new_stage, int(startups_dict[selected_startup]), round_id)):
-                            msg = st.success("Updated!")
-                            time.sleep(2)
-                            st.rerun()
+                        if st.form_submit_button("Update Funding", use_container_width=True):
+                            if named_write('round_update', (new_date, float(new_amount), new_stage, int(new_startup_id or current['Startup_ID']), round_id, current['Date'])):
+                                msg = st.success("Updated!")
+                                time.sleep(2)
+                                st.rerun()
     
     with tab4:
-        st.subheader("Delete Funding Round")
-        st.warning("⚠️ This will delete the funding round!")
-        rounds_query = "SELECT Round_ID FROM funding_rounds ORDER BY Round_ID"
-        rounds_df = execute_query(rounds_query)
-        
-        if rounds_df is not None and len(rounds_df) > 0:
-            round_options = [f"Round {r}" for r in rounds_df.iloc[:, 0]]
-            selected = st.selectbox("Select Funding Round", round_options, key="delete_round")
-            round_id = int(selected.split()[-1])
-            
-            if st.button("🗑️ Delete Funding Round", use_container_width=True):
-                if execute_insert_update("DELETE FROM funding_rounds WHERE Round_ID = %s", (round_id,)):
-                    msg = st.success("Deleted!")
-                    time.sleep(2)
-                    st.rerun()
+        if tab4.open:
+            st.subheader("Delete Funding Round")
+            st.warning("⚠️ This will delete the funding round!")
+            owner_id = entity_picker("Startup", "startup", key="delete_round_owner")
+            rounds_df = named_query('round_ids_for_startup', (owner_id,)) if owner_id is not None else None
+        
+            if rounds_df is not None and len(rounds_df) == 0:
+                st.info("This startup has no funding rounds")
+            elif rounds_df is not None:
+                round_id = int(st.selectbox("Select Funding Round", rounds_df['Round_ID'].tolist(), format_func=lambda r: f"Round {r}", key="delete_round"))
+                round_date = rounds_df.loc[rounds_df['Round_ID'] == round_id, 'Date'].iloc[0]
+            
+                if st.button("🗑️ Delete Funding Round", use_container_width=True):
+                    if named_write('round_delete', (round_id, round_date)):
+                        msg = st.success("Deleted!")
+                        time.sleep(2)
+                        st.rerun()
 
 # ===== FOUNDERS =====
 elif page == "Founders":
     st.markdown("<h1 class='header-style'>Founders</h1>", unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4 = st.tabs(["View All", "Add New", "Update", "Delete"])
+    tab1, tab2, tab3, tab4 = lazy_tabs(["View All", "Add New", "Update", "Delete"], key="founders_tabs")
     
     with tab1:
-        st.subheader("All Founders")
-        query = """
-        SELECT f.Founder_ID, f.Name, s.Name AS Startup, f.Role, f.LinkedIn_URL
-        FROM founders f
-        LEFT JOIN startups s ON f.Startup_ID = s.Startup_ID
-        ORDER BY f.Founder_ID ASC
-        """
-        df = execute_query(query)
-        if df is not None:
-            st.dataframe(df, use_container_width=True, hide_index=True)
+        if tab1.open:
+            st.subheader("All Founders")
+            paginated_table(FOUNDERS_TABLE)
     
     with tab2:
-        st.subheader("Add New Founder")
-        with st.form("add_founder"):
-            founder_id = st.number_input("Founder ID", min_value=179, step=1)
-            name = st.text_input("Name")
-            role = st.text_input("Role")
-            linkedin_url = st.text_input("LinkedIn URL")
-            
-            startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Name"
-            startups_df = execute_query(startups_query)
-            if startups_df is not None:
-                startups_dict = dict(zip(startups_df['Name'], startups_df['Startup_ID']))
-                startup = st.selectbox("Startup", list(startups_dict.keys()), key="founder_startup_add")
-            
-            if st.form_submit_button("Add Founder", use_container_width=True):
-                query = "INSERT INTO founders (Founder_ID, Name, Startup_ID, Role, LinkedIn_URL) VALUES (%s, %s, %s, %s, %s)"
-                if execute_insert_update(query, (int(founder_id), name, int(startups_dict[startup]), role, linkedin_url)):
-                    msg = st.success("Added!")
-                    time.sleep(2)
-                    st.rerun()
+        if tab2.open:
+            st.subheader("Add New Founder")
+            startup_id = entity_picker("Startup", "startup", key="founder_startup_add")
+            with st.form("add_founder"):
+                founder_id = st.number_input("Founder ID", min_value=179, step=1)
+                name = st.text_input("Name")
+                role = st.text_input("Role")
+                linkedin_url = st.text_input("LinkedIn URL")
+            
+                if st.form_submit_button("Add Founder", use_container_width=True):
+                    if startup_id is None:
+                        st.error("Select a startup")
+                    else:
+                        if named_write('founder_insert', (int(founder_id), name, startup_id, role, linkedin_url)):
+                            msg = st.success("Added!")
+                            time.sleep(2)
+                            st.rerun()
     
     with tab3:
-        st.subheader("Update Founder")
-        founders_query = "SELECT Founder_ID, Name FROM founders ORDER BY Founder_ID"
-        founders_df = execute_query(founders_query)
+        if tab3.open:
+            st.subheader("Update Founder")
+            founder_id = entity_picker("Select Founder", "founder", key="update_founder")
         
-        if founders_df is not None and len(founders_df) > 0:
-            selected = st.selectbox("Select Founder", founders_df['Name'].tolist(), key="update_founder")
-            founder_id = int(founders_df[founders_df['Name'] == selected]['Founder_ID'].values[0])
-            
-            current_query = f"SELECT * FROM founders WHERE Founder_ID = {founder_id}"
-            current_df = execute_query(current_query)
+            if founder_id is not None:
+                current_df = named_query('founder_by_id', (founder_id,))
             
-            if current_df is not None and len(current_df) > 0:
-                current = current_df.iloc[0]
-                linkedin_val = current['LinkedIn_URL'] if 'LinkedIn_URL' in current and current['LinkedIn_URL'] is not None else ""
+                if current_df is not None and len(current_df) > 0:
+                    current = current_df.iloc[0]
+                    linkedin_val = current['LinkedIn_URL'] if 'LinkedIn_URL' in current and current['LinkedIn_URL'] is not None else ""
                 
-                with st.form("update_founder_form"):
-                    new_name = st.text_input("Name", value=str(current['Name']))
-                    new_role = st.text_input("Role", value=str(current['Role']))
-                    new_linkedin = st.text_input("LinkedIn URL", value=str(linkedin_val))
-                    
-                    startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Name"
-                    startups_df = execute_query(startups_query)
-                    if startups_df is not None:
-                        startups_dict = dict(zip(startups_df['Name'], startups_df['Startup_ID']))
-                        startup_query = f"SELECT Name FROM startups WHERE Startup_ID = {int(current['Startup_ID'])}"
-                        startup_result = execute_query(startup_query)
-                        current_startup_name = startup_result.iloc[0]['Name'] if startup_result is not None and len(startup_result) > 0 else list(startups_dict.keys())[0]
-                        selected_startup = st.selectbox("Startup", list(startups_dict.keys()), index=list(startups_dict.keys()).index(current_startup_name) if current_startup_name in startups_dict else 0, key="update_founder_startup")
+                    new_startup_id = entity_picker("Startup", "startup", key="update_founder_startup", default_id=current['Startup_ID'], default_label=current['Startup_Name'])
+                
+                    with st.form("update_founder_form"):
+                        new_name = st.text_input("Name", value=str(current['Name']))
+                        new_role = st.text_input("Role", value=str(current['Role']))
+                        new_linkedin = st.text_input("LinkedIn URL", value=str(linkedin_val))
                     
-                    if st.form_submit_button("Update Founder", use_container_width=True):
-                        query = "UPDATE founders SET Name = %s, Role = %s, LinkedIn_URL = %s, Startup_ID = %s WHERE Founder_ID = %s"
-                        if execute_insert_update(query, (new_name, new_role, new_linkedin, int(startups_dict[selected_startup]), founder_id)):
-                            msg = st.success("Updated!")
-                            time.sleep(2)
-                            st.rerun()
+                        if st.form_submit_button("Update Founder", use_container_width=True):
+                            if named_write('founder_update', (new_name, new_role, new_linkedin, int(new_startup_id or current['Startup_ID']), founder_id)):
+                                msg = st.success("Updated!")
+                                time.sleep(2)
+                                st.rerun()
     
     with tab4:
-        st.subheader("Delete Founder")
-        st.warning("This will delete the founder!")
-        founders_query = "SELECT Founder_ID, Name FROM founders ORDER BY Founder_ID"
-        founders_df = execute_query(founders_query)
-        
-        if founders_df is not None and len(founders_df) > 0:
-            selected = st.selectbox("Select Founder", founders_df['Name'].tolist(), key="delete_founder")
-            founder_id = int(founders_df[founders_df['Name'] == selected]['Founder_ID'].values[0])
-            
-            if st.button("Delete Founder", use_container_width=True):
-                if execute_insert_update("DELETE FROM founders WHERE Founder_ID = %s", (founder_id,)):
-                    msg = st.success("Deleted!")
-                    time.sleep(2)
-                    st.rerun()
+        if tab4.open:
+            st.subheader("Delete Founder")
+            st.warning("This will delete the founder!")
+            founder_id = entity_picker("Select Founder", "founder", key="delete_founder")
+        
+            if founder_id is not None:
+                if st.button("Delete Founder", use_container_width=True):
+                    if named_write('founder_delete', (founder_id,)):
+                        msg = st.success("Deleted!")
+                        time.sleep(2)
+                        st.rerun()
 
 # ===== ANALYTICS =====
 elif page == "Analytics":
     st.markdown("<h1 class='header-style'>Analytics & Insights</h1>", unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Industry", "Top Startups", "Funding", "Cities", "Advanced Queries"])
+    tab1, tab2, tab3, tab4, tab5, tab6 = lazy_tabs(["Industry", "Top Startups", "Funding", "Cities", "Advanced Queries", "Trends"],
+                                                   key="analytics_tabs")
     
     with tab1:
-        st.subheader("Funding by Industry")
-        query = """
-        SELECT i.Sector, COUNT(DISTINCT s.Startup_ID) AS Startups, 
-               COALESCE(SUM(fr.Amount), 0) AS Total_Funding
-        FROM industries i
-        LEFT JOIN startups s ON i.Industry_ID = s.Industry_ID
-        LEFT JOIN funding_rounds fr ON s.Startup_ID = fr.Startup_ID
-        GROUP BY i.Sector
-        ORDER BY Total_Funding DESC
-        """
-        df = execute_query(query)
-        if df is not None and len(df) > 0:
-            fig = px.bar(df, x='Sector', y='Total_Funding', title='Funding by Industry')
-            st.plotly_chart(fig, use_container_width=True)
+        if tab1.open:
+            st.subheader("Funding by Industry")
+            facts = load_facts()
+            df = facts.industry_funding() if facts else session_query(STATEMENTS['industry_funding'], prepared=True)
+            if df is not None and len(df) > 0:
+                plotly_chart('bar', df, x='Sector', y='Total_Funding', title='Funding by Industry')
     
     with tab2:
-        st.subheader("Top 10 Funded Startups")
-        query = """
-        SELECT s.Name, SUM(fr.Amount) AS Total_Funding, COUNT(fr.Round_ID) AS Rounds
-        FROM startups s
-        LEFT JOIN funding_rounds fr ON s.Startup_ID = fr.Startup_ID
-        GROUP BY s.Name
-        ORDER BY Total_Funding DESC
-        LIMIT 10
-        """
-        df = execute_query(query)
-        if df is not None and len(df) > 0:
-            fig = px.bar(df, x='Name', y='Total_Funding', title='Top 10 Funded Startups')
-            st.plotly_chart(fig, use_container_width=True)
+        if tab2.open:
+            st.subheader("Top 10 Funded Startups")
+            facts = load_facts()
+            df = facts.top_startups(10) if facts else session_query(STATEMENTS['top_startups'], prepared=True)
+            if df is not None and len(df) > 0:
+                plotly_chart('bar', df, x='Name', y='Total_Funding', title='Top 10 Funded Startups')
     
     with tab3:
-        st.subheader("Funding Distribution by Stage")
-        query = """
-        SELECT Stage, COUNT(*) AS Count, SUM(Amount) AS Total
-        FROM funding_rounds
-        GROUP BY Stage
-        ORDER BY Total DESC
-        """
-        df = execute_query(query)
-        if df is not None and len(df) > 0:
-            fig = px.pie(df, values='Total', names='Stage', title='Funding by Stage')
-            st.plotly_chart(fig, use_container_width=True)
+        if tab3.open:
+            st.subheader("Funding Distribution by Stage")
+            facts = load_facts()
+            df = facts.stage_distribution() if facts else session_query(STATEMENTS['stage_distribution'], prepared=True)
+            if df is not None and len(df) > 0:
+                plotly_chart('pie', df, values='Total', names='Stage', title='Funding by Stage')
     
     with tab4:
-        st.subheader("Startups by City")
-        query = """
-        SELECT c.Name AS City, COUNT(s.Startup_ID) AS Startups
-        FROM cities c
-        LEFT JOIN startups s ON c.City_ID = s.City_ID
-        GROUP BY c.Name
-        ORDER BY Startups DESC
-        """
-        df = execute_query(query)
-        if df is not None and len(df) > 0:
-            fig = px.bar(df, x='City', y='Startups', title='Startups by City')
-            st.plotly_chart(fig, use_container_width=True)
+        if tab4.open:
+            st.subheader("Startups by City")
+            facts = load_facts()
+            df = facts.city_startups() if facts else session_query(STATEMENTS['city_startups'], prepared=True)
+            if df is not None and len(df) > 0:
+                plotly_chart('bar', df, x='City', y='Startups', title='Startups by City')
 
     with tab5:
-        st.subheader("Advanced SQL Queries")
-        
-        # ===== 1. NESTED QUERY (ALREADY EXISTS - KEEP THIS) =====
-        st.markdown("### Nested Query: Startups with Above-Average Funding")
-        if st.button("Execute Nested Query", key="nested_query"):
-            query = """
-            SELECT s.Name AS Startup_Name, 
-                   s.Founded_Year, 
-                   c.Name AS City,
-                   (SELECT SUM(Amount) FROM funding_rounds WHERE Startup_ID = s.Startup_ID) AS Total_Funding
-            FROM startups s
-            JOIN cities c ON s.City_ID = c.City_ID
-            WHERE s.Startup_ID IN (
-                SELECT Startup_ID 
-                FROM funding_rounds 
-                WHERE Amount > (SELECT AVG(Amount) FROM funding_rounds)
-            )
-            ORDER BY Total_Funding DESC
-            """
-            df = execute_query(query)
-            if df is not None and len(df) > 0:
-                st.dataframe(df, use_container_width=True, hide_index=True)
-                avg_query = "SELECT AVG(Amount) AS Avg_Funding FROM funding_rounds"
-                avg_df = execute_query(avg_query)
-                if avg_df is not None:
-                    st.info(f"Average Funding: ₹{avg_df.iloc[0]['Avg_Funding']:,.2f}")
-            else:
-                st.warning("No data found")
+        if tab5.open:
+            st.subheader("Advanced SQL Queries")
         
-        st.markdown("---")  # ADD THIS LINE
+            # ===== 1. NESTED QUERY (ALREADY EXISTS - KEEP THIS) =====
+            st.markdown("### Nested Query: Startups with Above-Average Funding")
+            if st.button("Execute Nested Query", key="nested_query"):
+                # Totals, milestone counts and the average all come back in this one result
+                df = named_query('nested')
+                if df is not None and len(df) > 0:
+                    st.dataframe(df.drop(columns=['Avg_Funding']), use_container_width=True, hide_index=True)
+                    st.info(f"Average Funding: ₹{df.iloc[0]['Avg_Funding']:,.2f}")
+                elif df is not None:
+                    st.warning("No data found")
+            export_panel("nested_query", STATEMENTS['nested'])
         
-        # ===== 2. JOIN QUERY (ADD THIS) =====
-        st.markdown("### Join Query: Complete Startup Ecosystem View")
+            st.markdown("---")  # ADD THIS LINE
         
-        col1, col2 = st.columns(2)
+            # ===== 2. JOIN QUERY (ADD THIS) =====
+            st.markdown("### Join Query: Complete Startup Ecosystem View")
         
-        industries_df = execute_query("SELECT DISTINCT Sector FROM industries ORDER BY Sector")
-        industry_list = ["All"] + list(industries_df['Sector']) if industries_df is not None else ["All"]
+            col1, col2 = st.columns(2)
         
-        with col1:
-            industry_filter = st.selectbox("Filter by Industry", industry_list, key="join_industry")
-        with col2:
-            stage_filter = st.selectbox("Filter by Stage", 
-                                       ["All", "Pre-Seed", "Seed", "Series A", "Series B", "Series C", "Series D", "IPO"],
-                                       key="join_stage")
-        
-        if st.button("Execute Join Query", key="join_query"):
-            query = """
-            SELECT 
-                s.Name AS Startup_Name,
-                i.Sector AS Industry,
-                c.Name AS City,
-                fr.Stage AS Funding_Stage,
-                fr.Amount AS Funding_Amount,
-                fr.Date AS Funding_Date
-            FROM startups s
-            LEFT JOIN industries i ON s.Industry_ID = i.Industry_ID
-            LEFT JOIN cities c ON s.City_ID = c.City_ID
-            LEFT JOIN funding_rounds fr ON s.Startup_ID = fr.Startup_ID
-            WHERE 1=1
-            """
-            
-            if industry_filter != "All":
-                query += f" AND i.Sector = '{industry_filter}'"
-            if stage_filter != "All":
-                query += f" AND fr.Stage = '{stage_filter}'"
-            
-            query += " ORDER BY fr.Date DESC LIMIT 50"
-            
-            df = execute_query(query)
-            if df is not None and len(df) > 0:
-                st.dataframe(df, use_container_width=True, hide_index=True)
-                st.success(f"Found {len(df)} records")
-            else:
-                st.warning("No data found with selected filters")
+            industries_df = named_query('sectors', ttl=LOOKUP_TTL)
+            industry_list = ["All"] + list(industries_df['Sector']) if industries_df is not None else ["All"]
         
-        st.markdown("---")  # ADD THIS LINE
+            with col1:
+                industry_filter = st.selectbox("Filter by Industry", industry_list, key="join_industry")
+            with col2:
+                stage_filter = st.selectbox("Filter by Stage", 
+                                           ["All"] + FUNDING_STAGES,
+                                           key="join_stage")
         
-        # ===== 3. AGGREGATE QUERY (ADD THIS) =====
-        st.markdown("### Aggregate Query: Industry Statistics Dashboard")
+            name, params = join_statement(
+                sector=industry_filter if industry_filter != "All" else None,
+                stage=stage_filter if stage_filter != "All" else None
+            )
+            if st.button("Execute Join Query", key="join_query"):
+                df = named_query(name, params)
+                if df is not None and len(df) > 0:
+                    st.dataframe(df, use_container_width=True, hide_index=True)
+                    st.success(f"Found {len(df)} records")
+                else:
+                    st.warning("No data found with selected filters")
+            export_panel("join_query", STATEMENTS[name], params)
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            group_by = st.selectbox("Group By", ["Industry", "City", "Funding Stage"], key="agg_group")
-        with col2:
-            metric = st.selectbox("Metric", ["Total Funding", "Avg Funding", "Count"], key="agg_metric")
-        with col3:
-            top_n = st.slider("Show Top", 5, 20, 10, key="agg_top")
-        
-        if st.button("Execute Aggregate Query", key="agg_query"):
-            if group_by == "Industry":
-                query = f"""
-                SELECT 
-                    i.Sector AS Category,
-                    COUNT(DISTINCT s.Startup_ID) AS Total_Startups,
-                    COUNT(DISTINCT fr.Round_ID) AS Total_Rounds,
-                    COALESCE(SUM(fr.Amount), 0) AS Total_Funding,
-                    COALESCE(AVG(fr.Amount), 0) AS Avg_Funding,
-                    COALESCE(MIN(fr.Amount), 0) AS Min_Funding,
-                    COALESCE(MAX(fr.Amount), 0) AS Max_Funding
-                FROM industries i
-                LEFT JOIN startups s ON i.Industry_ID = s.Industry_ID
-                LEFT JOIN funding_rounds fr ON s.Startup_ID = fr.Startup_ID
-                GROUP BY i.Sector
-                ORDER BY Total_Funding DESC
-                LIMIT {top_n}
-                """
-            elif group_by == "City":
-                query = f"""
-                SELECT 
-                    c.Name AS Category,
-                    COUNT(DISTINCT s.Startup_ID) AS Total_Startups,
-                    COUNT(DISTINCT fr.Round_ID) AS Total_Rounds,
-                    COALESCE(SUM(fr.Amount), 0) AS Total_Funding,
-                    COALESCE(AVG(fr.Amount), 0) AS Avg_Funding
-                FROM cities c
-                LEFT JOIN startups s ON c.City_ID = s.City_ID
-                LEFT JOIN funding_rounds fr ON s.Startup_ID = fr.Startup_ID
-                GROUP BY c.Name
-                ORDER BY Total_Funding DESC
-                LIMIT {top_n}
-                """
-            else:  # Funding Stage
-                query = f"""
-                SELECT 
-                    Stage AS Category,
-                    COUNT(*) AS Total_Rounds,
-                    COALESCE(SUM(Amount), 0) AS Total_Funding,
-                    COALESCE(AVG(Amount), 0) AS Avg_Funding,
-                    COALESCE(MIN(Amount), 0) AS Min_Funding,
-                    COALESCE(MAX(Amount), 0) AS Max_Funding
-                FROM funding_rounds
-                GROUP BY Stage
-                ORDER BY Total_Funding DESC
-                LIMIT {top_n}
-                """
-            
-            df = execute_query(query)
-            if df is not None and len(df) > 0:
-                st.dataframe(df, use_container_width=True, hide_index=True)
+            st.markdown("---")  # ADD THIS LINE
+        
+            # ===== 3. AGGREGATE QUERY (ADD THIS) =====
+            st.markdown("### Aggregate Query: Industry Statistics Dashboard")
+        
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                group_by = st.selectbox("Group By", ["Industry", "City", "Funding Stage"], key="agg_group")
+            with col2:
+                metric = st.selectbox("Metric", ["Total Funding", "Avg Funding", "Count"], key="agg_metric")
+            with col3:
+                top_n = st.slider("Show Top", 5, 20, 10, key="agg_top")
+        
+            if st.button("Execute Aggregate Query", key="agg_query"):
+                facts = load_facts()
+                if facts:
+                    df = facts.aggregate(group_by, metric, top_n)
+                else:
+                    df = named_query(aggregate_statement(group_by, metric), (int(top_n),))
+                if df is not None and len(df) > 0:
+                    st.dataframe(df, use_container_width=True, hide_index=True)
+                
+                    # Visualization
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        plotly_chart('bar', df, x='Category', y='Total_Funding',
+                                     title=f'Total Funding by {group_by}')
                 
-                # Visualization
+                    with col2:
+                        plotly_chart('pie', df, values='Total_Funding', names='Category',
+                                     title=f'Funding Distribution by {group_by}')
+                else:
+                    st.warning("No data found")
+            export_panel("aggregate_query", STATEMENTS[aggregate_statement(group_by, metric)], (int(top_n),))
+
+    with tab6:
+        if tab6.open:
+            st.subheader("Funding Trends")
+            rollup = load_trends()
+            if rollup is not None and len(rollup) > 0:
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    interval = st.selectbox("Interval", list(FREQUENCIES), index=1, key="trend_interval")
+                with col2:
+                    breakdown = st.selectbox("Break Down By", list(BREAKDOWNS), key="trend_breakdown")
+                with col3:
+                    metric_name = st.selectbox("Metric", list(METRICS), key="trend_metric")
+
                 col1, col2 = st.columns(2)
                 with col1:
-                    fig = px.bar(df, x='Category', y='Total_Funding', 
-                                title=f'Total Funding by {group_by}')
-                    st.plotly_chart(fig, use_container_width=True)
-                
+                    sector = st.selectbox("Filter by Industry", ["All"] + sorted(rollup['Sector'].cat.categories),
+                                          key="trend_industry")
                 with col2:
-                    fig = px.pie(df, values='Total_Funding', names='Category',
-                                title=f'Funding Distribution by {group_by}')
-                    st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.warning("No data found")
+                    city = st.selectbox("Filter by City", ["All"] + sorted(rollup['City'].cat.categories), key="trend_city")
+
+                rows = filter_trends(rollup, sector if sector != "All" else None, city if city != "All" else None)
+                if len(rows) > 0:
+                    months, by, metric = FREQUENCIES[interval], BREAKDOWNS[breakdown], METRICS[metric_name]
+                    df = long_form(trend(rows, months, by, metric), group=breakdown, value=metric_name)
+                    if by is None:
+                        plotly_chart('line', df, x='Period', y=metric_name, markers=True,
+                                     title=f'{metric_name} per {interval[:-2].lower()}')
+                    else:
+                        plotly_chart('bar', df, x='Period', y=metric_name, color=breakdown,
+                                     title=f'{metric_name} by {breakdown}')
+
+                    st.markdown("### Stage Mix")
+                    mix = long_form(stage_mix(rows, months, metric), group='Stage', value='Share')
+                    plotly_chart('area', mix, x='Period', y='Share', color='Stage', title=f'Share of {metric_name} by Stage')
+                else:
+                    st.warning("No rounds for the selected filters")
+            elif rollup is not None:
+                st.warning("No dated funding rounds yet")
 
 # ===== ACQUISITIONS =====
 elif page == "Acquisitions":
     st.markdown("<h1 class='header-style'>Acquisitions</h1>", unsafe_allow_html=True)
     
-    tab1, tab2, tab3, tab4 = st.tabs(["View All", "Add New", "Update", "Delete"])
+    tab1, tab2, tab3, tab4, tab5 = lazy_tabs(["View All", "Add New", "Update", "Delete", "Lineage"], key="acquisitions_tabs")
     
     with tab1:
-        st.subheader("All Acquisitions")
-        query = """
-        SELECT s1.Name AS Acquirer, s2.Name AS Target, a.Date, a.Amount
-        FROM acquisitions a
-        JOIN startups s1 ON a.Acquirer_Startup_ID = s1.Startup_ID
-        JOIN startups s2 ON a.Target_Startup_ID = s2.Startup_ID
-        ORDER BY a.Date DESC
-        """
-        df = execute_query(query)
-        if df is not None:
-            st.dataframe(df, use_container_width=True, hide_index=True)
+        if tab1.open:
+            st.subheader("All Acquisitions")
+            paginated_table(ACQUISITIONS_TABLE)
     
     with tab2:
-        st.subheader("Add New Acquisition")
-        with st.form("add_acquisition"):
-            acq_id = st.number_input("Acquisition ID", min_value=1, step=1)
-            acq_date = st.date_input("Date")
-            amount = st.number_input("Amount (₹)", min_value=0.0, step=100000.0)
-            
-            startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Name"
-            startups_df = execute_query(startups_query)
-            
-            if startups_df is not None:
-                startups_dict = dict(zip(startups_df['Name'], startups_df['Startup_ID']))
-                acquirer = st.selectbox("Acquirer", list(startups_dict.keys()), key="acq_acquirer_add")
-                target = st.selectbox("Target", list(startups_dict.keys()), key="acq_target_add")
-            
-            if st.form_submit_button("Add Acquisition", use_container_width=True):
-                if acquirer == target:
-                    st.error("Cannot acquire itself!")
-                else:
-                    query = "INSERT INTO acquisitions (AcquisitionID, Acquirer_Startup_ID, Target_Startup_ID, Date, Amount) VALUES (%s, %s, %s, %s, %s)"
-                    if execute_insert_update(query, (int(acq_id), int(startups_dict[acquirer]), int(startups_dict[target]), acq_date, float(amount))):
-                        msg = st.success("Added!")
-                        time.sleep(2)
-                        st.rerun()
+        if tab2.open:
+            st.subheader("Add New Acquisition")
+            col1, col2 = st.columns(2)
+            with col1:
+                acquirer_id = entity_picker("Acquirer", "startup", key="acq_acquirer_add")
+            with col2:
+                target_id = entity_picker("Target", "startup", key="acq_target_add")
+        
+            with st.form("add_acquisition"):
+                acq_id = st.number_input("Acquisition ID", min_value=1, step=1)
+                acq_date = st.date_input("Date")
+                amount = st.number_input("Amount (₹)", min_value=0.0, step=100000.0)
+            
+                if st.form_submit_button("Add Acquisition", use_container_width=True):
+                    if acquirer_id is None or target_id is None:
+                        st.error("Select both startups")
+                    elif acquirer_id == target_id:
+                        st.error("Cannot acquire itself!")
+                    else:
+                        if named_write('acquisition_insert', (int(acq_id), acquirer_id, target_id, acq_date, float(amount))):
+                            msg = st.success("Added!")
+                            time.sleep(2)
+                            st.rerun()
 
     
     with tab3:
-        st.subheader("Update Acquisition")
-        st.info("View all acquisitions in 'View All' tab, then use their Acquirer name to update")
+        if tab3.open:
+            st.subheader("Update Acquisition")
+            owner_id = entity_picker("Acquirer", "startup", key="update_acq_owner")
+        
+            acqs_df = named_query('acquisitions_by_acquirer', (owner_id,)) if owner_id is not None else None
         
-        startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Name"
-        startups_df = execute_query(startups_query)
-        if startups_df is not None:
-            startups_dict = dict(zip(startups_df['Name'], startups_df['Startup_ID']))
+            if acqs_df is not None and len(acqs_df) == 0:
+                st.info("This startup has made no acquisitions")
+            elif acqs_df is not None:
+                acq_labels = {row['AcquisitionID']: f"{row['Target']} ({row['Date']})" for _, row in acqs_df.iterrows()}
+                acquisition_id = st.selectbox("Select Acquisition", list(acq_labels), format_func=acq_labels.get, key="update_acq_select")
+                current = acqs_df[acqs_df['AcquisitionID'] == acquisition_id].iloc[0]
             
-            acqs_query = """
-            SELECT s1.Name AS Acquirer, s2.Name AS Target, a.Date, a.Amount
-            FROM acquisitions a
-            JOIN startups s1 ON a.Acquirer_Startup_ID = s1.Startup_ID
-            JOIN startups s2 ON a.Target_Startup_ID = s2.Startup_ID
-            ORDER BY a.Date DESC
-            """
-            acqs_df = execute_query(acqs_query)
+                col1, col2 = st.columns(2)
+                with col1:
+                    selected_acquirer = entity_picker("Acquirer", "startup", key="update_acq_acquirer", default_id=current['Acquirer_Startup_ID'], default_label=current['Acquirer'])
+                with col2:
+                    selected_target = entity_picker("Target", "startup", key="update_acq_target", default_id=current['Target_Startup_ID'], default_label=current['Target'])
             
-            if acqs_df is not None and len(acqs_df) > 0:
-                acq_options = [f"{row['Acquirer']} → {row['Target']}" for _, row in acqs_df.iterrows()]
-                selected_acq = st.selectbox("Select Acquisition", acq_options, key="update_acq_select")
+                with st.form("update_acquisition_form"):
+                    new_date = st.date_input("Date", value=current['Date'])
+                    new_amount = st.number_input("Amount (₹)", value=float(current['Amount']), min_value=0.0, step=100000.0)
                 
-                if selected_acq:
-                    sel_idx = acq_options.index(selected_acq)
-                    current = acqs_df.iloc[sel_idx]
-                    
-                    with st.form("update_acquisition_form"):
-                        new_date = st.date_input("Date", value=current['Date'])
-                        new_amount = st.number_input("Amount (₹)", value=float(current['Amount']), min_value=0.0, step=100000.0)
-                        
-                        selected_acquirer = st.selectbox("Acquirer", list(startups_dict.keys()), index=list(startups_dict.keys()).index(current['Acquirer']) if current['Acquirer'] in startups_dict else 0, key="update_acq_acquirer")
-                        selected_target = st.selectbox("Target", list(startups_dict.keys()), index=list(startups_dict.keys()).index(current['Target']) if current['Target'] in startups_dict else 0, key="update_acq_target")
-                        
-                        if st.form_submit_button("Update Acquisition", use_container_width=True):
-                            if selected_acquirer == selected_target:
-                                st.error("Cannot acquire itself!")
-                            else:
-                                query = "UPDATE acquisitions SET Acquirer_Startup_ID = %s, Target_Startup_ID = %s, Date = %s, Amount = %s WHERE Acquirer_Startup_ID = %s AND Target_Startup_ID = %s AND Date = %s"
-                                if execute_insert_update(query, (int(startups_dict[selected_acquirer]), int(startups_dict[selected_target]), new_date, float(new_amount), int(startups_dict[current['Acquirer']]), int(startups_dict[current['Target']]), current['Date'])):
-                                    msg = st.success("Updated!")
-                                    time.sleep(2)
-                                    st.rerun()
+                    if st.form_submit_button("Update Acquisition", use_container_width=True):
+                        if selected_acquirer is None or selected_target is None:
+                            st.error("Select both startups")
+                        elif selected_acquirer == selected_target:
+                            st.error("Cannot acquire itself!")
+                        else:
+                            if named_write('acquisition_update', (selected_acquirer, selected_target, new_date, float(new_amount), int(acquisition_id))):
+                                msg = st.success("Updated!")
+                                time.sleep(2)
+                                st.rerun()
     
     with tab4:
-        st.subheader("Delete Acquisition")
-        st.warning("This will delete the acquisition!")
-        
-        acqs_query = """
-        SELECT s1.Name AS Acquirer, s2.Name AS Target, a.Date, a.Amount
-        FROM acquisitions a
-        JOIN startups s1 ON a.Acquirer_Startup_ID = s1.Startup_ID
-        JOIN startups s2 ON a.Target_Startup_ID = s2.Startup_ID
-        ORDER BY a.Date DESC
-        """
-        acqs_df = execute_query(acqs_query)
-        
-        if acqs_df is not None and len(acqs_df) > 0:
-            acq_options = [f"{row['Acquirer']} → {row['Target']}" for _, row in acqs_df.iterrows()]
-            selected_acq = st.selectbox("Select Acquisition", acq_options, key="delete_acq_select")
-            
-            if st.button("Delete Acquisition", use_container_width=True):
-                sel_idx = acq_options.index(selected_acq)
-                current = acqs_df.iloc[sel_idx]
-                
-                startups_query = "SELECT Startup_ID, Name FROM startups ORDER BY Name"
-                startups_df = execute_query(startups_query)
-                startups_dict = dict(zip(startups_df['Name'], startups_df['Startup_ID']))
-                
-                if execute_insert_update("DELETE FROM acquisitions WHERE Acquirer_Startup_ID = %s AND Target_Startup_ID = %s AND Date = %s", (int(startups_dict[current['Acquirer']]), int(startups_dict[current['Target']]), current['Date'])):
-                    msg = st.success("Deleted!")
-                    time.sleep(2)
-                    st.rerun()
+        if tab4.open:
+            st.subheader("Delete Acquisition")
+            st.warning("This will delete the acquisition!")
+            owner_id = entity_picker("Acquirer", "startup", key="delete_acq_owner")
+        
+            acqs_df = named_query('acquisition_targets_by_acquirer', (owner_id,)) if owner_id is not None else None
+        
+            if acqs_df is not None and len(acqs_df) == 0:
+                st.info("This startup has made no acquisitions")
+            elif acqs_df is not None:
+                acq_labels = {row['AcquisitionID']: f"{row['Target']} ({row['Date']})" for _, row in acqs_df.iterrows()}
+                acquisition_id = st.selectbox("Select Acquisition", list(acq_labels), format_func=acq_labels.get, key="delete_acq_select")
+            
+                if st.button("Delete Acquisition", use_container_width=True):
+                    if named_write('acquisition_delete', (int(acquisition_id),)):
+                        msg = st.success("Deleted!")
+                        time.sleep(2)
+                        st.rerun()
+
+    with tab5:
+        if tab5.open:
+            st.subheader("Acquisition Lineage")
+            startup_id = entity_picker("Startup", "startup", key="lineage_startup")
+            if startup_id is not None:
+                df = lineage(startup_id)
+                if df is not None and len(df) == 0:
+                    st.info("This startup has not acquired or been acquired")
+                elif df is not None:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown("#### Acquired By")
+                        st.dataframe(df[df['Direction'] == 'Acquirer'].drop(columns=['Direction']),
+                                     use_container_width=True, hide_index=True)
+                    with col2:
+                        st.markdown("#### Acquired")
+                        st.dataframe(df[df['Direction'] == 'Acquired'].drop(columns=['Direction']),
+                                     use_container_width=True, hide_index=True)
+                    st.caption("Depth 1 is a direct acquisition; deeper rows came through another acquisition")
+
+            st.markdown("### Largest Consolidators")
+            df = consolidators(10)
+            if df is not None and len(df) > 0:
+                plotly_chart('bar', df, x='Startup', y='Controlled')
+                st.dataframe(df, use_container_width=True, hide_index=True)
+            elif df is not None:
+                st.info("No acquisitions yet")
+
+# ===== BULK IMPORT =====
+elif page == "Bulk Import":
+    st.markdown("<h1 class='header-style'>Bulk Import</h1>", unsafe_allow_html=True)
+    st.caption("CSV or Parquet. Rows are validated against the schema constraints, then written in batches, one transaction per batch. "
+               "Name columns (City, Industry, Startup, Country) are resolved to IDs; ID columns are used as given.")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        kind = st.selectbox("Table", list(IMPORT_SPECS), format_func=lambda k: k.replace('_', ' ').title())
+    with col2:
+        chunk_size = st.number_input("Rows per batch", min_value=100, max_value=100000, value=IMPORT_CHUNK_SIZE, step=500)
+    with col3:
+        method = st.selectbox("Write method", IMPORT_METHODS)
+    
+    spec = IMPORT_SPECS[kind]
+    st.caption("Columns: " + ", ".join(spec.columns) + (" (or " + ", ".join(spec.lookups) + " by name)" if spec.lookups else ""))
+    upsert = st.checkbox("Update rows whose ID already exists", disabled=method != 'executemany')
+    dry_run = st.checkbox("Validate only (write nothing)")
+    uploaded = st.file_uploader("File", type=["csv", "parquet"])
+    
+    if uploaded is not None and st.button("Import", use_container_width=True):
+        progress = st.empty()
+        batches = []
+        
+        def show_batch(result):
+            batches.append(result)
+            progress.caption(f"Batch {result.batch}: {sum(b.rows for b in batches):,} rows processed "
+                             f"({result.rows_per_sec:,.0f} rows/s)")
+        
+        try:
+            report = run_import(kind, uploaded, chunk_size=int(chunk_size), method=method,
+                                upsert=upsert and method == 'executemany', dry_run=dry_run, on_batch=show_batch)
+        except Exception as e:
+            report = None
+            st.error(f"❌ Import Failed: {e}")
+        
+        if report is not None:
+            total = sum(b.rows for b in report.batches)
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Rows", f"{total:,}")
+            col2.metric("Inserted", f"{report.inserted:,}")
+            col3.metric("Rejected", f"{report.rejected:,}")
+            col4.metric("Rows/s", f"{total / report.seconds:,.0f}" if report.seconds else "-")
+            st.dataframe(report.summary(), use_container_width=True, hide_index=True)
+            
+            rejected = report.rejected_rows()
+            if len(rejected):
+                st.subheader("Rejected Rows")
+                st.dataframe(rejected.groupby('Reason').size().rename('Rows').reset_index(), hide_index=True)
+                st.dataframe(rejected.head(1000), use_container_width=True, hide_index=True)
+                st.download_button("Download rejected rows", rejected.to_csv(index=False), f"{kind}_rejected.csv", "text/csv")
+
+
+# ===== DIAGNOSTICS =====
+elif page == "Diagnostics":
+    st.markdown("<h1 class='header-style'>Diagnostics</h1>", unsafe_allow_html=True)
+    
+    summary = query_log.summary()
+    recent = query_log.recent()
+    if len(summary) == 0:
+        st.info("No queries recorded yet")
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+        db_calls = recent[recent['source'] == 'db']
+        col1.metric("Queries (recent)", len(recent))
+        col2.metric("Sent to MySQL", len(db_calls))
+        col3.metric("p95 (ms)", f"{db_calls['total_ms'].quantile(0.95):.1f}" if len(db_calls) else "-")
+        col4.metric(f"Slow (≥{query_log.slow_ms} ms)", len(query_log.slow()))
+        
+        st.subheader("Per Query (since start-up)")
+        st.caption("Percentiles are histogram bucket upper bounds")
+        st.dataframe(summary, use_container_width=True, hide_index=True)
+        
+        st.subheader("Latency Histogram")
+        db_queries = summary[summary['Source'] == 'db']['Query'].tolist()
+        if db_queries:
+            selected = st.selectbox("Query", db_queries, format_func=lambda q: q[:120])
+            fig = px.bar(query_log.histogram(selected), x='Bucket', y='Calls')
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.subheader("By Page / Tab")
+        by_tag = recent.groupby(['tag', 'source']).agg(
+            Calls=('total_ms', 'size'), Total_ms=('total_ms', 'sum'), p95_ms=('total_ms', lambda s: s.quantile(0.95)),
+            Rows=('rows', 'sum'), Bytes=('bytes', 'sum')
+        ).round(2).reset_index().sort_values('Total_ms', ascending=False)
+        st.dataframe(by_tag, use_container_width=True, hide_index=True)
+        
+        st.subheader("Slow Queries")
+        st.dataframe(query_log.slow(), use_container_width=True, hide_index=True)
+        
+        st.subheader("Recent Queries")
+        st.dataframe(recent.iloc[::-1], use_container_width=True, hide_index=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Connection Pool")
+        st.json(pool_stats())
+    with col2:
+        st.subheader("Query Cache")
+        st.json(cache_stats())
+        st.subheader("Chart Cache")
+        st.json(chart_cache_stats())
+
+    engine = get_engine()
+    if engine is not None:
+        st.subheader("Analytics Engine")
+        st.json(engine.stats())
+
+    st.subheader("Co-Investment Network")
+    st.json(get_network().stats())
+
+    st.subheader("Acquisition Graph")
+    st.json(get_graph_cache().stats())
+
+    if query_log.log_path:
+        st.caption(f"Also logging to {query_log.log_path}")
+    if st.button("Clear recorded queries"):
+        query_log.clear()
+        st.rerun()
+
+run_counts_box.caption(f"This run: {run_counts['executed']} queries sent, "
+                       f"{run_counts['cached']} served from cache")
@@ -0,0 +1,443 @@
+# benchmark.py
+# Times every page's query set, plus the shaping the page does with each result (charts,
+# the Arrow conversion behind st.dataframe), on synthetic data at several scales.
+#   python benchmark.py --scales 10k 100k                      # SQLite stand-in, no server needed
+#   python benchmark.py --backend mysql --database bench_10k   # a MySQL schema set up like mini_project
+#   python benchmark.py --csv today.csv --compare baseline.csv # flag regressions against a saved run
+import argparse
+import re
+import sqlite3
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+import mysql.connector
+import pandas as pd
+import plotly.express as px
+
+from acquisition_graph import LINEAGE_QUERY, CONSOLIDATORS_QUERY, MAX_DEPTH, AcquisitionGraph, lineage_params
+from change_feed import FEEDS
+from coinvest import MEMBERS_QUERY, COINVESTORS_QUERY, CoInvestIndex
+from analytics_engine import STARTUPS_QUERY, ROUNDS_QUERY, CITIES_QUERY, GROUPS, FactSet
+from analytics import (
+    INDUSTRY_FUNDING_QUERY, TOP_STARTUPS_QUERY, STAGE_DISTRIBUTION_QUERY, CITY_STARTUPS_QUERY,
+    NESTED_QUERY, SECTORS_QUERY, AGGREGATE_METRICS
+)
+from config import DB_CONFIG
+from dashboard import (
+    METRICS_QUERY, RECENT_ROUNDS_QUERY, RECENT_ROUNDS_SINCE_QUERY, INDUSTRY_DISTRIBUTION_QUERY, STAGE_FUNDING_QUERY
+)
+from datagen import LAST_DATE, TABLE_ORDER, generate, scale_rows, summaries
+from materialize import frame_from_cursor
+from pagination import build_page_query
+from pickers import PICKER_LIMIT, search_query
+from table_specs import TABLE_SPECS
+from trends import TRENDS_SELECT, filter_trends, stage_mix, trend
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+PAGE_SIZE = 25
+SUMMARY_TABLES = ['startup_funding_summary', 'stage_funding_summary', 'industry_funding_summary', 'city_funding_summary',
+                  'monthly_funding_summary']
+# Name prefixes datagen uses, for the typeahead searches
+SEARCH_PREFIXES = {'startup': "Startup 00001", 'investor': "Investor 0001", 'founder': "Founder 1"}
+# Investor whose co-investors the network rows look up
+NETWORK_INVESTOR = 1
+# Bound for the date-bounded recent rounds: the generated data's last year
+RECENT_SINCE = f"{LAST_DATE.year}-01-01"
+# What read_df gives the rollup with trends.TRENDS_DTYPES; benchmark backends read without it
+TRENDS_FRAME_DTYPES = {'Month': 'datetime64[ns]', 'Sector': 'category', 'City': 'category', 'Stage': 'category'}
+PAGES = {'startups': "Startups", 'investors': "Investors", 'funding_rounds': "Funding Rounds",
+         'founders': "Founders", 'acquisitions': "Acquisitions"}
+
+# What the Nested Query page ran before db/views.sql: a correlated SUM per startup, an IN over
+# the rounds, and the average as a second statement
+LEGACY_NESTED_QUERY = """
+SELECT s.Name AS Startup_Name,
+       s.Founded_Year,
+       c.Name AS City,
+       (SELECT SUM(Amount) FROM funding_rounds WHERE Startup_ID = s.Startup_ID) AS Total_Funding
+FROM startups s
+JOIN cities c ON s.City_ID = c.City_ID
+WHERE s.Startup_ID IN (
+    SELECT Startup_ID
+    FROM funding_rounds
+    WHERE Amount > (SELECT AVG(Amount) FROM funding_rounds)
+)
+ORDER BY Total_Funding DESC
+"""
+LEGACY_AVG_FUNDING_QUERY = "SELECT AVG(Amount) AS Avg_Funding FROM funding_rounds"
+# NESTED_QUERY's columns the same way: a correlated lookup per startup for each total and for
+# count_milestones() (the average is still LEGACY_AVG_FUNDING_QUERY)
+LEGACY_NESTED_COLUMNS_QUERY = """
+SELECT s.Name AS Startup_Name,
+       s.Founded_Year,
+       c.Name AS City,
+       (SELECT SUM(Amount) FROM funding_rounds WHERE Startup_ID = s.Startup_ID) AS Total_Funding,
+       (SELECT COUNT(*) FROM funding_rounds WHERE Startup_ID = s.Startup_ID) AS Rounds,
+       (SELECT COUNT(*) FROM startup_milestones WHERE Startup_ID = s.Startup_ID) AS Milestones
+FROM startups s
+JOIN cities c ON s.City_ID = c.City_ID
+WHERE s.Startup_ID IN (
+    SELECT Startup_ID
+    FROM funding_rounds
+    WHERE Amount > (SELECT AVG(Amount) FROM funding_rounds)
+)
+ORDER BY Total_Funding DESC
+"""
+
+# The stored functions over a whole list (one lookup per row each) vs. the views (MySQL only)
+FUNCTIONS_QUERY = """
+SELECT s.Startup_ID, s.Name, get_total_funding(s.Startup_ID) AS Total_Funding,
+       count_milestones(s.Startup_ID) AS Milestones
+FROM startups s
+"""
+VIEWS_QUERY = """
+SELECT s.Startup_ID, s.Name, t.Total_Funding, COALESCE(m.Milestones, 0) AS Milestones
+FROM startups s
+JOIN startup_funding_totals t ON s.Startup_ID = t.Startup_ID
+LEFT JOIN startup_milestone_counts m ON s.Startup_ID = m.Startup_ID
+"""
+
+
+@dataclass
+class BenchQuery:
+    page: str
+    name: str
+    sql: str
+    params: tuple = ()
+    shape: object = None      # callable(df): what the page does with the result
+    backends: tuple = ('sqlite', 'mysql')
+
+
+def _table(df):
+    # st.dataframe ships the frame to the browser as Arrow
+    return pa.Table.from_pandas(df) if pa is not None else df.to_dict('records')
+
+
+def _bar(x, y):
+    return lambda df: px.bar(df, x=x, y=y)
+
+
+def _pie(values, names):
+    return lambda df: px.pie(df, values=values, names=names)
+
+
+def page_queries(lineage_startup):
+    queries = [
+        BenchQuery("Dashboard", "metrics", METRICS_QUERY),
+        BenchQuery("Dashboard", "recent rounds", RECENT_ROUNDS_QUERY, shape=_table),
+        BenchQuery("Dashboard", "recent rounds: last year", RECENT_ROUNDS_SINCE_QUERY, (RECENT_SINCE,), _table),
+        BenchQuery("Dashboard", "industry distribution", INDUSTRY_DISTRIBUTION_QUERY, shape=_pie('Count', 'Sector')),
+        BenchQuery("Dashboard", "stage funding", STAGE_FUNDING_QUERY, shape=_pie('Total', 'Stage')),
+    ]
+    for table, spec in TABLE_SPECS.items():
+        page = PAGES[table]
+        first_sort = next(iter(spec.sort_columns.values()))
+        sql, params = build_page_query(spec, first_sort, spec.default_descending, PAGE_SIZE)
+        queries.append(BenchQuery(page, "view all: first page", sql, tuple(params), _table))
+        if "Name" in spec.sort_columns:
+            sql, params = build_page_query(spec, spec.sort_columns["Name"], False, PAGE_SIZE)
+            queries.append(BenchQuery(page, "view all: sorted by name", sql, tuple(params), _table))
+    queries.append(BenchQuery("Investors", "co-investors: self-join", COINVESTORS_QUERY, (NETWORK_INVESTOR, 10), _table))
+    queries += [
+        BenchQuery("Acquisitions", "lineage: recursive CTE", LINEAGE_QUERY, lineage_params(lineage_startup), _table),
+        BenchQuery("Acquisitions", "consolidators: recursive CTE", CONSOLIDATORS_QUERY, (MAX_DEPTH, 10), _table),
+    ]
+    for entity, prefix in SEARCH_PREFIXES.items():
+        page = PAGES[entity + 's']
+        queries.append(BenchQuery(page, f"{entity} picker search", search_query(entity), (prefix + '%', PICKER_LIMIT)))
+    queries += [
+        BenchQuery("Analytics", "industry chart", INDUSTRY_FUNDING_QUERY, shape=_bar('Sector', 'Total_Funding')),
+        BenchQuery("Analytics", "top startups chart", TOP_STARTUPS_QUERY, shape=_bar('Name', 'Total_Funding')),
+        BenchQuery("Analytics", "trends: monthly rollup", TRENDS_SELECT),
+        BenchQuery("Analytics", "stage chart", STAGE_DISTRIBUTION_QUERY, shape=_pie('Total', 'Stage')),
+        BenchQuery("Analytics", "city chart", CITY_STARTUPS_QUERY, shape=_bar('City', 'Startups')),
+        BenchQuery("Analytics", "nested query", NESTED_QUERY, shape=_table),
+        BenchQuery("Analytics", "nested query (legacy)", LEGACY_NESTED_QUERY, shape=_table),
+        BenchQuery("Analytics", "nested query (legacy, same columns)", LEGACY_NESTED_COLUMNS_QUERY, shape=_table),
+        BenchQuery("Analytics", "average funding (legacy)", LEGACY_AVG_FUNDING_QUERY),
+        BenchQuery("Analytics", "per-startup totals: functions", FUNCTIONS_QUERY, backends=('mysql',)),
+        BenchQuery("Analytics", "per-startup totals: views", VIEWS_QUERY),
+    ]
+    return queries
+
+
+# The same Analytics answers from analytics_engine.FactSet, after one load
+def engine_calls():
+    calls = [
+        ("industry chart", lambda f: f.industry_funding(), _bar('Sector', 'Total_Funding')),
+        ("top startups chart", lambda f: f.top_startups(10), _bar('Name', 'Total_Funding')),
+        ("stage chart", lambda f: f.stage_distribution(), _pie('Total', 'Stage')),
+        ("city chart", lambda f: f.city_startups(), _bar('City', 'Startups')),
+    ]
+    for group in GROUPS:
+        for metric in AGGREGATE_METRICS:
+            calls.append((f"aggregate: {group} by {metric}", lambda f, g=group, m=metric: f.aggregate(g, m, 10), _table))
+    return calls
+
+
+# The Investors Network tab from coinvest.CoInvestIndex, after one load
+def network_calls():
+    return [
+        ("co-investors: index", lambda n: n.top_coinvestors(NETWORK_INVESTOR, 10), _table),
+        ("strongest pairs", lambda n: n.top_pairs(10), _table),
+        ("most connected", lambda n: n.most_connected(10), _table),
+        ("syndicate sizes", lambda n: n.syndicate_sizes(), _bar('Syndicate_Size', 'Rounds')),
+        ("portfolio overlap", lambda n: pd.DataFrame([n.overlap(NETWORK_INVESTOR, NETWORK_INVESTOR + 1)]), None),
+    ]
+
+
+# The Acquisitions Lineage tab from acquisition_graph.AcquisitionGraph; closures are cached
+# after the first run, which is what repeat lookups cost
+def graph_calls(lineage_startup):
+    return [
+        ("lineage: graph", lambda g: g.lineage(lineage_startup), _table),
+        ("consolidators: graph", lambda g: g.consolidators(10), _table),
+    ]
+
+
+# The Analytics Trends tab from trends.py, over the loaded monthly rollup
+def trend_calls():
+    return [
+        ("trends: quarterly", lambda r: trend(r, 3), None),
+        ("trends: monthly by industry", lambda r: trend(r, 1, 'Sector'), None),
+        ("trends: quarterly by city", lambda r: trend(r, 3, 'City', 'Rounds'), None),
+        ("trends: yearly stage mix", lambda r: stage_mix(r, 12), None),
+        ("trends: one industry by stage", lambda r: trend(filter_trends(r, r['Sector'].iloc[0]), 3, 'Stage'), None),
+    ]
+
+
+def load_facts(backend):
+    return FactSet.build(backend.run(STARTUPS_QUERY), backend.run(ROUNDS_QUERY, (0,)),
+                         backend.run(SECTORS_QUERY)['Sector'].astype(str), backend.run(CITIES_QUERY)['Name'].astype(str))
+
+
+# ---------- backends ----------
+
+class SQLiteBackend:
+    # In-process stand-in: same tables, rollups and indexes, MySQL placeholders translated
+    name = 'sqlite'
+
+    def __init__(self, path=':memory:'):
+        self.conn = sqlite3.connect(path)
+
+    def load(self, data):
+        tables = dict(data)
+        tables.update(summaries(data))
+        for name, df in tables.items():
+            df = df.copy()
+            for column in df.columns:
+                if column in ('Date', 'Month'):
+                    df[column] = df[column].astype(str)
+            df.to_sql(name, self.conn, if_exists='replace', index=False, chunksize=50_000)
+        with open('db/indexes.sql', encoding='utf-8') as f:
+            for table, index, columns in re.findall(r"ALTER TABLE (\w+) ADD INDEX (\w+) \(([^)]*)\);", f.read()):
+                self.conn.execute(f"CREATE INDEX {index} ON {table} ({columns})")
+        for name, key in [('startups', 'Startup_ID'), ('investors', 'Investor_ID'), ('founders', 'Founder_ID'),
+                          ('funding_rounds', 'Round_ID'), ('cities', 'City_ID'), ('industries', 'Industry_ID'),
+                          ('countries', 'Country_ID'), ('acquisitions', 'AcquisitionID'),
+                          ('startup_funding_summary', 'Startup_ID')]:
+            self.conn.execute(f"CREATE UNIQUE INDEX pk_{name} ON {name} ({key})")
+        self.conn.execute("CREATE INDEX idx_startups_name ON startups (Name)")
+        self.conn.execute("CREATE INDEX idx_investors_name ON investors (Name)")
+        with open('db/views.sql', encoding='utf-8') as f:
+            self.conn.executescript(f.read().replace("CREATE OR REPLACE VIEW", "CREATE VIEW IF NOT EXISTS"))
+        self.conn.execute("ANALYZE")
+        self.conn.commit()
+
+    def run(self, sql, params=()):
+        return pd.read_sql(sql.replace('%s', '?'), self.conn, params=params or None)
+
+    def close(self):
+        self.conn.close()
+
+
+class MySQLBackend:
+    # Expects a database created with the README's install steps; its rows are replaced
+    name = 'mysql'
+
+    def __init__(self, database, chunk_size=10_000):
+        self.conn = mysql.connector.connect(**{**DB_CONFIG, 'database': database})
+        self.chunk_size = chunk_size
+
+    def load(self, data):
+        cursor = self.conn.cursor()
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for name in list(reversed(TABLE_ORDER)) + SUMMARY_TABLES:
+            cursor.execute(f"TRUNCATE TABLE {name}")
+        for name in TABLE_ORDER:
+            df = data[name]
+            sql = f"INSERT INTO {name} ({', '.join(df.columns)}) VALUES ({', '.join(['%s'] * len(df.columns))})"
+            rows = list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+            for start in range(0, len(rows), self.chunk_size):
+                cursor.executemany(sql, rows[start:start + self.chunk_size])
+                self.conn.commit()
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        # The insert triggers already maintained the rollups; rebuild makes them exact regardless
+        cursor.execute("CALL rebuild_funding_summaries()")
+        cursor.execute(f"ANALYZE TABLE {', '.join(TABLE_ORDER + SUMMARY_TABLES)}")
+        cursor.fetchall()
+        self.conn.commit()
+        cursor.close()
+
+    def run(self, sql, params=()):
+        # Same materialization as db.read_df
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(sql, params or None)
+            return frame_from_cursor(cursor)
+        finally:
+            cursor.close()
+
+    def close(self):
+        self.conn.close()
+
+
+# ---------- timing ----------
+
+# fetch() returns the result frame, shape(df) is the page's work on it (optional)
+def measure(fetch, shape_fn, runs):
+    fetch_ms, shape_ms = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        df = fetch()
+        fetched = time.perf_counter()
+        if shape_fn:
+            shape_fn(df)
+        fetch_ms.append((fetched - start) * 1000)
+        shape_ms.append((time.perf_counter() - fetched) * 1000)
+
+    # One extra traced run for memory; tracing slows Python down, so it is not timed
+    tracemalloc.start()
+    df = fetch()
+    if shape_fn:
+        shape_fn(df)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    fetch, shape = pd.Series(fetch_ms), pd.Series(shape_ms)
+    return {
+        'rows': len(df),
+        'p50_ms': round(fetch.median(), 3),
+        'p95_ms': round(fetch.quantile(0.95), 3),
+        'shape_ms': round(shape.median(), 3),
+        'df_kb': round(df.memory_usage(deep=True).sum() / 1024, 1),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmark(backend, scales, runs=5, seed=42, log=print):
+    results = []
+    for scale in scales:
+        started = time.perf_counter()
+        data = generate(scale_rows(scale), seed)
+        backend.load(data)
+        log(f"[{backend.name} {scale}] loaded in {time.perf_counter() - started:.1f}s")
+        # Lineage is traced for the top consolidator, whose acquisitions run several levels deep
+        graph = AcquisitionGraph(backend.run(FEEDS['acquisitions'].select))
+        top = graph.consolidators(1).iloc[0]
+        lineage_startup = int(top['Startup_ID'])
+        log(f"[{backend.name} {scale}] lineage of startup {lineage_startup}: "
+            f"{top['Controlled']} startups over {top['Levels']} levels")
+        for query in page_queries(lineage_startup):
+            if backend.name not in query.backends:
+                continue
+            row = {'backend': backend.name, 'scale': scale, 'page': query.page, 'query': query.name}
+            try:
+                row.update(measure(lambda q=query: backend.run(q.sql, q.params), query.shape, runs))
+            except Exception as e:
+                row['error'] = str(e)
+            results.append(row)
+
+        started = time.perf_counter()
+        facts = load_facts(backend)
+        log(f"[{backend.name} {scale}] engine loaded in {time.perf_counter() - started:.1f}s, "
+            f"{facts.nbytes() / 1024 / 1024:.1f} MB")
+        for name, call, shape in engine_calls():
+            row = {'backend': backend.name, 'scale': scale, 'page': "Analytics (engine)", 'query': name}
+            row.update(measure(lambda c=call: c(facts), shape, runs))
+            results.append(row)
+
+        started = time.perf_counter()
+        network = CoInvestIndex.build(backend.run(MEMBERS_QUERY))
+        log(f"[{backend.name} {scale}] network loaded in {time.perf_counter() - started:.1f}s, "
+            f"{network.nbytes() / 1024 / 1024:.1f} MB")
+        for name, call, shape in network_calls():
+            row = {'backend': backend.name, 'scale': scale, 'page': "Investors (network)", 'query': name}
+            row.update(measure(lambda c=call: c(network), shape, runs))
+            results.append(row)
+
+        for name, call, shape in graph_calls(lineage_startup):
+            row = {'backend': backend.name, 'scale': scale, 'page': "Acquisitions (graph)", 'query': name}
+            row.update(measure(lambda c=call: c(graph), shape, runs))
+            results.append(row)
+
+        rollup = backend.run(TRENDS_SELECT).astype(TRENDS_FRAME_DTYPES)
+        log(f"[{backend.name} {scale}] monthly rollup: {len(rollup)} rows")
+        for name, call, shape in trend_calls():
+            row = {'backend': backend.name, 'scale': scale, 'page': "Analytics (trends)", 'query': name}
+            row.update(measure(lambda c=call: c(rollup), shape, runs))
+            results.append(row)
+    return pd.DataFrame(results)
+
+
+def compare(current, baseline, threshold):
+    keys = ['backend', 'scale', 'page', 'query']
+    merged = current.merge(baseline[keys + ['p50_ms']], on=keys, suffixes=('', '_baseline'))
+    merged['ratio'] = (merged['p50_ms'] / merged['p50_ms_baseline']).round(2)
+    # Sub-millisecond queries are mostly noise
+    merged['regressed'] = (merged['ratio'] > threshold) & (merged['p50_ms'] > 1)
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each page's queries on synthetic data")
+    parser.add_argument("--scales", nargs="+", default=['10k'], help="10k, 100k, 1m or round counts")
+    parser.add_argument("--backend", choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument("--database", help="MySQL database to load and query (its rows are replaced)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--csv", help="save the results here")
+    parser.add_argument("--compare", help="results CSV from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.5, help="p50 ratio that counts as a regression")
+    args = parser.parse_args()
+
+    if args.backend == 'mysql':
+        if not args.database or args.database == DB_CONFIG['database']:
+            parser.error("--database must name a separate MySQL database; its tables are truncated")
+        backend = MySQLBackend(args.database)
+    else:
+        backend = SQLiteBackend()
+
+    try:
+        results = run_benchmark(backend, args.scales, args.runs, args.seed)
+    finally:
+        backend.close()
+
+    pd.set_option('display.width', 200)
+    print(results.to_string(index=False))
+    if 'error' not in results:
+        results['error'] = None
+    per_page = results.groupby(['scale', 'page'], sort=False)[['p50_ms', 'shape_ms', 'peak_kb']].sum().round(1)
+    print("\nPer page (sum over its queries):")
+    print(per_page.to_string())
+
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+    if args.compare:
+        merged = compare(results, pd.read_csv(args.compare), args.threshold)
+        regressed = merged[merged['regressed']]
+        print(f"\n{len(regressed)} regression(s) over {args.threshold}x:")
+        if len(regressed):
+            print(regressed[['scale', 'page', 'query', 'p50_ms_baseline', 'p50_ms', 'ratio']].to_string(index=False))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
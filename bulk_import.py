@@ -0,0 +1,444 @@
+# bulk_import.py
+# Streaming bulk loader for startups, funding rounds and investors (CSV or Parquet).
+# Rows are checked against the schema's constraints in pandas before they reach MySQL,
+# then written in fixed-size batches, one transaction per batch.
+import argparse
+import numbers
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+
+import mysql.connector
+import pandas as pd
+
+from config import DB_CONFIG, FUNDING_STAGES, FOUNDED_YEAR_RANGE, IMPORT_CHUNK_SIZE
+from db import get_pool, query_cache, read_df
+from dimensions import get_dimension
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet support is optional
+    pq = None
+
+METHODS = ['executemany', 'load-data']
+
+
+@dataclass
+class ImportSpec:
+    table: str
+    columns: list                                  # DB columns, in INSERT order
+    key: str                                       # primary key
+    required: list                                 # columns that may not be NULL
+    ints: list                                     # columns coerced to integers
+    unique: list                                   # columns that must not repeat within the file
+    lookups: dict = field(default_factory=dict)    # file column -> (id column, lookup name)
+
+
+SPECS = {
+    'startups': ImportSpec(
+        table='startups',
+        columns=['Startup_ID', 'Name', 'Founded_Year', 'City_ID', 'Industry_ID'],
+        key='Startup_ID',
+        required=['Startup_ID', 'Name'],
+        ints=['Startup_ID', 'Founded_Year', 'City_ID', 'Industry_ID'],
+        unique=['Startup_ID', 'Name'],
+        lookups={'City': ('City_ID', 'cities'), 'Industry': ('Industry_ID', 'industries')},
+    ),
+    'funding_rounds': ImportSpec(
+        table='funding_rounds',
+        columns=['Round_ID', 'Startup_ID', 'Date', 'Amount', 'Stage'],
+        key='Round_ID',
+        required=['Round_ID', 'Startup_ID', 'Amount', 'Stage'],
+        ints=['Round_ID', 'Startup_ID'],
+        unique=['Round_ID'],
+        lookups={'Startup': ('Startup_ID', 'startups')},
+    ),
+    'investors': ImportSpec(
+        table='investors',
+        columns=['Investor_ID', 'Name', 'Type', 'Country_ID'],
+        key='Investor_ID',
+        required=['Investor_ID', 'Name', 'Type'],
+        ints=['Investor_ID', 'Country_ID'],
+        unique=['Investor_ID', 'Name'],
+        lookups={'Country': ('Country_ID', 'countries')},
+    ),
+}
+
+
+@dataclass
+class BatchResult:
+    batch: int
+    rows: int
+    inserted: int
+    rejected: int
+    seconds: float
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class ImportReport:
+    kind: str
+    batches: list = field(default_factory=list)
+    rejects: list = field(default_factory=list)    # DataFrames with Row and Reason columns
+
+    @property
+    def inserted(self):
+        return sum(b.inserted for b in self.batches)
+
+    @property
+    def rejected(self):
+        return sum(b.rejected for b in self.batches)
+
+    @property
+    def seconds(self):
+        return sum(b.seconds for b in self.batches)
+
+    def summary(self):
+        return pd.DataFrame([
+            {'Batch': b.batch, 'Rows': b.rows, 'Inserted': b.inserted, 'Rejected': b.rejected,
+             'Seconds': round(b.seconds, 3), 'Rows/s': round(b.rows_per_sec)}
+            for b in self.batches
+        ])
+
+    def rejected_rows(self):
+        if not self.rejects:
+            return pd.DataFrame(columns=['Row', 'Reason'])
+        return pd.concat(self.rejects, ignore_index=True)
+
+
+# ---------- reading ----------
+
+def _format_of(source, fmt):
+    if fmt:
+        return fmt
+    name = getattr(source, 'name', source)
+    return 'parquet' if str(name).lower().endswith(('.parquet', '.pq')) else 'csv'
+
+
+def iter_chunks(source, fmt=None, chunk_size=IMPORT_CHUNK_SIZE):
+    # Index of each chunk is the 0-based data row number in the file
+    if _format_of(source, fmt) == 'parquet':
+        if pq is None:
+            raise RuntimeError("Parquet import needs pyarrow (pip install pyarrow)")
+        offset = 0
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+            df = batch.to_pandas()
+            df.index = pd.RangeIndex(offset, offset + len(df))
+            offset += len(df)
+            yield df
+    else:
+        yield from pd.read_csv(source, chunksize=chunk_size, dtype=str, skipinitialspace=True)
+
+
+# ---------- validation ----------
+
+def _key(text):
+    return text.str.strip().str.lower()
+
+
+def load_lookups(spec):
+    # Lower-cased name -> ID hash maps for the lookup columns this spec uses
+    maps = {}
+    for _, name in spec.lookups.values():
+        if name == 'startups':
+            df = read_df("SELECT Startup_ID AS ID, Name AS Label FROM startups", ttl=0)
+            maps[name] = dict(zip(_key(df['Label'].astype(str)), df['ID'].astype(int)))
+        else:
+            dimension = get_dimension(name)
+            maps[name] = {label.strip().lower(): id_ for label, id_ in dimension.ids_by_label.items()}
+    return maps
+
+
+def _canonical_columns(df, spec):
+    known = {c.lower(): c for c in spec.columns + list(spec.lookups)}
+    return df.rename(columns=lambda c: known.get(str(c).strip().lower(), c))
+
+
+def check_columns(df, spec):
+    df = _canonical_columns(df, spec)
+    resolvable = {id_col for id_col, _ in spec.lookups.values()}
+    missing = [c for c in spec.required if c not in df.columns and not (
+        c in resolvable and any(f in df.columns for f, (i, _) in spec.lookups.items() if i == c))]
+    if missing:
+        raise ValueError(f"{spec.table}: missing column(s) {', '.join(missing)}")
+
+
+def validate(chunk, spec, maps, seen):
+    # Returns (rows ready to insert in spec.columns order, rejected rows with a Reason)
+    df = _canonical_columns(chunk, spec)
+    for column in df.columns:
+        if pd.api.types.is_string_dtype(df[column]):
+            text = df[column].str.strip()
+            df[column] = text.where(text != '')
+
+    reasons = pd.Series(None, index=df.index, dtype=object)
+
+    def reject(mask, reason):
+        # The first failing check is the one reported
+        reasons[mask.fillna(False).astype(bool) & reasons.isna()] = reason
+
+    for file_col, (id_col, name) in spec.lookups.items():
+        if id_col in df.columns or file_col not in df.columns:
+            continue
+        given = df[file_col].notna()
+        df[id_col] = _key(df[file_col].astype('string')).map(maps[name])
+        reject(given & df[id_col].isna(), f"Unknown {file_col.lower()}")
+
+    for column in spec.columns:
+        if column not in df.columns:
+            df[column] = None
+
+    for column in spec.ints:
+        raw = df[column]
+        values = pd.to_numeric(raw, errors='coerce')
+        reject(raw.notna() & (values.isna() | (values % 1 != 0)), f"{column} is not an integer")
+        df[column] = values.round().astype('Int64')
+
+    for column in spec.required:
+        reject(df[column].isna(), f"{column} is required")
+
+    if 'Founded_Year' in spec.columns:
+        low, high = FOUNDED_YEAR_RANGE
+        year = df['Founded_Year']
+        reject(year.notna() & ((year < low) | (year > high)), f"Founded_Year outside {low}-{high}")
+
+    if 'Amount' in spec.columns:
+        raw = df['Amount']
+        amount = pd.to_numeric(raw, errors='coerce')
+        reject(raw.notna() & amount.isna(), "Amount is not a number")
+        reject(amount <= 0, "Amount must be > 0")
+        df['Amount'] = amount
+
+    if 'Stage' in spec.columns:
+        reject(df['Stage'].notna() & ~df['Stage'].isin(FUNDING_STAGES), "Stage not in the allowed list")
+
+    if 'Date' in spec.columns:
+        raw = df['Date']
+        dates = pd.to_datetime(raw, errors='coerce', format='ISO8601')
+        reject(raw.notna() & dates.isna(), "Date is not a valid date")
+        df['Date'] = dates.dt.date.astype(object).where(dates.notna(), None)
+
+    for column in spec.unique:
+        values = df[column]
+        duplicate = values.notna() & (values.duplicated() | values.isin(seen[column]))
+        reject(duplicate, f"Duplicate {column} in file")
+
+    ok = reasons.isna()
+    for column in spec.unique:
+        seen[column].update(df.loc[ok, column].dropna().tolist())
+
+    rejected = chunk.loc[~ok].copy()
+    rejected.insert(0, 'Reason', reasons[~ok])
+    rejected.insert(0, 'Row', rejected.index + 1)
+    clean = df.loc[ok, spec.columns].astype(object)
+    return clean.where(clean.notna(), None), rejected
+
+
+# ---------- writing ----------
+
+def _existing_keys(cursor, spec, keys):
+    if not keys:
+        return set()
+    cursor.execute(f"SELECT {spec.key} FROM {spec.table} WHERE {spec.key} IN ({', '.join(['%s'] * len(keys))})", keys)
+    return {row[0] for row in cursor.fetchall()}
+
+
+def insert_sql(spec):
+    columns = ", ".join(spec.columns)
+    marks = ", ".join(["%s"] * len(spec.columns))
+    return f"INSERT INTO {spec.table} ({columns}) VALUES ({marks})"
+
+
+# Upserts update by spec.key rather than ON DUPLICATE KEY UPDATE: once funding_rounds is
+# partitioned (db/partitioning.sql) its primary key is (Round_ID, Date), so a round whose
+# Date changed would not hit the duplicate-key path
+def update_sql(spec):
+    updates = ", ".join(f"{c} = %s" for c in spec.columns if c != spec.key)
+    return f"UPDATE {spec.table} SET {updates} WHERE {spec.key} = %s"
+
+
+def _write_executemany(conn, spec, clean, upsert):
+    rows = list(clean.itertuples(index=False, name=None))
+    cursor = conn.cursor()
+    try:
+        key_at = spec.columns.index(spec.key)
+        existing = _existing_keys(cursor, spec, [int(row[key_at]) for row in rows]) if upsert else set()
+        # Per row: the statement and its parameters
+        writes = []
+        for row in rows:
+            if row[key_at] in existing:
+                writes.append((update_sql(spec), row[:key_at] + row[key_at + 1:] + (row[key_at],)))
+            else:
+                writes.append((insert_sql(spec), row))
+        try:
+            # The connector folds an INSERT executemany into one multi-row statement
+            for sql in dict.fromkeys(sql for sql, _ in writes):
+                cursor.executemany(sql, [params for s, params in writes if s == sql])
+            conn.commit()
+            return len(rows), None
+        except mysql.connector.Error:
+            conn.rollback()
+        # Something in the batch failed: replay it row by row to keep the good rows
+        errors = pd.Series(None, index=clean.index, dtype=object)
+        for index, (sql, params) in zip(clean.index, writes):
+            try:
+                cursor.execute(sql, params)
+            except mysql.connector.Error as err:
+                errors[index] = err.msg
+        conn.commit()
+        return int(errors.isna().sum()), errors.dropna()
+    finally:
+        cursor.close()
+
+
+# One CSV field as LOAD DATA reads it with ESCAPED BY '': an unquoted NULL is NULL, numbers
+# are bare, everything else is quoted (so a value spelled NULL stays text)
+def _load_data_field(value):
+    if value is None:
+        return 'NULL'
+    if isinstance(value, numbers.Number) and not isinstance(value, bool):
+        return str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _write_load_data(conn, spec, clean):
+    # Rows whose key already exists are skipped and reported; REPLACE is not offered because
+    # it deletes first and would fire the delete cascades and triggers. LOCAL implies IGNORE,
+    # so MySQL drops rows it cannot store (e.g. a failed foreign key) with only a warning:
+    # those are found by checking which keys arrived, and rejected with the warnings' text.
+    cursor = conn.cursor()
+    try:
+        keys = [int(k) for k in clean[spec.key]]
+        existing = _existing_keys(cursor, spec, keys)
+        is_new = ~clean[spec.key].isin(existing)
+        errors = pd.Series(None, index=clean.index, dtype=object)
+        errors[~is_new] = f"Duplicate {spec.key}, skipped"
+        load = clean[is_new]
+        if len(load):
+            handle, path = tempfile.mkstemp(suffix='.csv')
+            try:
+                with os.fdopen(handle, 'w', newline='', encoding='utf-8') as f:
+                    for row in load.itertuples(index=False, name=None):
+                        f.write(','.join(_load_data_field(v) for v in row) + '\n')
+                cursor.execute(
+                    f"LOAD DATA LOCAL INFILE %s INTO TABLE {spec.table} CHARACTER SET utf8mb4 "
+                    f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                    f"LINES TERMINATED BY '\\n' ({', '.join(spec.columns)})",
+                    (path,)
+                )
+            except mysql.connector.Error:
+                # IGNORE does not cover errors a trigger SIGNALs (the checks in
+                # db/partitioning.sql): the whole load fails, so insert this batch row-aware instead
+                conn.rollback()
+                _, failed = _write_executemany(conn, spec, load, False)
+                if failed is not None:
+                    errors[failed.index] = failed
+                return int(errors.isna().sum()), errors.dropna()
+            finally:
+                os.remove(path)
+            cursor.execute("SHOW WARNINGS")
+            warnings = list(dict.fromkeys(message for _, _, message in cursor.fetchall()))
+            arrived = _existing_keys(cursor, spec, [int(k) for k in load[spec.key]])
+            dropped = ~load[spec.key].isin(arrived)
+            if dropped.any():
+                reason = "Skipped by MySQL: " + ('; '.join(warnings[:3]) if warnings else "no warning given")
+                errors[load.index[dropped.to_numpy()]] = reason
+        conn.commit()
+        return int(errors.isna().sum()), errors.dropna()
+    except mysql.connector.Error:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _open_connection(method):
+    if method == 'load-data':
+        return mysql.connector.connect(**DB_CONFIG, allow_local_infile=True)
+    return get_pool().acquire()
+
+
+def run_import(kind, source, fmt=None, chunk_size=IMPORT_CHUNK_SIZE, method='executemany',
+               upsert=False, dry_run=False, on_batch=None):
+    spec = SPECS[kind]
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}")
+    if upsert and method == 'load-data':
+        raise ValueError("upsert is only supported with executemany")
+
+    maps = load_lookups(spec)
+    seen = {column: set() for column in spec.unique}
+    report = ImportReport(kind)
+    conn = None if dry_run else _open_connection(method)
+    try:
+        for number, chunk in enumerate(iter_chunks(source, fmt, chunk_size), start=1):
+            if number == 1:
+                check_columns(chunk, spec)
+            started = time.perf_counter()
+            clean, rejected = validate(chunk, spec, maps, seen)
+
+            inserted = 0
+            if not dry_run and len(clean):
+                if method == 'load-data':
+                    inserted, errors = _write_load_data(conn, spec, clean)
+                else:
+                    inserted, errors = _write_executemany(conn, spec, clean, upsert)
+                if errors is not None and len(errors):
+                    failed = chunk.loc[errors.index].copy()
+                    failed.insert(0, 'Reason', errors)
+                    failed.insert(0, 'Row', failed.index + 1)
+                    rejected = pd.concat([rejected, failed])
+                # Invalidate per batch so readers never see a result older than a committed batch
+                query_cache.invalidate({spec.table})
+
+            if len(rejected):
+                report.rejects.append(rejected)
+            result = BatchResult(number, len(chunk), inserted, len(rejected), time.perf_counter() - started)
+            report.batches.append(result)
+            if on_batch:
+                on_batch(result)
+    finally:
+        if conn is not None:
+            conn.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load startups, funding rounds or investors from CSV/Parquet")
+    parser.add_argument("kind", choices=list(SPECS))
+    parser.add_argument("path", help="CSV or Parquet file")
+    parser.add_argument("--format", choices=['csv', 'parquet'], help="default: from the file extension")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE, help="rows per batch/transaction")
+    parser.add_argument("--method", choices=METHODS, default='executemany')
+    parser.add_argument("--upsert", action="store_true", help="update rows whose primary key already exists")
+    parser.add_argument("--dry-run", action="store_true", help="validate only, write nothing")
+    parser.add_argument("--rejects", help="write rejected rows to this CSV")
+    args = parser.parse_args()
+
+    def progress(b):
+        print(f"batch {b.batch}: {b.rows} rows, {b.inserted} inserted, {b.rejected} rejected, "
+              f"{b.seconds:.2f}s ({b.rows_per_sec:,.0f} rows/s)")
+
+    report = run_import(args.kind, args.path, args.format, args.chunk_size, args.method,
+                        args.upsert, args.dry_run, on_batch=progress)
+    total = sum(b.rows for b in report.batches)
+    rate = total / report.seconds if report.seconds else 0
+    print(f"\n{total} rows in {report.seconds:.2f}s ({rate:,.0f} rows/s): "
+          f"{report.inserted} inserted, {report.rejected} rejected")
+
+    rejected = report.rejected_rows()
+    if args.rejects and len(rejected):
+        rejected.to_csv(args.rejects, index=False)
+        print(f"Rejected rows written to {args.rejects}")
+    elif len(rejected):
+        print(rejected.groupby('Reason').size().to_string())
+    return 1 if report.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+# change_feed.py
+# DataFrames kept current from change_log (db/change_log.sql) instead of being reloaded:
+# each refresh fetches the log entries after the frame's watermark, re-reads only the
+# keys they name and patches them in. Keys that no longer come back were deleted.
+import threading
+import time
+from dataclasses import dataclass, field
+
+import mysql.connector
+import numpy as np
+import pandas as pd
+
+from config import CHANGE_FEED_CONFIG
+from db import read_df, query_cache
+
+MAX_CHANGE_QUERY = "SELECT COALESCE(MAX(Change_ID), 0) AS Max_ID, MIN(Change_ID) AS Min_ID FROM change_log"
+
+CHANGES_QUERY = """
+SELECT Change_ID, Table_Name, Row_ID, Op, TIMESTAMPDIFF(SECOND, Changed_At, NOW()) AS Age
+FROM change_log
+WHERE Change_ID > %s
+ORDER BY Change_ID
+"""
+
+# Newest entry older than gap_grace seconds (idx_change_log_time)
+SETTLED_QUERY = """
+SELECT Change_ID
+FROM change_log
+WHERE Changed_At < NOW() - INTERVAL %s SECOND
+ORDER BY Changed_At DESC, Change_ID DESC
+LIMIT 1
+"""
+
+# Keys per IN (...) list when re-reading changed rows
+FETCH_CHUNK = 1000
+
+NO_SUCH_TABLE = 1146
+
+
+@dataclass
+class FeedSpec:
+    table: str                # change_log Table_Name of the rows this frame holds
+    key: str                  # key column in the frame
+    select: str               # SELECT ... FROM ... [JOIN ...], without WHERE / ORDER BY
+    key_expr: str             # the key as a SQL expression in `select`
+    # Other logged tables whose changes alter rows here (joined names) -> their key expressions
+    related: dict = field(default_factory=dict)
+    dtypes: dict = None       # declared column dtypes for read_df (materialize.py)
+
+
+FEEDS = {
+    'funding_rounds': FeedSpec(
+        table='funding_rounds',
+        key='Round_ID',
+        select="""
+            SELECT fr.Round_ID, fr.Startup_ID, s.Name AS Startup, fr.Date, fr.Amount, fr.Stage
+            FROM funding_rounds fr
+            JOIN startups s ON fr.Startup_ID = s.Startup_ID
+        """,
+        key_expr='fr.Round_ID',
+        related={'startups': ['fr.Startup_ID']},
+        dtypes={'Date': 'datetime64'},
+    ),
+    'startups': FeedSpec(
+        table='startups',
+        key='Startup_ID',
+        select="""
+            SELECT s.Startup_ID, s.Name, s.Founded_Year, s.City_ID, s.Industry_ID, i.Sector, c.Name AS City
+            FROM startups s
+            LEFT JOIN industries i ON s.Industry_ID = i.Industry_ID
+            LEFT JOIN cities c ON s.City_ID = c.City_ID
+        """,
+        key_expr='s.Startup_ID',
+    ),
+    'acquisitions': FeedSpec(
+        table='acquisitions',
+        key='AcquisitionID',
+        select="""
+            SELECT a.AcquisitionID, a.Acquirer_Startup_ID, s1.Name AS Acquirer,
+                   a.Target_Startup_ID, s2.Name AS Target, a.Date, a.Amount
+            FROM acquisitions a
+            LEFT JOIN startups s1 ON a.Acquirer_Startup_ID = s1.Startup_ID
+            LEFT JOIN startups s2 ON a.Target_Startup_ID = s2.Startup_ID
+        """,
+        key_expr='a.AcquisitionID',
+        related={'startups': ['a.Acquirer_Startup_ID', 'a.Target_Startup_ID']},
+    ),
+}
+
+
+# Raises mysql.connector.Error with errno 1146 if db/change_log.sql is not installed
+def log_bounds():
+    row = read_df(MAX_CHANGE_QUERY, ttl=0).iloc[0]
+    return int(row['Max_ID']), (None if pd.isna(row['Min_ID']) else int(row['Min_ID']))
+
+
+# A Change_ID is taken when the trigger runs but only becomes visible when its transaction
+# commits, so a lower ID can show up after a higher one was read. A gap after the watermark is
+# such a transaction or a rolled-back one: the watermark stops before the first gap whose next
+# entry is younger than gap_grace seconds, and the entries past it already returned are kept in
+# `seen` so they are not applied twice. Returns (changes to apply, watermark, seen).
+def new_changes(watermark, seen, max_id):
+    changes = read_df(CHANGES_QUERY, (watermark,), ttl=0)
+    changes = changes[changes['Change_ID'] <= max_id]
+    ids = changes['Change_ID'].to_numpy('int64')
+    previous = np.concatenate(([watermark], ids[:-1]))
+    held = (ids - previous > 1) & (changes['Age'].to_numpy('float64') < CHANGE_FEED_CONFIG['gap_grace'])
+    watermark = int(previous[held.argmax()]) if held.any() else max(max_id, watermark)
+    fresh = changes[~changes['Change_ID'].isin(seen)]
+    return fresh, watermark, frozenset(ids[ids > watermark].tolist())
+
+
+# (watermark, seen) for a copy loaded now: entries from the last gap_grace seconds are checked
+# for gaps like new_changes does, since a transaction still open may hold an ID below MAX
+def settled_watermark():
+    max_id = log_bounds()[0]
+    settled = read_df(SETTLED_QUERY, (CHANGE_FEED_CONFIG['gap_grace'],), ttl=0)
+    _, watermark, seen = new_changes(int(settled.iloc[0, 0]) if len(settled) else 0, frozenset(), max_id)
+    return watermark, seen
+
+
+def change_log_installed():
+    try:
+        log_bounds()
+        return True
+    except mysql.connector.Error as e:
+        if e.errno == NO_SUCH_TABLE:
+            return False
+        raise
+
+
+class IncrementalFrame:
+    def __init__(self, spec, max_changes=None):
+        self.spec = spec
+        self.max_changes = CHANGE_FEED_CONFIG['max_changes'] if max_changes is None else max_changes
+        self.df = None
+        self.watermark = 0          # every Change_ID up to this one applied
+        self.seen = frozenset()     # Change_IDs after the watermark already applied
+        self.loaded_at = 0.0
+        self.stats = {'loads': 0, 'patches': 0, 'rows_patched': 0}
+
+    @property
+    def tables(self):
+        return {self.spec.table} | set(self.spec.related)
+
+    def load(self):
+        # Watermark first: anything logged while the select runs is applied again next time
+        self.watermark, self.seen = settled_watermark()
+        df = read_df(f"{self.spec.select} ORDER BY {self.spec.key_expr}", ttl=0, dtypes=self.spec.dtypes)
+        self.df = df.reset_index(drop=True)
+        self.loaded_at = time.monotonic()
+        self.stats['loads'] += 1
+        return self.df
+
+    def _fetch(self, expr, ids):
+        ids = sorted(ids)
+        frames = []
+        for start in range(0, len(ids), FETCH_CHUNK):
+            chunk = ids[start:start + FETCH_CHUNK]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            frames.append(read_df(f"{self.spec.select} WHERE {expr} IN ({placeholders})", tuple(chunk), ttl=0,
+                                  dtypes=self.spec.dtypes))
+        return frames
+
+    # Replace every row whose key was logged (or whose related rows were) with its current state
+    def apply(self, changes):
+        own = set(changes.loc[changes['Table_Name'] == self.spec.table, 'Row_ID'].astype(int))
+        frames = self._fetch(self.spec.key_expr, own) if own else []
+        for table, exprs in self.spec.related.items():
+            ids = set(changes.loc[changes['Table_Name'] == table, 'Row_ID'].astype(int))
+            if ids:
+                for expr in exprs:
+                    frames += self._fetch(expr, ids)
+        fresh = [f for f in frames if len(f)]
+        fresh = pd.concat(fresh, ignore_index=True).drop_duplicates(self.spec.key, keep='last') if fresh else None
+
+        touched = own | (set(fresh[self.spec.key].astype(int)) if fresh is not None else set())
+        kept = self.df[~self.df[self.spec.key].isin(touched)]
+        df = pd.concat([kept, fresh], ignore_index=True) if fresh is not None else kept
+        self.df = df.sort_values(self.spec.key, kind='stable').reset_index(drop=True)
+        self.stats['patches'] += 1
+        self.stats['rows_patched'] += len(touched)
+
+    # Returns True if the frame changed
+    def refresh(self):
+        if self.df is None:
+            self.load()
+            return True
+        max_id, min_id = log_bounds()
+        if max_id <= self.watermark:
+            return False
+        # Entries after our watermark were pruned, or too many changed to be worth patching
+        if (min_id is not None and self.watermark and min_id > self.watermark) or \
+                max_id - self.watermark > self.max_changes:
+            self.load()
+            return True
+        changes, self.watermark, self.seen = new_changes(self.watermark, self.seen, max_id)
+        relevant = changes[changes['Table_Name'].isin(self.tables)]
+        if len(relevant):
+            self.apply(relevant)
+        return len(relevant) > 0
+
+
+_frames = {}   # name -> IncrementalFrame
+_checked = {}  # name -> monotonic time of the last refresh
+_stale = set()
+_stale_lock = threading.Lock()   # writers only take this one, never the refresh lock
+_lock = threading.Lock()
+
+
+def _on_write(tables):
+    with _stale_lock:
+        _stale.update(tables)
+
+
+query_cache.add_listener(_on_write)
+
+
+# Current copy of one of FEEDS, refreshed from change_log after an app write or every
+# refresh_every seconds. Raises if change_log is not installed.
+def get_frame(name):
+    with _lock:
+        frame = _frames.get(name)
+        if frame is None:
+            frame = _frames[name] = IncrementalFrame(FEEDS[name])
+        with _stale_lock:
+            written = bool(_stale & frame.tables)
+            _stale.difference_update(frame.tables)
+        due = time.monotonic() - _checked.get(name, 0) > CHANGE_FEED_CONFIG['refresh_every']
+        if frame.df is None or written or due:
+            try:
+                frame.refresh()
+            except Exception:
+                _on_write(frame.tables)
+                raise
+            _checked[name] = time.monotonic()
+        return frame.df
@@ -0,0 +1,96 @@
+# chart_cache.py
+# Plotly Express figures reused across reruns and sessions. A figure is keyed by the chart
+# kind, its arguments and a hash of the frame it plots, so it is rebuilt only when the data
+# or the chart changes. Entries are evicted least recently used once their serialized specs
+# exceed max_bytes.
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+import streamlit as st
+
+from config import CHART_CACHE_CONFIG
+
+CHARTS = {'bar': px.bar, 'pie': px.pie, 'line': px.line, 'area': px.area}
+
+
+def data_version(df):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((list(df.columns), [str(t) for t in df.dtypes])).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ChartCache:
+    # st.plotly_chart serializes whatever it is given, so the built figure is what gets
+    # reused; its spec size (the JSON Streamlit sends) is what counts against max_bytes
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (figure, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'build_ms': 0.0}
+
+    @staticmethod
+    def make_key(kind, df, params):
+        return kind, repr(sorted(params.items())), data_version(df)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def put(self, key, figure, nbytes, build_ms=0.0):
+        with self._lock:
+            self._stats['build_ms'] += build_ms
+            if nbytes > self.max_bytes:
+                return
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (figure, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+                self._stats['evictions'] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['mb'] = round(self._bytes / 2 ** 20, 2)
+            stats['max_mb'] = round(self.max_bytes / 2 ** 20, 2)
+        stats['build_ms'] = round(stats['build_ms'], 1)
+        return stats
+
+
+chart_cache = ChartCache(**CHART_CACHE_CONFIG)
+
+
+def chart_cache_stats():
+    return chart_cache.stats()
+
+
+# px.<kind>(df, **params), built once per distinct (kind, params, data)
+def cached_figure(kind, df, **params):
+    key = ChartCache.make_key(kind, df, params)
+    figure = chart_cache.get(key)
+    if figure is None:
+        start = time.perf_counter()
+        figure = CHARTS[kind](df, **params)
+        nbytes = len(pio.to_json(figure, validate=False))
+        chart_cache.put(key, figure, nbytes, (time.perf_counter() - start) * 1000)
+    return figure
+
+
+def plotly_chart(kind, df, **params):
+    st.plotly_chart(cached_figure(kind, df, **params), use_container_width=True)
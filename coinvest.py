@@ -0,0 +1,344 @@
+# coinvest.py
+# Investor co-investment network, held in memory once per process. Two investors are linked
+# by every round they both joined; the links are stored as one sorted int64 key per ordered
+# pair (investor << 32 | co-investor) with a shared-round count, i.e. CSR rows keyed by
+# investor ID, so an investor's co-investors are one binary search and a slice. With
+# db/change_log.sql installed, only the rounds named in change_log are re-read and their
+# pairs added and subtracted; without it the network reloads after an app write.
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from change_feed import FETCH_CHUNK, change_log_installed, log_bounds, new_changes, settled_watermark
+from config import CHANGE_FEED_CONFIG, COINVEST_CONFIG
+from db import read_df, execute_query, query_cache
+
+MEMBERS_QUERY = """
+SELECT fri.Round_ID, fri.Investor_ID, fr.Startup_ID
+FROM funding_round_investors fri
+JOIN funding_rounds fr ON fri.Round_ID = fr.Round_ID
+"""
+
+# For pages and benchmark.py: the same top-k answered in SQL, a self-join on the link table
+COINVESTORS_QUERY = """
+SELECT b.Investor_ID, COUNT(*) AS Shared_Rounds
+FROM funding_round_investors a
+JOIN funding_round_investors b ON a.Round_ID = b.Round_ID AND b.Investor_ID <> a.Investor_ID
+WHERE a.Investor_ID = %s
+GROUP BY b.Investor_ID
+ORDER BY Shared_Rounds DESC, b.Investor_ID
+LIMIT %s
+"""
+
+NAMES_QUERY = "SELECT Investor_ID, Name FROM investors WHERE Investor_ID IN ({})"
+
+# change_log tables whose entries name rounds to re-read
+ROUND_TABLES = {'funding_rounds', 'funding_round_investors'}
+WATCHED_TABLES = ROUND_TABLES | {'investors'}
+
+_SHIFT = 32
+_LOW = (1 << _SHIFT) - 1
+
+
+def _key(high, low):
+    return (high.astype('int64') << _SHIFT) | low.astype('int64')
+
+
+# (Round_ID, Investor_ID, Startup_ID) frame -> sorted round << 32 | investor keys, startups aligned
+def _members(df):
+    keys = _key(df['Round_ID'].to_numpy(), df['Investor_ID'].to_numpy())
+    order = np.argsort(keys, kind='stable')
+    return keys[order], df['Startup_ID'].to_numpy(dtype='int64')[order]
+
+
+# Every ordered pair of distinct investors within each round, as sorted unique keys + counts.
+# A round of k investors gives k * (k - 1) pairs.
+def _pairs(members):
+    if len(members) == 0:
+        return np.empty(0, dtype='int64'), np.empty(0, dtype='int64')
+    rounds, investors = members >> _SHIFT, members & _LOW
+    starts = np.flatnonzero(np.r_[True, rounds[1:] != rounds[:-1]])
+    sizes = np.diff(np.r_[starts, len(rounds)])
+    per_row = np.repeat(sizes, sizes)                   # each member pairs with its whole round
+    left = np.repeat(np.arange(len(rounds)), per_row)
+    offset = np.arange(len(left)) - np.repeat(np.cumsum(per_row) - per_row, per_row)
+    right = np.repeat(np.repeat(starts, sizes), per_row) + offset
+    keep = left != right
+    return np.unique(_key(investors[left[keep]], investors[right[keep]]), return_counts=True)
+
+
+# keys/weights plus a delta (unique keys, signed counts); links that drop to 0 are removed
+def _merge(keys, weights, delta_keys, delta_weights):
+    if len(delta_keys) == 0:
+        return keys, weights
+    pos = np.searchsorted(keys, delta_keys)
+    found = np.zeros(len(delta_keys), dtype=bool)
+    inside = pos < len(keys)
+    found[inside] = keys[pos[inside]] == delta_keys[inside]
+    weights = weights.copy()
+    weights[pos[found]] += delta_weights[found]
+    new = ~found & (delta_weights > 0)
+    keys = np.insert(keys, pos[new], delta_keys[new])
+    weights = np.insert(weights, pos[new], delta_weights[new])
+    live = weights > 0
+    return keys[live], weights[live]
+
+
+# Sorted keys with repeats: drop one occurrence of each of `removed`, then add `added`
+def _replace(keys, removed, added):
+    if len(removed):
+        removed = np.sort(removed)
+        first = np.searchsorted(removed, removed)        # rank among equal keys
+        keys = np.delete(keys, np.searchsorted(keys, removed) + np.arange(len(removed)) - first)
+    added = np.sort(added)
+    return np.insert(keys, np.searchsorted(keys, added), added)
+
+
+class CoInvestIndex:
+    def __init__(self, members, startups, holdings, keys, weights, watermark=0, seen=frozenset()):
+        self.members = members          # sorted Round_ID << 32 | Investor_ID, one per link row
+        self.startups = startups        # each member's round's Startup_ID
+        self.holdings = holdings        # sorted Investor_ID << 32 | Startup_ID, one per link row
+        self.keys = keys                # sorted Investor_ID << 32 | co-investor, both directions
+        self.weights = weights          # shared rounds per key
+        self.watermark = watermark      # every Change_ID up to this one applied
+        self.seen = seen                # Change_IDs after the watermark already applied
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def build(cls, members, watermark=0, seen=frozenset()):
+        members, startups = _members(members)
+        holdings = np.sort(_key(members & _LOW, startups))
+        return cls(members, startups, holdings, *_pairs(members), watermark, seen)
+
+    # A new index with the membership of `round_ids` replaced by `fresh` (their current rows);
+    # only those rounds' pairs are recounted
+    def patch(self, round_ids, fresh, watermark, seen):
+        changed = np.isin(self.members >> _SHIFT, np.fromiter(round_ids, dtype='int64'))
+        old, old_startups = self.members[changed], self.startups[changed]
+        new, new_startups = _members(fresh)
+
+        old_keys, old_counts = _pairs(old)
+        new_keys, new_counts = _pairs(new)
+        delta_keys, inverse = np.unique(np.concatenate([old_keys, new_keys]), return_inverse=True)
+        delta = np.bincount(inverse, weights=np.concatenate([-old_counts, new_counts]),
+                            minlength=len(delta_keys)).astype('int64')
+        keys, weights = _merge(self.keys, self.weights, delta_keys[delta != 0], delta[delta != 0])
+
+        kept, kept_startups = self.members[~changed], self.startups[~changed]
+        pos = np.searchsorted(kept, new)
+        holdings = _replace(self.holdings, _key(old & _LOW, old_startups), _key(new & _LOW, new_startups))
+        patched = CoInvestIndex(np.insert(kept, pos, new), np.insert(kept_startups, pos, new_startups),
+                                holdings, keys, weights, watermark, seen)
+        patched.loaded_at = self.loaded_at
+        return patched
+
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.members, self.startups, self.holdings, self.keys, self.weights))
+
+    def _row(self, investor_id):
+        lo, hi = np.searchsorted(self.keys, [int(investor_id) << _SHIFT, (int(investor_id) + 1) << _SHIFT])
+        return self.keys[lo:hi] & _LOW, self.weights[lo:hi]
+
+    def shared_rounds(self, a, b):
+        key = (int(a) << _SHIFT) | int(b)
+        pos = np.searchsorted(self.keys, key)
+        return int(self.weights[pos]) if pos < len(self.keys) and self.keys[pos] == key else 0
+
+    def _holdings(self, investor_id):
+        lo, hi = np.searchsorted(self.holdings, [int(investor_id) << _SHIFT, (int(investor_id) + 1) << _SHIFT])
+        return self.holdings[lo:hi] & _LOW
+
+    def portfolio(self, investor_id):
+        return np.unique(self._holdings(investor_id))
+
+    def round_count(self, investor_id):
+        return len(self._holdings(investor_id))
+
+    def top_coinvestors(self, investor_id, k=10):
+        ids, weights = self._row(investor_id)
+        order = np.lexsort((ids, -weights))[:k]
+        ids, weights = ids[order], weights[order]
+        mine = self.portfolio(investor_id)
+        shared, overlap = [], []
+        for other in ids:
+            theirs = self.portfolio(other)
+            common = len(np.intersect1d(mine, theirs, assume_unique=True))
+            shared.append(common)
+            overlap.append(common / (len(mine) + len(theirs) - common))
+        return pd.DataFrame({'Investor_ID': ids, 'Shared_Rounds': weights,
+                             'Shared_Startups': shared, 'Portfolio_Overlap': overlap})
+
+    # Portfolio overlap of two investors: rounds and startups each, shared, and Jaccard
+    def overlap(self, a, b):
+        mine, theirs = self.portfolio(a), self.portfolio(b)
+        common = len(np.intersect1d(mine, theirs, assume_unique=True))
+        union = len(mine) + len(theirs) - common
+        return {
+            'rounds_a': self.round_count(a), 'rounds_b': self.round_count(b),
+            'shared_rounds': self.shared_rounds(a, b),
+            'startups_a': len(mine), 'startups_b': len(theirs), 'shared_startups': common,
+            'jaccard': common / union if union else 0.0,
+        }
+
+    # Strongest links across the network, each pair once
+    def top_pairs(self, k=10):
+        once = np.flatnonzero((self.keys >> _SHIFT) < (self.keys & _LOW))
+        if len(once) > k:
+            once = once[np.argpartition(-self.weights[once], k - 1)[:k]]
+        once = once[np.lexsort((self.keys[once], -self.weights[once]))]
+        return pd.DataFrame({'Investor_A': self.keys[once] >> _SHIFT, 'Investor_B': self.keys[once] & _LOW,
+                             'Shared_Rounds': self.weights[once]})
+
+    # Investors with the most distinct co-investors
+    def most_connected(self, k=10):
+        ids, degree = np.unique(self.keys >> _SHIFT, return_counts=True)
+        top = np.lexsort((ids, -degree))[:k]
+        return pd.DataFrame({'Investor_ID': ids[top], 'Co_Investors': degree[top]})
+
+    def syndicate_sizes(self):
+        _, per_round = np.unique(self.members >> _SHIFT, return_counts=True)
+        sizes, rounds = np.unique(per_round, return_counts=True)
+        return pd.DataFrame({'Syndicate_Size': sizes, 'Rounds': rounds})
+
+    def summary(self):
+        _, per_round = np.unique(self.members >> _SHIFT, return_counts=True)
+        return {
+            'investors': len(np.unique(self.holdings >> _SHIFT)),
+            'rounds': len(per_round),
+            'links': len(self.keys) // 2,
+            'avg_syndicate': float(per_round.mean()) if len(per_round) else 0.0,
+            'max_syndicate': int(per_round.max()) if len(per_round) else 0,
+        }
+
+
+class CoInvestNetwork:
+    def __init__(self, refresh_every=30, full_reload_every=900):
+        self.refresh_every = refresh_every
+        self.full_reload_every = full_reload_every
+        self._index = None
+        self._change_log = None     # whether db/change_log.sql is installed, once checked
+        self._checked_at = 0.0
+        self._stale = set()
+        self._stale_lock = threading.Lock()   # writers only take this one, never the load lock
+        self._lock = threading.Lock()
+        self._stats = {'loads': 0, 'patches': 0, 'rounds_patched': 0, 'load_ms': 0.0, 'patch_ms': 0.0}
+        query_cache.add_listener(self._on_write)
+
+    def _on_write(self, tables):
+        with self._stale_lock:
+            self._stale |= tables & WATCHED_TABLES
+
+    def _take_stale(self):
+        with self._stale_lock:
+            stale, self._stale = self._stale, set()
+        return stale
+
+    def _load(self):
+        start = time.perf_counter()
+        if self._change_log is None:
+            self._change_log = change_log_installed()
+        # Watermark first: anything logged while the select runs is applied again next time
+        watermark, seen = settled_watermark() if self._change_log else (0, frozenset())
+        index = CoInvestIndex.build(read_df(MEMBERS_QUERY, ttl=0), watermark, seen)
+        self._stats['loads'] += 1
+        self._stats['load_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        return index
+
+    def _fetch(self, round_ids):
+        ids = sorted(round_ids)
+        frames = []
+        for start in range(0, len(ids), FETCH_CHUNK):
+            chunk = ids[start:start + FETCH_CHUNK]
+            frames.append(read_df(f"{MEMBERS_QUERY} WHERE fri.Round_ID IN ({', '.join(['%s'] * len(chunk))})",
+                                  tuple(chunk), ttl=0))
+        return pd.concat(frames, ignore_index=True)
+
+    def _patch(self, index):
+        max_id, min_id = log_bounds()
+        if max_id <= index.watermark:
+            return index
+        # Entries after our watermark were pruned, or too many changed to be worth patching
+        if (min_id is not None and index.watermark and min_id > index.watermark) or \
+                max_id - index.watermark > CHANGE_FEED_CONFIG['max_changes']:
+            return self._load()
+        start = time.perf_counter()
+        changes, watermark, seen = new_changes(index.watermark, index.seen, max_id)
+        changes = changes[changes['Table_Name'].isin(ROUND_TABLES)]
+        round_ids = set(changes['Row_ID'].astype(int))
+        if not round_ids:
+            index.watermark, index.seen = watermark, seen
+            return index
+        index = index.patch(round_ids, self._fetch(round_ids), watermark, seen)
+        self._stats['patches'] += 1
+        self._stats['rounds_patched'] += len(round_ids)
+        self._stats['patch_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        return index
+
+    def index(self):
+        with self._lock:
+            stale = self._take_stale()
+            now = time.monotonic()
+            index = self._index
+            try:
+                if index is None or now - index.loaded_at > self.full_reload_every:
+                    index = self._load()
+                elif self._change_log and (stale or now - self._checked_at > self.refresh_every):
+                    index = self._patch(index)
+                elif stale:
+                    index = self._load()
+            except Exception:
+                # Try again on the next call
+                self._on_write(stale)
+                raise
+            self._index = index
+            self._checked_at = now
+            return index
+
+    def stats(self):
+        index = self._index
+        return {
+            **self._stats,
+            **(index.summary() if index is not None else {}),
+            'watermark': 0 if index is None else index.watermark,
+            'change_log': bool(self._change_log),
+            'memory_mb': 0.0 if index is None else round(index.nbytes() / 1024 / 1024, 2),
+        }
+
+
+_network = None
+_network_lock = threading.Lock()
+
+
+def get_network():
+    global _network
+    with _network_lock:
+        if _network is None:
+            _network = CoInvestNetwork(COINVEST_CONFIG['refresh_every'], COINVEST_CONFIG['full_reload_every'])
+        return _network
+
+
+# Page-side: the current index, or None after showing why it is unavailable
+def load_network():
+    try:
+        return get_network().index()
+    except Exception as e:
+        st.error(f"❌ Co-investment network unavailable: {e}")
+        return None
+
+
+# {id column: name column} -> a copy of `df` with each name column after its id column
+def with_names(df, columns):
+    ids = sorted({int(i) for column in columns for i in df[column]})
+    if not ids:
+        return df
+    names = execute_query(NAMES_QUERY.format(', '.join(['%s'] * len(ids))), tuple(ids))
+    names = dict(zip(names['Investor_ID'].astype(int), names['Name'])) if names is not None else {}
+    out = df.copy()
+    for id_column, name_column in columns.items():
+        out.insert(out.columns.get_loc(id_column) + 1, name_column,
+                   [names.get(int(i), f"#{int(i)}") for i in out[id_column]])
+    return out
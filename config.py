@@ -17,5 +17,82 @@ DB_CONFIG = {
     'database': 'mini_project'
 }
 
+# Connection pool config (shared by every Streamlit session in the process)
+POOL_CONFIG = {
+    'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+    'max_lifetime': 1800,   # seconds before a connection is closed and replaced
+    'ping_after': 30,       # idle seconds after which a borrowed connection is pinged first
+    'acquire_timeout': 10,  # seconds to wait for a free connection before failing
+    'max_prepared': 64      # prepared statements kept per connection (statements.py), LRU
+}
+
+# Concurrent page loads (loader.py)
+LOADER_CONFIG = {
+    'timeout': 10           # seconds per query unless the page sets its own
+}
+
+# Query result cache config
+CACHE_CONFIG = {
+    'max_bytes': int(os.getenv('QUERY_CACHE_MB', 64)) * 1024 * 1024,
+    'default_ttl': 300      # seconds; pass ttl=0 to execute_query to bypass the cache
+}
+
+# Built Plotly figures reused while their data is unchanged (chart_cache.py)
+CHART_CACHE_CONFIG = {
+    'max_bytes': int(os.getenv('CHART_CACHE_MB', 16)) * 1024 * 1024
+}
+
+# TTL for lookup lists (countries, cities, industries) the app never writes
+LOOKUP_TTL = 3600
+
+# Query instrumentation (instrumentation.py); set QUERY_LOG_PATH to also append JSON lines
+INSTRUMENTATION_CONFIG = {
+    'ring_size': 1000,      # most recent queries kept in memory
+    'log_path': os.getenv('QUERY_LOG_PATH') or None,
+    'slow_ms': int(os.getenv('SLOW_QUERY_MS', 500))
+}
+
+# In-process columnar engine for the Analytics page (analytics_engine.py); off by default
+ANALYTICS_ENGINE_CONFIG = {
+    'enabled': os.getenv('ANALYTICS_ENGINE', '0') == '1',
+    'refresh_every': 30,        # seconds between checks for rounds written outside the app
+    'full_reload_every': 900    # seconds; catches edits to startups/cities made outside the app
+}
+
+# Cached frames patched from change_log (change_feed.py, db/change_log.sql)
+CHANGE_FEED_CONFIG = {
+    'refresh_every': 30,        # seconds between change_log polls when the app has not written
+    'max_changes': 5000,        # more log entries than this since the last refresh -> full reload
+    'gap_grace': 60             # seconds a gap in Change_IDs is waited on (a transaction still committing)
+}
+
+# Investor co-investment network (coinvest.py), patched from change_log when it is installed
+COINVEST_CONFIG = {
+    'refresh_every': 30,        # seconds between change_log polls when the app has not written
+    'full_reload_every': 3600   # seconds; rebuilds from funding_round_investors regardless
+}
+
+# Acquisition lineage (acquisition_graph.py): an in-process graph instead of recursive CTEs
+ACQUISITION_GRAPH_CONFIG = {
+    'cached': os.getenv('ACQUISITION_GRAPH_CACHE', '1') == '1',
+    'refresh_every': 30         # seconds; rebuild interval when db/change_log.sql is not installed
+}
+
+# Values allowed by the CHECK constraints in db/schema.sql
+FUNDING_STAGES = ['Seed', 'Series A', 'Series B', 'Series C', 'Series D', 'Series E',
+                  'Series F', 'Series G', 'Series H', 'Series J', 'IPO']
+FOUNDED_YEAR_RANGE = (1996, 2025)
+
+# Rows per transaction for bulk_import.py
+IMPORT_CHUNK_SIZE = int(os.getenv('IMPORT_CHUNK_SIZE', 5000))
+
+# Streaming exports (export.py)
+EXPORT_CONFIG = {
+    'dir': os.getenv('EXPORT_DIR', 'exports'),
+    'chunk_size': int(os.getenv('EXPORT_CHUNK_SIZE', 50000)),  # rows fetched and written at a time
+    'download_mb': 200,     # larger files are left on disk instead of offered for download
+    'keep_hours': int(os.getenv('EXPORT_KEEP_HOURS', 24))  # the app deletes its exports older than this
+}
+
 APP_TITLE = "Indian Startup Ecosystem Analytics Platform"
 APP_ICON = ""
@@ -0,0 +1,175 @@
+# dashboard.py
+import argparse
+import time
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from db import get_pool, read_df
+from loader import Load, load_all
+
+# All four headline numbers in a single statement / round-trip
+METRICS_QUERY = """
+SELECT
+    (SELECT COUNT(*) FROM startups) AS Total_Startups,
+    (SELECT COALESCE(SUM(Total_Funding), 0) FROM stage_funding_summary) AS Total_Funding,
+    (SELECT COUNT(*) FROM investors) AS Total_Investors,
+    (SELECT COUNT(*) FROM acquisitions) AS Total_Acquisitions
+"""
+
+RECENT_ROUNDS_QUERY = """
+SELECT s.Name AS Startup, fr.Date, fr.Amount, fr.Stage
+FROM funding_rounds fr
+JOIN startups s ON fr.Startup_ID = s.Startup_ID
+ORDER BY fr.Date DESC
+LIMIT 10
+"""
+
+# The same rows when at least RECENT_ROUNDS of them are dated on or after the bound. With
+# funding_rounds partitioned by year (db/partitioning.sql) only the partitions from the
+# bound on are read, instead of the newest rows of every year's partition.
+RECENT_ROUNDS_SINCE_QUERY = """
+SELECT s.Name AS Startup, fr.Date, fr.Amount, fr.Stage
+FROM funding_rounds fr
+JOIN startups s ON fr.Startup_ID = s.Startup_ID
+WHERE fr.Date >= %s
+ORDER BY fr.Date DESC
+LIMIT 10
+"""
+RECENT_ROUNDS = 10
+
+INDUSTRY_DISTRIBUTION_QUERY = """
+SELECT i.Sector, COALESCE(SUM(f.Startups), 0) as Count
+FROM industries i
+LEFT JOIN industry_funding_summary f ON i.Industry_ID = f.Industry_ID
+GROUP BY i.Sector
+ORDER BY Count DESC
+"""
+
+STAGE_FUNDING_QUERY = """
+SELECT Stage, Total_Funding as Total
+FROM stage_funding_summary
+WHERE Rounds > 0
+ORDER BY Total DESC
+"""
+
+DASHBOARD_QUERIES = {
+    'metrics': METRICS_QUERY,
+    'recent_rounds': RECENT_ROUNDS_QUERY,
+    'industry_distribution': INDUSTRY_DISTRIBUTION_QUERY,
+    'stage_funding': STAGE_FUNDING_QUERY,
+}
+
+# Seconds each dashboard query may take before it is cancelled and its section skipped
+DASHBOARD_TIMEOUT = 5
+
+
+@dataclass
+class DashboardSnapshot:
+    total_startups: int
+    total_funding: float
+    total_investors: int
+    total_acquisitions: int
+    recent_rounds: pd.DataFrame          # None if its query failed or timed out
+    industry_distribution: pd.DataFrame
+    stage_funding: pd.DataFrame
+    load_ms: float
+    failures: list = field(default_factory=list)   # loader.LoadResult of each section left out
+
+
+# Date of the oldest recent round last shown. Later loads read only rounds from then on; new
+# rounds are dated later, so that still finds the newest ten unless some were deleted or
+# moved earlier, in which case the result is short and the unbounded query runs instead.
+_recent_since = None
+
+
+def _recent_rounds_load(ttl, timeout):
+    if _recent_since is None:
+        return Load(RECENT_ROUNDS_QUERY, ttl=ttl, timeout=timeout)
+    return Load(RECENT_ROUNDS_SINCE_QUERY, (_recent_since,), ttl=ttl, timeout=timeout)
+
+
+def _settle_recent_rounds(results, ttl, timeout):
+    global _recent_since
+    result = results['recent_rounds']
+    if result.ok and len(result.df) < RECENT_ROUNDS and _recent_since is not None:
+        _recent_since = None
+        result = results['recent_rounds'] = load_all({'recent_rounds': _recent_rounds_load(ttl, timeout)})['recent_rounds']
+    if result.ok:
+        dates = result.df['Date'].dropna()
+        if len(dates) == RECENT_ROUNDS:
+            _recent_since = dates.min()
+
+
+# Independent reads run side by side (loader.py); the metrics are required, the rest optional
+def load_dashboard(ttl=None, timeout=DASHBOARD_TIMEOUT):
+    start = time.perf_counter()
+    loads = {name: Load(query, ttl=ttl, timeout=timeout) for name, query in DASHBOARD_QUERIES.items()}
+    loads['recent_rounds'] = _recent_rounds_load(ttl, timeout)
+    results = load_all(loads)
+    if not results['metrics'].ok:
+        raise results['metrics'].error or TimeoutError(results['metrics'].message())
+    _settle_recent_rounds(results, ttl, timeout)
+    frames = {name: result.df for name, result in results.items()}
+
+    metrics = frames['metrics'].iloc[0]
+    return DashboardSnapshot(
+        total_startups=int(metrics['Total_Startups']),
+        total_funding=float(metrics['Total_Funding'] or 0),
+        total_investors=int(metrics['Total_Investors']),
+        total_acquisitions=int(metrics['Total_Acquisitions']),
+        recent_rounds=frames['recent_rounds'],
+        industry_distribution=frames['industry_distribution'],
+        stage_funding=frames['stage_funding'],
+        load_ms=(time.perf_counter() - start) * 1000,
+        failures=[result for result in results.values() if not result.ok],
+    )
+
+
+# The pre-snapshot path: four scalar statements on one connection, then three
+# more queries one after another
+def load_dashboard_sequential():
+    conn = get_pool().acquire()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM startups")
+        cursor.fetchone()
+        cursor.execute("SELECT COALESCE(SUM(Amount), 0) FROM funding_rounds")
+        cursor.fetchone()
+        cursor.execute("SELECT COUNT(*) FROM investors")
+        cursor.fetchone()
+        cursor.execute("SELECT COUNT(*) FROM acquisitions")
+        cursor.fetchone()
+        cursor.close()
+    finally:
+        conn.close()
+    for query in (RECENT_ROUNDS_QUERY, INDUSTRY_DISTRIBUTION_QUERY, STAGE_FUNDING_QUERY):
+        read_df(query, ttl=0)
+
+
+def benchmark(runs=20):
+    def timed(fn):
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        return pd.Series(samples)
+
+    # Warm the pool so both paths reuse connections
+    load_dashboard(ttl=0)
+    results = {
+        'sequential': timed(load_dashboard_sequential),
+        'snapshot': timed(lambda: load_dashboard(ttl=0)),
+    }
+    return pd.DataFrame({
+        name: {'mean_ms': s.mean(), 'p50_ms': s.median(), 'p95_ms': s.quantile(0.95), 'max_ms': s.max()}
+        for name, s in results.items()
+    }).T.round(2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dashboard data loading")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    print(benchmark(args.runs).to_string())
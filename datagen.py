@@ -0,0 +1,228 @@
+# datagen.py
+# Reproducible synthetic datasets at benchmark scale. Every row satisfies the schema:
+# chk_stage, Amount > 0, Founded_Year 1996-2025, foreign keys, unique names, and no
+# self-acquisitions. Row counts of the other tables follow the number of funding rounds.
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from config import FUNDING_STAGES, FOUNDED_YEAR_RANGE
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+# Parent tables first; loaders insert in this order and delete in reverse
+TABLE_ORDER = ['countries', 'cities', 'industries', 'startups', 'founders', 'investors',
+               'funding_rounds', 'funding_round_investors', 'startup_milestones', 'acquisitions']
+
+# Share of acquisitions whose acquirer is an earlier acquisition's target
+ROLLUP_SHARE = 0.6
+STAGE_WEIGHTS = [0.30, 0.25, 0.16, 0.10, 0.07, 0.04, 0.03, 0.02, 0.01, 0.01, 0.01]
+STAGE_BASE_AMOUNT = dict(zip(FUNDING_STAGES, [2e7, 8e7, 3e8, 8e8, 1.5e9, 3e9, 5e9, 8e9, 1e10, 1.5e10, 2e10]))
+INVESTOR_TYPES = ["VC Firm", "Angel", "PE Firm", "Corporate VC", "Bank"]
+ROLES = ["CEO", "CTO", "COO", "Co-Founder", "CFO"]
+MILESTONES = ["Product launch", "Crossed 1M users", "Profitability", "International expansion", "Unicorn status"]
+LAST_DATE = pd.Timestamp(f"{FOUNDED_YEAR_RANGE[1]}-12-31")
+
+
+def scale_rows(scale):
+    return SCALES[scale] if scale in SCALES else int(scale)
+
+
+def _dates_after(rng, years, end=LAST_DATE):
+    # A uniformly random date between Jan 1 of each year and `end`
+    start = pd.to_datetime(pd.Series(years).astype(str) + "-01-01")
+    span = (end - start).dt.days.to_numpy()
+    offset = (rng.random(len(years)) * (span + 1)).astype(int)
+    return (start + pd.to_timedelta(offset, unit='D')).dt.date
+
+
+def generate(rounds, seed=42):
+    rng = np.random.default_rng(seed)
+    n_startups = max(100, rounds // 4)
+    n_investors = max(50, rounds // 25)
+    n_cities = 60
+    n_industries = 48
+    low, high = FOUNDED_YEAR_RANGE
+
+    countries = pd.DataFrame({
+        'Country_ID': np.arange(1, 21),
+        'Name': ['India'] + [f"Country {i}" for i in range(2, 21)],
+    })
+
+    cities = pd.DataFrame({
+        'City_ID': np.arange(1, n_cities + 1),
+        'Name': [f"City {i}" for i in range(1, n_cities + 1)],
+        'State': [f"State {i % 28 + 1}" for i in range(n_cities)],
+        # Most cities are Indian
+        'Country_ID': np.where(rng.random(n_cities) < 0.8, 1, rng.integers(2, 21, n_cities)),
+    })
+
+    industries = pd.DataFrame({
+        'Industry_ID': np.arange(1, n_industries + 1),
+        'Sector': [f"Sector {i // 4 + 1}" for i in range(n_industries)],
+        'Sub_Sector': [f"Sub-sector {i % 4 + 1}" for i in range(n_industries)],
+    })
+
+    startup_ids = np.arange(1, n_startups + 1)
+    founded = rng.integers(low, high + 1, n_startups)
+    startups = pd.DataFrame({
+        'Startup_ID': startup_ids,
+        'Name': [f"Startup {i:07d}" for i in startup_ids],
+        'Founded_Year': founded,
+        'City_ID': pd.array(np.where(rng.random(n_startups) < 0.95, rng.integers(1, n_cities + 1, n_startups), 0), dtype='Int64'),
+        'Industry_ID': pd.array(np.where(rng.random(n_startups) < 0.95, rng.integers(1, n_industries + 1, n_startups), 0), dtype='Int64'),
+    })
+    startups.loc[startups['City_ID'] == 0, 'City_ID'] = pd.NA
+    startups.loc[startups['Industry_ID'] == 0, 'Industry_ID'] = pd.NA
+
+    n_founders = int(n_startups * 1.5)
+    founders = pd.DataFrame({
+        'Founder_ID': np.arange(1, n_founders + 1),
+        'Name': [f"Founder {i}" for i in range(1, n_founders + 1)],
+        'Startup_ID': np.concatenate([startup_ids, rng.integers(1, n_startups + 1, n_founders - n_startups)]),
+        'Role': rng.choice(ROLES, n_founders),
+    })
+    founders['Linkedin_url'] = "https://linkedin.com/in/founder-" + founders['Founder_ID'].astype(str)
+
+    investors = pd.DataFrame({
+        'Investor_ID': np.arange(1, n_investors + 1),
+        'Name': [f"Investor {i:06d}" for i in range(1, n_investors + 1)],
+        'Type': rng.choice(INVESTOR_TYPES, n_investors),
+        'Country_ID': rng.integers(1, 21, n_investors),
+    })
+
+    # Mostly uniform, plus a long tail of a few startups that raise many rounds
+    tail = np.minimum((rng.pareto(1.2, rounds) * n_startups / 20).astype(int), n_startups - 1)
+    owner = np.where(rng.random(rounds) < 0.7, rng.integers(0, n_startups, rounds), tail)
+    round_startups = rng.permutation(startup_ids)[owner]
+    stages = rng.choice(FUNDING_STAGES, rounds, p=STAGE_WEIGHTS)
+    base = pd.Series(stages).map(STAGE_BASE_AMOUNT).to_numpy()
+    funding_rounds = pd.DataFrame({
+        'Round_ID': np.arange(1, rounds + 1),
+        'Startup_ID': round_startups,
+        'Date': _dates_after(rng, founded[round_startups - 1]),
+        'Amount': np.maximum(np.round(base * rng.lognormal(0, 0.6, rounds), 2), 1.0),
+        'Stage': stages,
+    })
+
+    per_round = rng.integers(1, 5, rounds)
+    funding_round_investors = pd.DataFrame({
+        'Round_ID': np.repeat(funding_rounds['Round_ID'].to_numpy(), per_round),
+        'Investor_ID': rng.integers(1, n_investors + 1, int(per_round.sum())),
+    }).drop_duplicates(ignore_index=True)
+
+    n_milestones = n_startups * 2
+    milestone_owner = rng.integers(1, n_startups + 1, n_milestones)
+    startup_milestones = pd.DataFrame({
+        'Milestone_ID': np.arange(1, n_milestones + 1),
+        'Startup_ID': milestone_owner,
+        'Description': rng.choice(MILESTONES, n_milestones),
+        'Date': _dates_after(rng, founded[milestone_owner - 1]),
+    })
+
+    n_acquisitions = max(10, n_startups // 50)
+    acquirer = rng.integers(1, n_startups + 1, n_acquisitions)
+    # Shift by 1..n-1 so the target is never the acquirer
+    target = (acquirer - 1 + rng.integers(1, n_startups, n_acquisitions)) % n_startups + 1
+    # Roll-ups: some acquirers are an earlier acquisition's target, so lineages run several levels
+    rolled = np.flatnonzero(rng.random(n_acquisitions) < ROLLUP_SHARE)
+    rolled = rolled[rolled > 0]
+    acquirer[rolled] = target[(rng.random(len(rolled)) * rolled).astype(int)]
+    target[acquirer == target] = target[acquirer == target] % n_startups + 1
+    acquisitions = pd.DataFrame({
+        'AcquisitionID': np.arange(1, n_acquisitions + 1),
+        'Acquirer_Startup_ID': acquirer,
+        'Target_Startup_ID': target,
+        'Date': _dates_after(rng, np.maximum(founded[acquirer - 1], founded[target - 1])),
+        'Amount': np.round(rng.lognormal(20, 1, n_acquisitions), 2),
+    })
+
+    return {
+        'countries': countries,
+        'cities': cities,
+        'industries': industries,
+        'startups': startups,
+        'founders': founders,
+        'investors': investors,
+        'funding_rounds': funding_rounds,
+        'funding_round_investors': funding_round_investors,
+        'startup_milestones': startup_milestones,
+        'acquisitions': acquisitions,
+    }
+
+
+# The rollups rebuild_funding_summaries() produces, for stand-in databases without triggers
+def summaries(data):
+    rounds = data['funding_rounds']
+    startups = data['startups']
+
+    # 'size' like rebuild_funding_summaries' COUNT(*): a round without an Amount still counts
+    per_startup = rounds.groupby('Startup_ID')['Amount'].agg(['size', 'sum', 'min', 'max'])
+    sfs = startups[['Startup_ID']].join(per_startup, on='Startup_ID')
+    sfs = pd.DataFrame({
+        'Startup_ID': sfs['Startup_ID'],
+        'Rounds': sfs['size'].fillna(0).astype(int),
+        'Total_Funding': sfs['sum'].fillna(0.0),
+        'Min_Funding': sfs['min'],
+        'Max_Funding': sfs['max'],
+    })
+
+    stage = rounds.groupby('Stage')['Amount'].agg(['size', 'sum', 'min', 'max']).reset_index()
+    stage.columns = ['Stage', 'Rounds', 'Total_Funding', 'Min_Funding', 'Max_Funding']
+
+    def rollup(dim, id_col):
+        joined = startups[['Startup_ID', id_col]].merge(sfs, on='Startup_ID')
+        grouped = joined.groupby(id_col).agg(
+            Startups=('Startup_ID', 'count'), Rounds=('Rounds', 'sum'), Total_Funding=('Total_Funding', 'sum'),
+            Min_Funding=('Min_Funding', 'min'), Max_Funding=('Max_Funding', 'max'))
+        out = dim[[id_col]].join(grouped, on=id_col)
+        out[['Startups', 'Rounds']] = out[['Startups', 'Rounds']].fillna(0).astype(int)
+        out['Total_Funding'] = out['Total_Funding'].fillna(0.0)
+        return out
+
+    # NULL industry/city are stored as 0 (part of the key); rounds without a Date are left out
+    dated = rounds.dropna(subset=['Date']).merge(startups[['Startup_ID', 'Industry_ID', 'City_ID']], on='Startup_ID', how='left')
+    dated['Month'] = pd.to_datetime(dated['Date']).dt.to_period('M').dt.to_timestamp()
+    dated[['Industry_ID', 'City_ID']] = dated[['Industry_ID', 'City_ID']].fillna(0).astype(int)
+    monthly = dated.groupby(['Month', 'Industry_ID', 'City_ID', 'Stage']).agg(
+        Rounds=('Round_ID', 'count'), Total_Funding=('Amount', 'sum')).reset_index()
+    monthly['Month'] = monthly['Month'].dt.date
+
+    return {
+        'startup_funding_summary': sfs,
+        'stage_funding_summary': stage,
+        'industry_funding_summary': rollup(data['industries'], 'Industry_ID'),
+        'city_funding_summary': rollup(data['cities'], 'City_ID'),
+        'monthly_funding_summary': monthly,
+    }
+
+
+def write_files(data, out_dir, fmt='csv'):
+    os.makedirs(out_dir, exist_ok=True)
+    for name, df in data.items():
+        path = os.path.join(out_dir, f"{name}.{fmt}")
+        if fmt == 'parquet':
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+    return out_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a schema-valid synthetic dataset")
+    parser.add_argument("--rounds", default="10k", help="funding rounds: 10k, 100k, 1m or a number")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", required=True, help="directory for one file per table")
+    parser.add_argument("--format", choices=['csv', 'parquet'], default='csv')
+    args = parser.parse_args()
+
+    data = generate(scale_rows(args.rounds), args.seed)
+    write_files(data, args.out, args.format)
+    for name in TABLE_ORDER:
+        print(f"{name}: {len(data[name]):,} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+# db.py
+import contextvars
+import re
+import threading
+import time
+from collections import deque, OrderedDict
+
+import mysql.connector
+import streamlit as st
+
+from config import DB_CONFIG, POOL_CONFIG, CACHE_CONFIG
+from query_cache import QueryCache, read_tables, written_tables
+from instrumentation import Timer
+from materialize import frame_from_cursor
+
+
+class PoolExhaustedError(Exception):
+    pass
+
+
+class DatabaseUnavailableError(Exception):
+    pass
+
+
+class QueryCancelledError(Exception):
+    pass
+
+
+# MySQL error numbers for a statement stopped by MAX_EXECUTION_TIME and by KILL QUERY
+QUERY_TIMEOUT = 3024
+QUERY_INTERRUPTED = 1317
+
+_LEADING_SELECT = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+
+
+# Adds a MAX_EXECUTION_TIME hint so the server stops the SELECT itself after `ms`
+def with_max_execution_time(query, ms):
+    return _LEADING_SELECT.sub(f"SELECT /*+ MAX_EXECUTION_TIME({int(ms)}) */", query, count=1)
+
+
+def _kill_query(connection_id):
+    # Own connection: the pool may be full of the very queries being cancelled
+    try:
+        conn = mysql.connector.connect(**DB_CONFIG)
+    except mysql.connector.Error:
+        return
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"KILL QUERY {int(connection_id)}")
+        cursor.close()
+    except mysql.connector.Error:
+        pass  # already finished (unknown thread id)
+    finally:
+        conn.close()
+
+
+class CancelToken:
+    # Lets another thread stop a read_df call: before it connects, or mid-query with KILL QUERY
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connection_id = None
+        self.cancelled = False
+
+    def attach(self, connection_id):
+        with self._lock:
+            if self.cancelled:
+                raise QueryCancelledError("Cancelled before it started")
+            self._connection_id = connection_id
+
+    def detach(self):
+        with self._lock:
+            self._connection_id = None
+
+    def cancel(self):
+        # Held through the KILL, so the connection cannot be handed to anyone else meanwhile
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            if self._connection_id is not None:
+                _kill_query(self._connection_id)
+
+
+class PooledConnection:
+    # Proxy around a pooled mysql connection; close() returns it to the pool
+    def __init__(self, pool, conn, created_at):
+        self._pool = pool
+        self._conn = conn
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise mysql.connector.errors.OperationalError("Connection already returned to the pool")
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # Prepared cursor for `query`, kept with the underlying connection across borrows
+    def prepared(self, query):
+        return self._pool.prepared(self._conn, query)
+
+    def forget_prepared(self, query):
+        self._pool.forget_prepared(self._conn, query)
+
+    def close(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool._release(conn, self._created_at)
+
+    # Close instead of returning it, e.g. after a KILL QUERY may have hit it
+    def discard(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool._release(conn, self._created_at, healthy=False)
+
+
+class ConnectionPool:
+    # Process-wide pool: imported modules survive Streamlit reruns, so every session shares it
+    def __init__(self, db_config, pool_size=5, max_lifetime=1800, ping_after=30, acquire_timeout=10,
+                 max_prepared=64):
+        self.db_config = db_config
+        self.pool_size = pool_size
+        self.max_lifetime = max_lifetime
+        self.ping_after = ping_after
+        self.acquire_timeout = acquire_timeout
+        self.max_prepared = max_prepared
+
+        self._idle = deque()  # (conn, created_at, last_used)
+        self._open = 0
+        self._statements = {}  # id(conn) -> OrderedDict(sql -> (sql, prepared cursor)), LRU
+        self._cond = threading.Condition()
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'recycled': 0,
+            'ping_failures': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'wait_ms': 0.0,
+            'peak_in_use': 0,
+            'prepared': 0,
+            'prepared_reused': 0,
+        }
+
+    def _bump(self, key):
+        with self._cond:
+            self._stats[key] += 1
+
+    def _connect(self):
+        conn = mysql.connector.connect(**self.db_config)
+        self._bump('created')
+        return conn, time.monotonic()
+
+    def _discard(self, conn):
+        # Server-side statements go with the connection
+        with self._cond:
+            self._statements.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        deadline = time.monotonic() + self.acquire_timeout
+        waited_from = None
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn, created_at, last_used = self._idle.pop()
+                    break
+                if self._open < self.pool_size:
+                    self._open += 1
+                    conn = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    if waited_from is not None:
+                        self._stats['wait_ms'] += (time.monotonic() - waited_from) * 1000
+                    raise PoolExhaustedError(
+                        f"All {self.pool_size} connections busy for {self.acquire_timeout}s"
+                    )
+                if waited_from is None:
+                    waited_from = time.monotonic()
+                    self._stats['waits'] += 1
+                self._cond.wait(remaining)
+
+            if waited_from is not None:
+                self._stats['wait_ms'] += (time.monotonic() - waited_from) * 1000
+            in_use = self._open - len(self._idle)
+            self._stats['peak_in_use'] = max(self._stats['peak_in_use'], in_use)
+
+        # Validation and connecting happen outside the lock; the slot is already reserved
+        try:
+            now = time.monotonic()
+            if conn is not None and now - created_at > self.max_lifetime:
+                self._discard(conn)
+                self._bump('recycled')
+                conn = None
+            elif conn is not None and now - last_used > self.ping_after:
+                try:
+                    conn.ping(reconnect=False)
+                except mysql.connector.Error:
+                    self._discard(conn)
+                    self._bump('ping_failures')
+                    conn = None
+
+            if conn is None:
+                conn, created_at = self._connect()
+            else:
+                self._bump('reused')
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+        return PooledConnection(self, conn, created_at)
+
+    # Only the borrower touches its connection's statements, so the lock just guards the maps
+    def prepared(self, conn, query):
+        with self._cond:
+            statements = self._statements.setdefault(id(conn), OrderedDict())
+        entry = statements.get(query)
+        if entry is not None:
+            statements.move_to_end(query)
+            self._bump('prepared_reused')
+            return entry
+        if len(statements) >= self.max_prepared:
+            _, (_, oldest) = statements.popitem(last=False)
+            oldest.close()
+        # The cursor re-prepares whenever it is handed a different string object, so the
+        # first one is stored and always used for execute
+        entry = (query, conn.cursor(prepared=True))
+        statements[query] = entry
+        self._bump('prepared')
+        return entry
+
+    def forget_prepared(self, conn, query):
+        with self._cond:
+            statements = self._statements.get(id(conn), {})
+        entry = statements.pop(query, None)
+        if entry is not None:
+            try:
+                entry[1].close()
+            except mysql.connector.Error:
+                pass
+
+    def _release(self, conn, created_at, healthy=True):
+        try:
+            # End any open transaction so the next borrower gets a fresh snapshot
+            if healthy and conn.in_transaction:
+                conn.rollback()
+        except mysql.connector.Error:
+            healthy = False
+
+        with self._cond:
+            if healthy:
+                self._idle.append((conn, created_at, time.monotonic()))
+            else:
+                self._open -= 1
+            self._cond.notify()
+        if not healthy:
+            self._discard(conn)
+
+    def close_all(self):
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._open -= len(idle)
+        for conn, _, _ in idle:
+            self._discard(conn)
+
+    def stats(self):
+        with self._cond:
+            stats = dict(self._stats)
+            stats['size'] = self.pool_size
+            stats['open'] = self._open
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = self._open - len(self._idle)
+        # The C extension parses rows much faster; connect() uses it whenever it is installed
+        stats['driver'] = 'c_ext' if mysql.connector.HAVE_CEXT and not self.db_config.get('use_pure') else 'pure'
+        stats['wait_ms'] = round(stats['wait_ms'], 1)
+        return stats
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DB_CONFIG, **POOL_CONFIG)
+    return _pool
+
+
+def pool_stats():
+    return get_pool().stats()
+
+
+# Result cache shared by all sessions; our own writes invalidate it table by table
+query_cache = QueryCache(**CACHE_CONFIG)
+
+
+def cache_stats():
+    return query_cache.stats()
+
+
+# SELECTs sent to MySQL vs served from the cache, process-wide
+_query_counts = {'executed': 0, 'cached': 0}
+_counts_lock = threading.Lock()
+# The same, for the current script run only (other sessions' reruns do not add to it)
+_run_counts = contextvars.ContextVar('run_query_counts', default=None)
+
+
+def _count_query(kind):
+    run = _run_counts.get()
+    with _counts_lock:
+        _query_counts[kind] += 1
+        if run is not None:
+            run[kind] += 1
+
+
+# Starts this run's counts; the returned dict keeps counting, including queries from loader
+# threads started with instrumentation.with_current_context
+def start_run_counts():
+    counts = {'executed': 0, 'cached': 0}
+    _run_counts.set(counts)
+    return counts
+
+
+def query_counts():
+    with _counts_lock:
+        return dict(_query_counts)
+
+
+def _acquire():
+    try:
+        return get_pool().acquire()
+    except mysql.connector.Error as err:
+        raise DatabaseUnavailableError(err) from err
+
+
+def _report_unavailable(err):
+    if isinstance(err, PoolExhaustedError):
+        st.error(f"❌ Database Busy: {err}")
+    else:
+        st.error(f"❌ Database Connection Failed: {err}")
+        st.info("Make sure:\n- MySQL is running\n- Password in .env is correct\n- Database is 'mini_project'")
+
+
+# Database connection (pooled - close() hands the connection back)
+def get_connection():
+    try:
+        return _acquire()
+    except (PoolExhaustedError, DatabaseUnavailableError) as err:
+        _report_unavailable(err)
+        return None
+
+
+# Runs `query` on a cursor, or on the connection's prepared statement for it when prepared=True.
+# Reads return (DataFrame, rowcount); writes (fetch=False) commit and return (None, rowcount).
+def _run(conn, query, params, prepared, timer, fetch=True, dtypes=None, max_ms=None):
+    if max_ms:
+        query = with_max_execution_time(query, max_ms)
+    if prepared:
+        query, cursor = conn.prepared(query)
+    else:
+        cursor = conn.cursor()
+    try:
+        with timer.phase('execute'):
+            cursor.execute(query, params or ())
+            if not fetch:
+                conn.commit()
+        if not fetch:
+            return None, cursor.rowcount
+        with timer.phase('fetch'):
+            df = frame_from_cursor(cursor, dtypes)
+        return df, cursor.rowcount
+    except mysql.connector.Error:
+        if prepared:
+            # Re-prepare next time; the statement may be what failed
+            conn.forget_prepared(query)
+        raise
+    finally:
+        if not prepared:
+            cursor.close()
+
+
+# Raising variant of execute_query, safe to call off the Streamlit script thread.
+# dtypes declares column dtypes beyond the defaults (materialize.py), e.g. {'Date': 'datetime64'}.
+# max_ms has MySQL stop a SELECT after that long; cancel (a CancelToken) lets another thread stop it.
+def read_df(query, params=None, ttl=None, prepared=False, dtypes=None, max_ms=None, cancel=None):
+    timer = Timer(query)
+    key = query_cache.make_key(query, params, dtypes)
+    df = query_cache.get(key)
+    if df is not None:
+        _count_query('cached')
+        timer.record.source = 'cache'
+        timer.finish(rows=len(df))
+        return df.copy(deep=False)
+
+    _count_query('executed')
+    tables = read_tables(query)
+    version = query_cache.version(tables)
+    try:
+        if cancel is not None and cancel.cancelled:
+            raise QueryCancelledError("Cancelled before it started")
+        with timer.phase('connect'):
+            conn = _acquire()
+        try:
+            if cancel is not None:
+                cancel.attach(conn.connection_id)
+            df, _ = _run(conn, query, params, prepared, timer, dtypes=dtypes, max_ms=max_ms)
+        finally:
+            if cancel is not None:
+                cancel.detach()
+            if cancel is not None and cancel.cancelled:
+                conn.discard()
+            else:
+                conn.close()
+    except Exception as err:
+        timer.finish(error=err)
+        raise
+    nbytes = int(df.memory_usage(deep=True).sum())
+    timer.finish(rows=len(df), nbytes=nbytes)
+    query_cache.put(key, df, tables, ttl=ttl, version=version, nbytes=nbytes)
+    return df.copy(deep=False)
+
+
+def execute_query(query, params=None, ttl=None, prepared=False, dtypes=None):
+    try:
+        return read_df(query, params, ttl, prepared, dtypes)
+    except (PoolExhaustedError, DatabaseUnavailableError) as err:
+        _report_unavailable(err)
+        return None
+    except Exception as e:
+        st.error(f"❌ Query Error: {e}")
+        return None
+
+
+def execute_insert_update(query, params=None, prepared=False):
+    timer = Timer(query, source='write')
+    try:
+        with timer.phase('connect'):
+            conn = get_connection()
+        if conn is None:
+            return False
+        try:
+            _, rows = _run(conn, query, params, prepared, timer, fetch=False)
+        finally:
+            conn.close()
+        timer.finish(rows=rows)
+        query_cache.invalidate(written_tables(query))
+        return True
+    except mysql.connector.Error as err:
+        timer.finish(error=err)
+        st.error(f"❌ Operation Failed: {err}")
+        return False
@@ -0,0 +1,195 @@
+-- Change capture for funding_rounds, funding_round_investors, startups and acquisitions.
+-- Every insert, update and delete appends (table, key, op) to change_log, so cached copies
+-- in the app can fetch just the rows changed since the last Change_ID they saw
+-- (change_feed.py, coinvest.py).
+-- Load after summary_tables.sql.
+
+CREATE TABLE change_log (
+    Change_ID BIGINT AUTO_INCREMENT PRIMARY KEY,
+    Table_Name VARCHAR(32) NOT NULL,
+    Row_ID INT NOT NULL,
+    Op CHAR(1) NOT NULL,            -- 'I', 'U' or 'D'
+    Changed_At TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_change_log_time (Changed_At)
+);
+
+-- Triggers on funding_rounds and acquisitions. A key change is logged as a delete of the
+-- old key and an insert of the new one.
+
+DELIMITER //
+
+CREATE TRIGGER funding_rounds_log_insert
+AFTER INSERT ON funding_rounds
+FOR EACH ROW
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('funding_rounds', NEW.Round_ID, 'I');
+END //
+
+CREATE TRIGGER funding_rounds_log_update
+AFTER UPDATE ON funding_rounds
+FOR EACH ROW
+BEGIN
+    IF OLD.Round_ID <> NEW.Round_ID THEN
+        INSERT INTO change_log (Table_Name, Row_ID, Op)
+        VALUES ('funding_rounds', OLD.Round_ID, 'D'), ('funding_rounds', NEW.Round_ID, 'I');
+    ELSE
+        INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('funding_rounds', NEW.Round_ID, 'U');
+    END IF;
+END //
+
+CREATE TRIGGER funding_rounds_log_delete
+AFTER DELETE ON funding_rounds
+FOR EACH ROW
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('funding_rounds', OLD.Round_ID, 'D');
+END //
+
+CREATE TRIGGER acquisitions_log_insert
+AFTER INSERT ON acquisitions
+FOR EACH ROW
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('acquisitions', NEW.AcquisitionID, 'I');
+END //
+
+CREATE TRIGGER acquisitions_log_update
+AFTER UPDATE ON acquisitions
+FOR EACH ROW
+BEGIN
+    IF OLD.AcquisitionID <> NEW.AcquisitionID THEN
+        INSERT INTO change_log (Table_Name, Row_ID, Op)
+        VALUES ('acquisitions', OLD.AcquisitionID, 'D'), ('acquisitions', NEW.AcquisitionID, 'I');
+    ELSE
+        INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('acquisitions', NEW.AcquisitionID, 'U');
+    END IF;
+END //
+
+CREATE TRIGGER acquisitions_log_delete
+AFTER DELETE ON acquisitions
+FOR EACH ROW
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('acquisitions', OLD.AcquisitionID, 'D');
+END //
+
+DELIMITER ;
+
+-- Triggers on startups. Foreign-key cascades do not fire triggers on the child tables, so
+-- the rounds a startup delete/rekey cascades into, and the acquisitions it sets to NULL or
+-- rekeys, are logged here while they can still be found by the old Startup_ID.
+
+DELIMITER //
+
+CREATE TRIGGER startups_log_insert
+AFTER INSERT ON startups
+FOR EACH ROW
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('startups', NEW.Startup_ID, 'I');
+END //
+
+CREATE TRIGGER startups_log_before_update
+BEFORE UPDATE ON startups
+FOR EACH ROW
+BEGIN
+    IF OLD.Startup_ID <> NEW.Startup_ID THEN
+        INSERT INTO change_log (Table_Name, Row_ID, Op)
+        SELECT 'funding_rounds', Round_ID, 'U' FROM funding_rounds WHERE Startup_ID = OLD.Startup_ID;
+
+        INSERT INTO change_log (Table_Name, Row_ID, Op)
+        SELECT 'acquisitions', AcquisitionID, 'U' FROM acquisitions
+        WHERE Acquirer_Startup_ID = OLD.Startup_ID OR Target_Startup_ID = OLD.Startup_ID;
+    END IF;
+END //
+
+CREATE TRIGGER startups_log_update
+AFTER UPDATE ON startups
+FOR EACH ROW
+BEGIN
+    IF OLD.Startup_ID <> NEW.Startup_ID THEN
+        INSERT INTO change_log (Table_Name, Row_ID, Op)
+        VALUES ('startups', OLD.Startup_ID, 'D'), ('startups', NEW.Startup_ID, 'I');
+    ELSE
+        INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('startups', NEW.Startup_ID, 'U');
+    END IF;
+END //
+
+-- Runs last among the BEFORE DELETE triggers, so a delete that prevent_startup_delete
+-- rejects logs nothing (its statement is rolled back either way)
+CREATE TRIGGER startups_log_before_delete
+BEFORE DELETE ON startups
+FOR EACH ROW
+FOLLOWS startup_summary_before_delete
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op)
+    SELECT 'funding_rounds', Round_ID, 'D' FROM funding_rounds WHERE Startup_ID = OLD.Startup_ID;
+
+    INSERT INTO change_log (Table_Name, Row_ID, Op)
+    SELECT 'acquisitions', AcquisitionID, 'U' FROM acquisitions
+    WHERE Acquirer_Startup_ID = OLD.Startup_ID OR Target_Startup_ID = OLD.Startup_ID;
+
+    INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('startups', OLD.Startup_ID, 'D');
+END //
+
+DELIMITER ;
+
+-- Triggers on funding_round_investors, logged by Round_ID (the co-investment network in
+-- coinvest.py re-reads whole rounds). Rows removed by a round delete are covered by that
+-- round's own entry; rows an investor delete/rekey cascades into are logged from investors.
+
+DELIMITER //
+
+CREATE TRIGGER fri_log_insert
+AFTER INSERT ON funding_round_investors
+FOR EACH ROW
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('funding_round_investors', NEW.Round_ID, 'I');
+END //
+
+CREATE TRIGGER fri_log_update
+AFTER UPDATE ON funding_round_investors
+FOR EACH ROW
+BEGIN
+    IF OLD.Round_ID <> NEW.Round_ID THEN
+        INSERT INTO change_log (Table_Name, Row_ID, Op)
+        VALUES ('funding_round_investors', OLD.Round_ID, 'U'), ('funding_round_investors', NEW.Round_ID, 'U');
+    ELSE
+        INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('funding_round_investors', NEW.Round_ID, 'U');
+    END IF;
+END //
+
+CREATE TRIGGER fri_log_delete
+AFTER DELETE ON funding_round_investors
+FOR EACH ROW
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op) VALUES ('funding_round_investors', OLD.Round_ID, 'D');
+END //
+
+CREATE TRIGGER investors_log_before_update
+BEFORE UPDATE ON investors
+FOR EACH ROW
+BEGIN
+    IF OLD.Investor_ID <> NEW.Investor_ID THEN
+        INSERT INTO change_log (Table_Name, Row_ID, Op)
+        SELECT 'funding_round_investors', Round_ID, 'U' FROM funding_round_investors WHERE Investor_ID = OLD.Investor_ID;
+    END IF;
+END //
+
+CREATE TRIGGER investors_log_before_delete
+BEFORE DELETE ON investors
+FOR EACH ROW
+BEGIN
+    INSERT INTO change_log (Table_Name, Row_ID, Op)
+    SELECT 'funding_round_investors', Round_ID, 'D' FROM funding_round_investors WHERE Investor_ID = OLD.Investor_ID;
+END //
+
+DELIMITER ;
+
+-- Procedure: Drops log entries older than p_keep_days. Readers whose last seen
+-- Change_ID was pruned reload in full.
+
+DELIMITER //
+
+CREATE PROCEDURE prune_change_log(IN p_keep_days INT)
+BEGIN
+    DELETE FROM change_log WHERE Changed_At < NOW() - INTERVAL p_keep_days DAY;
+END //
+
+DELIMITER ;
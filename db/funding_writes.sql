@@ -0,0 +1,78 @@
+-- Set-based funding round writes. Replaces the add_funding procedure from
+-- triggeres_procedures_functions.sql; load after it (and after summary_tables.sql).
+
+DROP PROCEDURE IF EXISTS add_funding_batch;
+DROP PROCEDURE IF EXISTS add_funding;
+
+-- Procedure: Adds many funding rounds and their investors in one transaction
+-- p_rounds: [{"round_id": 1, "startup_id": 2, "date": "2024-01-31", "amount": 5000000,
+--             "stage": "Seed", "investors": [3, 4]}, ...]
+-- Two INSERT ... SELECT statements over JSON_TABLE, however many rounds and investors.
+
+DELIMITER //
+
+CREATE PROCEDURE add_funding_batch(IN p_rounds JSON)
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+
+    START TRANSACTION;
+
+    INSERT INTO funding_rounds (Round_ID, Startup_ID, Date, Amount, Stage)
+    SELECT r.Round_ID, r.Startup_ID, r.Date, r.Amount, r.Stage
+    FROM JSON_TABLE(p_rounds, '$[*]' COLUMNS (
+        Round_ID INT PATH '$.round_id' ERROR ON EMPTY,
+        Startup_ID INT PATH '$.startup_id' ERROR ON EMPTY,
+        Date DATE PATH '$.date',
+        Amount DECIMAL(18, 2) PATH '$.amount',
+        Stage VARCHAR(50) PATH '$.stage' ERROR ON EMPTY
+    )) AS r;
+
+    INSERT INTO funding_round_investors (Round_ID, Investor_ID)
+    SELECT DISTINCT r.Round_ID, r.Investor_ID
+    FROM JSON_TABLE(p_rounds, '$[*]' COLUMNS (
+        Round_ID INT PATH '$.round_id',
+        NESTED PATH '$.investors[*]' COLUMNS (Investor_ID INT PATH '$')
+    )) AS r
+    WHERE r.Investor_ID IS NOT NULL;
+
+    COMMIT;
+END //
+
+DELIMITER ;
+
+-- Procedure: Adds a new funding round and links multiple investors atomically
+-- Same signature as before (comma-separated investor IDs); now a one-round add_funding_batch.
+
+DELIMITER //
+
+CREATE PROCEDURE add_funding(
+    IN p_round_id INT,
+    IN p_startup_id INT,
+    IN p_date DATE,
+    IN p_amount DECIMAL(18,2),
+    IN p_stage VARCHAR(50),
+    IN p_investor_ids VARCHAR(255)
+)
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SELECT 'Error: Transaction rolled back' AS Message;
+    END;
+
+    CALL add_funding_batch(JSON_ARRAY(JSON_OBJECT(
+        'round_id', p_round_id,
+        'startup_id', p_startup_id,
+        'date', p_date,
+        'amount', p_amount,
+        'stage', p_stage,
+        'investors', CAST(CONCAT('[', COALESCE(p_investor_ids, ''), ']') AS JSON)
+    )));
+
+    SELECT 'Funding round added successfully' AS Message;
+END //
+
+DELIMITER ;
@@ -0,0 +1,38 @@
+-- Secondary indexes for the queries the app runs (check with: python index_advisor.py)
+-- InnoDB already indexes every foreign-key column implicitly; the explicit
+-- indexes below replace those where a wider key serves more queries.
+
+-- funding_rounds
+-- Recent Funding Rounds (ORDER BY Date DESC LIMIT 10), Join Query ordering
+ALTER TABLE funding_rounds ADD INDEX idx_funding_date (Date);
+-- prevent_startup_delete's one-year window, per-startup totals and extrema
+-- (get_total_funding, refresh_startup_extrema, the nested query) without touching rows
+ALTER TABLE funding_rounds ADD INDEX idx_funding_startup_date (Startup_ID, Date, Amount);
+-- Per-stage totals and MIN/MAX (rebuild / refresh_stage_extrema, stage filters)
+ALTER TABLE funding_rounds ADD INDEX idx_funding_stage_amount (Stage, Amount);
+
+-- startups: industry / city rollups and joins
+ALTER TABLE startups ADD INDEX idx_startups_industry (Industry_ID);
+ALTER TABLE startups ADD INDEX idx_startups_city (City_ID);
+
+-- startup_milestones: count_milestones()
+ALTER TABLE startup_milestones ADD INDEX idx_milestones_startup (Startup_ID, Date);
+
+-- startup_funding_summary: the nested query's Max_Funding > average range
+ALTER TABLE startup_funding_summary ADD INDEX idx_sfs_max (Max_Funding);
+
+-- founders: View All sort / prefix filter by name
+ALTER TABLE founders ADD INDEX idx_founders_name (Name);
+
+-- cities: lookup lists ordered by name
+ALTER TABLE cities ADD INDEX idx_cities_name (Name);
+
+-- acquisitions: View All ordering and the Update/Delete match on (acquirer, target, date)
+ALTER TABLE acquisitions ADD INDEX idx_acquisitions_date (Date);
+ALTER TABLE acquisitions ADD INDEX idx_acquisitions_pair (Acquirer_Startup_ID, Target_Startup_ID, Date);
+
+-- funding_round_investors: rounds by investor (the PK only leads with Round_ID)
+ALTER TABLE funding_round_investors ADD INDEX idx_fri_investor (Investor_ID, Round_ID);
+
+ANALYZE TABLE funding_rounds, startups, startup_funding_summary, founders, startup_milestones, cities, acquisitions,
+    funding_round_investors;
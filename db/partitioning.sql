@@ -0,0 +1,194 @@
+-- Partitions funding_rounds by year of Date (RANGE COLUMNS), so date-bounded reads - the
+-- dashboard's recent rounds, prevent_startup_delete's one-year window, round updates and
+-- deletes by (Round_ID, Date) - only open the partitions their dates fall in.
+-- Load last, after change_log.sql and indexes.sql. Every round needs a Date first: the
+-- column becomes NOT NULL (SELECT * FROM funding_rounds WHERE Date IS NULL finds any left).
+--
+-- MySQL partitioning requires:
+--   * every unique key to include Date, so the primary key becomes (Round_ID, Date) and
+--     Round_ID uniqueness is checked by trigger;
+--   * no foreign keys to or from the table, so fk_startup_ID and fk_fri_round are dropped
+--     and enforced by the triggers below, cascades included.
+-- Unlike foreign-key cascades, the cascade triggers fire the child tables' own triggers; the
+-- funding_rounds rollup triggers (summary_tables.sql) skip rounds whose startup is already
+-- gone or rekeyed, which the startup triggers settle.
+--
+-- Writers: a round is identified by Round_ID alone only through these triggers. Upserts must
+-- update by Round_ID (bulk_import.py does): ON DUPLICATE KEY UPDATE only matches the same
+-- (Round_ID, Date), and one with a new Date is rejected as a duplicate Round_ID. Errors the
+-- triggers SIGNAL are not downgraded by LOAD DATA's IGNORE and fail the whole load;
+-- bulk_import.py then retries that batch with row-by-row inserts.
+
+ALTER TABLE funding_round_investors DROP FOREIGN KEY fk_fri_round;
+ALTER TABLE funding_rounds DROP FOREIGN KEY fk_startup_ID;
+
+ALTER TABLE funding_rounds
+    MODIFY Date DATE NOT NULL,
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (Round_ID, Date);
+
+-- Procedure 1: Partitions funding_rounds, one partition per year from the oldest round's
+-- through p_years_ahead years from now, plus p_future for anything later. The first
+-- partition also takes any older round inserted afterwards.
+
+DELIMITER //
+
+CREATE PROCEDURE partition_funding_rounds(IN p_years_ahead INT)
+BEGIN
+    DECLARE v_year INT;
+    DECLARE v_last INT DEFAULT YEAR(CURDATE()) + p_years_ahead;
+    DECLARE v_parts TEXT DEFAULT '';
+
+    SELECT COALESCE(YEAR(MIN(Date)), YEAR(CURDATE())) INTO v_year FROM funding_rounds;
+    WHILE v_year <= v_last DO
+        SET v_parts = CONCAT(v_parts, 'PARTITION p', v_year, ' VALUES LESS THAN (''', v_year + 1, '-01-01''), ');
+        SET v_year = v_year + 1;
+    END WHILE;
+
+    SET @ddl = CONCAT('ALTER TABLE funding_rounds PARTITION BY RANGE COLUMNS (Date) (',
+                      v_parts, 'PARTITION p_future VALUES LESS THAN (MAXVALUE))');
+    PREPARE stmt FROM @ddl;
+    EXECUTE stmt;
+    DEALLOCATE PREPARE stmt;
+END //
+
+-- Procedure 2: Splits yearly partitions off p_future until there is one for every year
+-- through p_years_ahead years from now. p_future is normally empty, so each split only
+-- rewrites the partition definitions.
+
+CREATE PROCEDURE add_funding_partitions(IN p_years_ahead INT)
+BEGIN
+    DECLARE v_year INT;
+    DECLARE v_last INT DEFAULT YEAR(CURDATE()) + p_years_ahead;
+
+    SELECT MAX(CAST(SUBSTRING(PARTITION_NAME, 2) AS UNSIGNED)) INTO v_year
+    FROM information_schema.PARTITIONS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'funding_rounds' AND PARTITION_NAME REGEXP '^p[0-9]{4}$';
+
+    WHILE v_year < v_last DO
+        SET v_year = v_year + 1;
+        SET @ddl = CONCAT('ALTER TABLE funding_rounds REORGANIZE PARTITION p_future INTO (',
+                          'PARTITION p', v_year, ' VALUES LESS THAN (''', v_year + 1, '-01-01''), ',
+                          'PARTITION p_future VALUES LESS THAN (MAXVALUE))');
+        PREPARE stmt FROM @ddl;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END WHILE;
+END //
+
+DELIMITER ;
+
+CALL partition_funding_rounds(2);
+
+-- Keeps two years of partitions ahead; needs the event scheduler (event_scheduler = ON).
+-- Without it, run CALL add_funding_partitions(2) once a year.
+CREATE EVENT IF NOT EXISTS funding_partitions_ahead
+ON SCHEDULE EVERY 1 MONTH
+DO CALL add_funding_partitions(2);
+
+-- Triggers on funding_rounds: what fk_startup_ID and the primary key on Round_ID enforced
+-- (same error codes), and fk_fri_round's cascades to funding_round_investors
+
+DELIMITER //
+
+CREATE TRIGGER funding_rounds_check_insert
+BEFORE INSERT ON funding_rounds
+FOR EACH ROW
+BEGIN
+    DECLARE v_taken INT;
+
+    IF NOT EXISTS (SELECT 1 FROM startups WHERE Startup_ID = NEW.Startup_ID) THEN
+        SIGNAL SQLSTATE '23000'
+        SET MESSAGE_TEXT = 'Cannot add funding round: startup does not exist', MYSQL_ERRNO = 1452;
+    END IF;
+    -- Only the same Round_ID under another Date: an existing (Round_ID, Date) is the primary
+    -- key's own duplicate, which INSERT ... ON DUPLICATE KEY UPDATE turns into an update (the
+    -- trigger fires for those rows too). Locking read: of two concurrent inserts of one
+    -- Round_ID, one waits and then fails.
+    SELECT COUNT(*) INTO v_taken FROM funding_rounds
+    WHERE Round_ID = NEW.Round_ID AND Date <> NEW.Date FOR UPDATE;
+    IF v_taken > 0 THEN
+        SIGNAL SQLSTATE '23000'
+        SET MESSAGE_TEXT = 'Duplicate entry for funding_rounds.Round_ID', MYSQL_ERRNO = 1062;
+    END IF;
+END //
+
+CREATE TRIGGER funding_rounds_check_update
+BEFORE UPDATE ON funding_rounds
+FOR EACH ROW
+BEGIN
+    DECLARE v_taken INT;
+
+    IF OLD.Startup_ID <> NEW.Startup_ID AND NOT EXISTS (SELECT 1 FROM startups WHERE Startup_ID = NEW.Startup_ID) THEN
+        SIGNAL SQLSTATE '23000'
+        SET MESSAGE_TEXT = 'Cannot update funding round: startup does not exist', MYSQL_ERRNO = 1452;
+    END IF;
+    IF OLD.Round_ID <> NEW.Round_ID THEN
+        SELECT COUNT(*) INTO v_taken FROM funding_rounds WHERE Round_ID = NEW.Round_ID FOR UPDATE;
+        IF v_taken > 0 THEN
+            SIGNAL SQLSTATE '23000'
+            SET MESSAGE_TEXT = 'Duplicate entry for funding_rounds.Round_ID', MYSQL_ERRNO = 1062;
+        END IF;
+    END IF;
+END //
+
+CREATE TRIGGER funding_rounds_cascade_update
+AFTER UPDATE ON funding_rounds
+FOR EACH ROW
+BEGIN
+    IF OLD.Round_ID <> NEW.Round_ID THEN
+        UPDATE funding_round_investors SET Round_ID = NEW.Round_ID WHERE Round_ID = OLD.Round_ID;
+    END IF;
+END //
+
+CREATE TRIGGER funding_rounds_cascade_delete
+AFTER DELETE ON funding_rounds
+FOR EACH ROW
+BEGIN
+    DELETE FROM funding_round_investors WHERE Round_ID = OLD.Round_ID;
+END //
+
+-- Triggers on funding_round_investors: fk_fri_round's existence check
+
+CREATE TRIGGER fri_check_insert
+BEFORE INSERT ON funding_round_investors
+FOR EACH ROW
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM funding_rounds WHERE Round_ID = NEW.Round_ID) THEN
+        SIGNAL SQLSTATE '23000'
+        SET MESSAGE_TEXT = 'Cannot add round investor: funding round does not exist', MYSQL_ERRNO = 1452;
+    END IF;
+END //
+
+CREATE TRIGGER fri_check_update
+BEFORE UPDATE ON funding_round_investors
+FOR EACH ROW
+BEGIN
+    IF OLD.Round_ID <> NEW.Round_ID AND NOT EXISTS (SELECT 1 FROM funding_rounds WHERE Round_ID = NEW.Round_ID) THEN
+        SIGNAL SQLSTATE '23000'
+        SET MESSAGE_TEXT = 'Cannot update round investor: funding round does not exist', MYSQL_ERRNO = 1452;
+    END IF;
+END //
+
+-- Triggers on startups: fk_startup_ID's cascades. They run before the other AFTER triggers,
+-- where the foreign-key cascade used to happen, so those still see the rounds moved/removed.
+
+CREATE TRIGGER startups_cascade_update
+AFTER UPDATE ON startups
+FOR EACH ROW
+PRECEDES startup_summary_update
+BEGIN
+    IF OLD.Startup_ID <> NEW.Startup_ID THEN
+        UPDATE funding_rounds SET Startup_ID = NEW.Startup_ID WHERE Startup_ID = OLD.Startup_ID;
+    END IF;
+END //
+
+CREATE TRIGGER startups_cascade_delete
+AFTER DELETE ON startups
+FOR EACH ROW
+PRECEDES startup_summary_after_delete
+BEGIN
+    DELETE FROM funding_rounds WHERE Startup_ID = OLD.Startup_ID;
+END //
+
+DELIMITER ;
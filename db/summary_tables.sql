@@ -0,0 +1,518 @@
+-- Funding rollups kept current by triggers; the Analytics page reads these
+-- instead of re-aggregating funding_rounds on every view.
+-- Load after triggeres_procedures_functions.sql, then CALL rebuild_funding_summaries();
+
+CREATE TABLE startup_funding_summary (
+    Startup_ID INT PRIMARY KEY,
+    Rounds INT NOT NULL DEFAULT 0,
+    Total_Funding DECIMAL(18, 2) NOT NULL DEFAULT 0,
+    Min_Funding DECIMAL(18, 2),
+    Max_Funding DECIMAL(18, 2),
+    INDEX idx_sfs_total (Total_Funding)
+);
+
+CREATE TABLE industry_funding_summary (
+    Industry_ID INT PRIMARY KEY,
+    Startups INT NOT NULL DEFAULT 0,
+    Rounds INT NOT NULL DEFAULT 0,
+    Total_Funding DECIMAL(18, 2) NOT NULL DEFAULT 0,
+    Min_Funding DECIMAL(18, 2),
+    Max_Funding DECIMAL(18, 2)
+);
+
+CREATE TABLE city_funding_summary (
+    City_ID INT PRIMARY KEY,
+    Startups INT NOT NULL DEFAULT 0,
+    Rounds INT NOT NULL DEFAULT 0,
+    Total_Funding DECIMAL(18, 2) NOT NULL DEFAULT 0,
+    Min_Funding DECIMAL(18, 2),
+    Max_Funding DECIMAL(18, 2)
+);
+
+CREATE TABLE stage_funding_summary (
+    Stage VARCHAR(50) PRIMARY KEY,
+    Rounds INT NOT NULL DEFAULT 0,
+    Total_Funding DECIMAL(18, 2) NOT NULL DEFAULT 0,
+    Min_Funding DECIMAL(18, 2),
+    Max_Funding DECIMAL(18, 2)
+);
+
+-- Rounds and funding per month x industry x city x stage, for the Trends tab. Industry_ID /
+-- City_ID are 0 for startups without one; rounds without a Date are not counted. Groups that
+-- drop to 0 rounds stay until the next rebuild.
+CREATE TABLE monthly_funding_summary (
+    Month DATE NOT NULL,
+    Industry_ID INT NOT NULL,
+    City_ID INT NOT NULL,
+    Stage VARCHAR(50) NOT NULL,
+    Rounds INT NOT NULL DEFAULT 0,
+    Total_Funding DECIMAL(18, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (Month, Industry_ID, City_ID, Stage)
+);
+
+-- First day of the month of p_date: the Month key above
+
+DELIMITER //
+
+CREATE FUNCTION month_start(p_date DATE)
+RETURNS DATE
+DETERMINISTIC
+BEGIN
+    RETURN p_date - INTERVAL (DAY(p_date) - 1) DAY;
+END //
+
+DELIMITER ;
+
+-- Procedure 1: Adds one funding round to every rollup it belongs to
+
+DELIMITER //
+
+CREATE PROCEDURE apply_funding(
+    IN p_startup_id INT,
+    IN p_stage VARCHAR(50),
+    IN p_amount DECIMAL(18,2),
+    IN p_date DATE
+)
+BEGIN
+    DECLARE v_industry_id INT;
+    DECLARE v_city_id INT;
+
+    SELECT Industry_ID, City_ID INTO v_industry_id, v_city_id
+    FROM startups
+    WHERE Startup_ID = p_startup_id;
+
+    INSERT INTO startup_funding_summary (Startup_ID, Rounds, Total_Funding, Min_Funding, Max_Funding)
+    VALUES (p_startup_id, 1, COALESCE(p_amount, 0), p_amount, p_amount)
+    ON DUPLICATE KEY UPDATE
+        Rounds = Rounds + 1,
+        Total_Funding = Total_Funding + COALESCE(p_amount, 0),
+        Min_Funding = LEAST(COALESCE(Min_Funding, p_amount), COALESCE(p_amount, Min_Funding)),
+        Max_Funding = GREATEST(COALESCE(Max_Funding, p_amount), COALESCE(p_amount, Max_Funding));
+
+    INSERT INTO stage_funding_summary (Stage, Rounds, Total_Funding, Min_Funding, Max_Funding)
+    VALUES (p_stage, 1, COALESCE(p_amount, 0), p_amount, p_amount)
+    ON DUPLICATE KEY UPDATE
+        Rounds = Rounds + 1,
+        Total_Funding = Total_Funding + COALESCE(p_amount, 0),
+        Min_Funding = LEAST(COALESCE(Min_Funding, p_amount), COALESCE(p_amount, Min_Funding)),
+        Max_Funding = GREATEST(COALESCE(Max_Funding, p_amount), COALESCE(p_amount, Max_Funding));
+
+    IF v_industry_id IS NOT NULL THEN
+        INSERT INTO industry_funding_summary (Industry_ID, Rounds, Total_Funding, Min_Funding, Max_Funding)
+        VALUES (v_industry_id, 1, COALESCE(p_amount, 0), p_amount, p_amount)
+        ON DUPLICATE KEY UPDATE
+            Rounds = Rounds + 1,
+            Total_Funding = Total_Funding + COALESCE(p_amount, 0),
+            Min_Funding = LEAST(COALESCE(Min_Funding, p_amount), COALESCE(p_amount, Min_Funding)),
+            Max_Funding = GREATEST(COALESCE(Max_Funding, p_amount), COALESCE(p_amount, Max_Funding));
+    END IF;
+
+    IF v_city_id IS NOT NULL THEN
+        INSERT INTO city_funding_summary (City_ID, Rounds, Total_Funding, Min_Funding, Max_Funding)
+        VALUES (v_city_id, 1, COALESCE(p_amount, 0), p_amount, p_amount)
+        ON DUPLICATE KEY UPDATE
+            Rounds = Rounds + 1,
+            Total_Funding = Total_Funding + COALESCE(p_amount, 0),
+            Min_Funding = LEAST(COALESCE(Min_Funding, p_amount), COALESCE(p_amount, Min_Funding)),
+            Max_Funding = GREATEST(COALESCE(Max_Funding, p_amount), COALESCE(p_amount, Max_Funding));
+    END IF;
+
+    IF p_date IS NOT NULL THEN
+        INSERT INTO monthly_funding_summary (Month, Industry_ID, City_ID, Stage, Rounds, Total_Funding)
+        VALUES (month_start(p_date), COALESCE(v_industry_id, 0), COALESCE(v_city_id, 0), p_stage, 1, COALESCE(p_amount, 0))
+        ON DUPLICATE KEY UPDATE
+            Rounds = Rounds + 1,
+            Total_Funding = Total_Funding + COALESCE(p_amount, 0);
+    END IF;
+END //
+
+DELIMITER ;
+
+-- Procedures 2-5: Recompute MIN/MAX for one group (only needed when a removed
+-- amount was that group's current min or max)
+
+DELIMITER //
+
+CREATE PROCEDURE refresh_startup_extrema(IN p_startup_id INT)
+BEGIN
+    UPDATE startup_funding_summary
+    SET Min_Funding = (SELECT MIN(Amount) FROM funding_rounds WHERE Startup_ID = p_startup_id),
+        Max_Funding = (SELECT MAX(Amount) FROM funding_rounds WHERE Startup_ID = p_startup_id)
+    WHERE Startup_ID = p_startup_id;
+END //
+
+CREATE PROCEDURE refresh_stage_extrema(IN p_stage VARCHAR(50))
+BEGIN
+    UPDATE stage_funding_summary
+    SET Min_Funding = (SELECT MIN(Amount) FROM funding_rounds WHERE Stage = p_stage),
+        Max_Funding = (SELECT MAX(Amount) FROM funding_rounds WHERE Stage = p_stage)
+    WHERE Stage = p_stage;
+END //
+
+CREATE PROCEDURE refresh_industry_extrema(IN p_industry_id INT)
+BEGIN
+    UPDATE industry_funding_summary
+    SET Min_Funding = (
+            SELECT MIN(fr.Amount) FROM funding_rounds fr
+            JOIN startups s ON fr.Startup_ID = s.Startup_ID
+            WHERE s.Industry_ID = p_industry_id),
+        Max_Funding = (
+            SELECT MAX(fr.Amount) FROM funding_rounds fr
+            JOIN startups s ON fr.Startup_ID = s.Startup_ID
+            WHERE s.Industry_ID = p_industry_id)
+    WHERE Industry_ID = p_industry_id;
+END //
+
+CREATE PROCEDURE refresh_city_extrema(IN p_city_id INT)
+BEGIN
+    UPDATE city_funding_summary
+    SET Min_Funding = (
+            SELECT MIN(fr.Amount) FROM funding_rounds fr
+            JOIN startups s ON fr.Startup_ID = s.Startup_ID
+            WHERE s.City_ID = p_city_id),
+        Max_Funding = (
+            SELECT MAX(fr.Amount) FROM funding_rounds fr
+            JOIN startups s ON fr.Startup_ID = s.Startup_ID
+            WHERE s.City_ID = p_city_id)
+    WHERE City_ID = p_city_id;
+END //
+
+DELIMITER ;
+
+-- Procedure 6: Removes one funding round from every rollup it belongs to.
+-- Call after the row is gone so extrema refreshes no longer see it.
+
+DELIMITER //
+
+CREATE PROCEDURE retract_funding(
+    IN p_startup_id INT,
+    IN p_stage VARCHAR(50),
+    IN p_amount DECIMAL(18,2),
+    IN p_date DATE
+)
+BEGIN
+    DECLARE v_industry_id INT;
+    DECLARE v_city_id INT;
+    DECLARE v_min DECIMAL(18,2);
+    DECLARE v_max DECIMAL(18,2);
+
+    SELECT Industry_ID, City_ID INTO v_industry_id, v_city_id
+    FROM startups
+    WHERE Startup_ID = p_startup_id;
+
+    UPDATE startup_funding_summary
+    SET Rounds = Rounds - 1, Total_Funding = Total_Funding - COALESCE(p_amount, 0)
+    WHERE Startup_ID = p_startup_id;
+    SELECT Min_Funding, Max_Funding INTO v_min, v_max
+    FROM startup_funding_summary WHERE Startup_ID = p_startup_id;
+    IF p_amount <= v_min OR p_amount >= v_max THEN
+        CALL refresh_startup_extrema(p_startup_id);
+    END IF;
+
+    UPDATE stage_funding_summary
+    SET Rounds = Rounds - 1, Total_Funding = Total_Funding - COALESCE(p_amount, 0)
+    WHERE Stage = p_stage;
+    SELECT Min_Funding, Max_Funding INTO v_min, v_max
+    FROM stage_funding_summary WHERE Stage = p_stage;
+    IF p_amount <= v_min OR p_amount >= v_max THEN
+        CALL refresh_stage_extrema(p_stage);
+    END IF;
+
+    IF v_industry_id IS NOT NULL THEN
+        UPDATE industry_funding_summary
+        SET Rounds = Rounds - 1, Total_Funding = Total_Funding - COALESCE(p_amount, 0)
+        WHERE Industry_ID = v_industry_id;
+        SELECT Min_Funding, Max_Funding INTO v_min, v_max
+        FROM industry_funding_summary WHERE Industry_ID = v_industry_id;
+        IF p_amount <= v_min OR p_amount >= v_max THEN
+            CALL refresh_industry_extrema(v_industry_id);
+        END IF;
+    END IF;
+
+    IF v_city_id IS NOT NULL THEN
+        UPDATE city_funding_summary
+        SET Rounds = Rounds - 1, Total_Funding = Total_Funding - COALESCE(p_amount, 0)
+        WHERE City_ID = v_city_id;
+        SELECT Min_Funding, Max_Funding INTO v_min, v_max
+        FROM city_funding_summary WHERE City_ID = v_city_id;
+        IF p_amount <= v_min OR p_amount >= v_max THEN
+            CALL refresh_city_extrema(v_city_id);
+        END IF;
+    END IF;
+
+    IF p_date IS NOT NULL THEN
+        UPDATE monthly_funding_summary
+        SET Rounds = Rounds - 1, Total_Funding = Total_Funding - COALESCE(p_amount, 0)
+        WHERE Month = month_start(p_date) AND Industry_ID = COALESCE(v_industry_id, 0)
+          AND City_ID = COALESCE(v_city_id, 0) AND Stage = p_stage;
+    END IF;
+END //
+
+DELIMITER ;
+
+-- Procedure 7: Rebuilds every rollup from the base tables (backfills, repairs)
+
+DELIMITER //
+
+CREATE PROCEDURE rebuild_funding_summaries()
+BEGIN
+    START TRANSACTION;
+
+    DELETE FROM startup_funding_summary;
+    INSERT INTO startup_funding_summary (Startup_ID, Rounds, Total_Funding, Min_Funding, Max_Funding)
+    SELECT s.Startup_ID, COUNT(fr.Round_ID), COALESCE(SUM(fr.Amount), 0), MIN(fr.Amount), MAX(fr.Amount)
+    FROM startups s
+    LEFT JOIN funding_rounds fr ON s.Startup_ID = fr.Startup_ID
+    GROUP BY s.Startup_ID;
+
+    DELETE FROM stage_funding_summary;
+    INSERT INTO stage_funding_summary (Stage, Rounds, Total_Funding, Min_Funding, Max_Funding)
+    SELECT Stage, COUNT(*), COALESCE(SUM(Amount), 0), MIN(Amount), MAX(Amount)
+    FROM funding_rounds
+    GROUP BY Stage;
+
+    DELETE FROM industry_funding_summary;
+    INSERT INTO industry_funding_summary (Industry_ID, Startups, Rounds, Total_Funding, Min_Funding, Max_Funding)
+    SELECT i.Industry_ID, COUNT(sfs.Startup_ID), COALESCE(SUM(sfs.Rounds), 0),
+           COALESCE(SUM(sfs.Total_Funding), 0), MIN(sfs.Min_Funding), MAX(sfs.Max_Funding)
+    FROM industries i
+    LEFT JOIN startups s ON i.Industry_ID = s.Industry_ID
+    LEFT JOIN startup_funding_summary sfs ON s.Startup_ID = sfs.Startup_ID
+    GROUP BY i.Industry_ID;
+
+    DELETE FROM city_funding_summary;
+    INSERT INTO city_funding_summary (City_ID, Startups, Rounds, Total_Funding, Min_Funding, Max_Funding)
+    SELECT c.City_ID, COUNT(sfs.Startup_ID), COALESCE(SUM(sfs.Rounds), 0),
+           COALESCE(SUM(sfs.Total_Funding), 0), MIN(sfs.Min_Funding), MAX(sfs.Max_Funding)
+    FROM cities c
+    LEFT JOIN startups s ON c.City_ID = s.City_ID
+    LEFT JOIN startup_funding_summary sfs ON s.Startup_ID = sfs.Startup_ID
+    GROUP BY c.City_ID;
+
+    DELETE FROM monthly_funding_summary;
+    INSERT INTO monthly_funding_summary (Month, Industry_ID, City_ID, Stage, Rounds, Total_Funding)
+    SELECT month_start(fr.Date), COALESCE(s.Industry_ID, 0), COALESCE(s.City_ID, 0), fr.Stage,
+           COUNT(*), COALESCE(SUM(fr.Amount), 0)
+    FROM funding_rounds fr
+    JOIN startups s ON fr.Startup_ID = s.Startup_ID
+    WHERE fr.Date IS NOT NULL
+    GROUP BY month_start(fr.Date), COALESCE(s.Industry_ID, 0), COALESCE(s.City_ID, 0), fr.Stage;
+
+    COMMIT;
+END //
+
+DELIMITER ;
+
+-- Triggers on funding_rounds. A round whose startup no longer exists is being removed or
+-- rekeyed by the startup cascade triggers in partitioning.sql; the startup triggers below
+-- settle those rounds, so these skip them.
+
+DELIMITER //
+
+CREATE TRIGGER funding_summary_insert
+AFTER INSERT ON funding_rounds
+FOR EACH ROW
+BEGIN
+    CALL apply_funding(NEW.Startup_ID, NEW.Stage, NEW.Amount, NEW.Date);
+END //
+
+CREATE TRIGGER funding_summary_update
+AFTER UPDATE ON funding_rounds
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Startup_ID <=> NEW.Startup_ID AND OLD.Stage <=> NEW.Stage AND OLD.Amount <=> NEW.Amount
+            AND OLD.Date <=> NEW.Date) AND EXISTS (SELECT 1 FROM startups WHERE Startup_ID = OLD.Startup_ID) THEN
+        CALL retract_funding(OLD.Startup_ID, OLD.Stage, OLD.Amount, OLD.Date);
+        CALL apply_funding(NEW.Startup_ID, NEW.Stage, NEW.Amount, NEW.Date);
+    END IF;
+END //
+
+CREATE TRIGGER funding_summary_delete
+AFTER DELETE ON funding_rounds
+FOR EACH ROW
+BEGIN
+    IF EXISTS (SELECT 1 FROM startups WHERE Startup_ID = OLD.Startup_ID) THEN
+        CALL retract_funding(OLD.Startup_ID, OLD.Stage, OLD.Amount, OLD.Date);
+    END IF;
+END //
+
+DELIMITER ;
+
+-- Triggers on startups. Cascaded deletes of funding_rounds do not fire the
+-- funding_rounds triggers, so a startup delete settles its rounds here.
+
+DELIMITER //
+
+CREATE TRIGGER startup_summary_insert
+AFTER INSERT ON startups
+FOR EACH ROW
+BEGIN
+    INSERT INTO startup_funding_summary (Startup_ID) VALUES (NEW.Startup_ID);
+
+    IF NEW.Industry_ID IS NOT NULL THEN
+        INSERT INTO industry_funding_summary (Industry_ID, Startups) VALUES (NEW.Industry_ID, 1)
+        ON DUPLICATE KEY UPDATE Startups = Startups + 1;
+    END IF;
+
+    IF NEW.City_ID IS NOT NULL THEN
+        INSERT INTO city_funding_summary (City_ID, Startups) VALUES (NEW.City_ID, 1)
+        ON DUPLICATE KEY UPDATE Startups = Startups + 1;
+    END IF;
+END //
+
+CREATE TRIGGER startup_summary_update
+AFTER UPDATE ON startups
+FOR EACH ROW
+BEGIN
+    DECLARE v_rounds INT DEFAULT 0;
+    DECLARE v_total DECIMAL(18,2) DEFAULT 0;
+    DECLARE v_min DECIMAL(18,2);
+    DECLARE v_max DECIMAL(18,2);
+
+    IF OLD.Startup_ID <> NEW.Startup_ID THEN
+        UPDATE startup_funding_summary SET Startup_ID = NEW.Startup_ID WHERE Startup_ID = OLD.Startup_ID;
+    END IF;
+
+    SELECT Rounds, Total_Funding, Min_Funding, Max_Funding INTO v_rounds, v_total, v_min, v_max
+    FROM startup_funding_summary WHERE Startup_ID = NEW.Startup_ID;
+
+    IF NOT (OLD.Industry_ID <=> NEW.Industry_ID) THEN
+        IF OLD.Industry_ID IS NOT NULL THEN
+            UPDATE industry_funding_summary
+            SET Startups = Startups - 1, Rounds = Rounds - v_rounds, Total_Funding = Total_Funding - v_total
+            WHERE Industry_ID = OLD.Industry_ID;
+            CALL refresh_industry_extrema(OLD.Industry_ID);
+        END IF;
+        IF NEW.Industry_ID IS NOT NULL THEN
+            INSERT INTO industry_funding_summary (Industry_ID, Startups, Rounds, Total_Funding, Min_Funding, Max_Funding)
+            VALUES (NEW.Industry_ID, 1, v_rounds, v_total, v_min, v_max)
+            ON DUPLICATE KEY UPDATE
+                Startups = Startups + 1,
+                Rounds = Rounds + v_rounds,
+                Total_Funding = Total_Funding + v_total,
+                Min_Funding = LEAST(COALESCE(Min_Funding, v_min), COALESCE(v_min, Min_Funding)),
+                Max_Funding = GREATEST(COALESCE(Max_Funding, v_max), COALESCE(v_max, Max_Funding));
+        END IF;
+    END IF;
+
+    IF NOT (OLD.City_ID <=> NEW.City_ID) THEN
+        IF OLD.City_ID IS NOT NULL THEN
+            UPDATE city_funding_summary
+            SET Startups = Startups - 1, Rounds = Rounds - v_rounds, Total_Funding = Total_Funding - v_total
+            WHERE City_ID = OLD.City_ID;
+            CALL refresh_city_extrema(OLD.City_ID);
+        END IF;
+        IF NEW.City_ID IS NOT NULL THEN
+            INSERT INTO city_funding_summary (City_ID, Startups, Rounds, Total_Funding, Min_Funding, Max_Funding)
+            VALUES (NEW.City_ID, 1, v_rounds, v_total, v_min, v_max)
+            ON DUPLICATE KEY UPDATE
+                Startups = Startups + 1,
+                Rounds = Rounds + v_rounds,
+                Total_Funding = Total_Funding + v_total,
+                Min_Funding = LEAST(COALESCE(Min_Funding, v_min), COALESCE(v_min, Min_Funding)),
+                Max_Funding = GREATEST(COALESCE(Max_Funding, v_max), COALESCE(v_max, Max_Funding));
+        END IF;
+    END IF;
+
+    -- Its rounds' monthly groups move to the new industry/city (rounds already carry NEW.Startup_ID)
+    IF NOT (OLD.Industry_ID <=> NEW.Industry_ID AND OLD.City_ID <=> NEW.City_ID) THEN
+        UPDATE monthly_funding_summary m
+        JOIN (
+            SELECT month_start(Date) AS Month, Stage, COUNT(*) AS Rounds, COALESCE(SUM(Amount), 0) AS Total
+            FROM funding_rounds
+            WHERE Startup_ID = NEW.Startup_ID AND Date IS NOT NULL
+            GROUP BY month_start(Date), Stage
+        ) d ON m.Month = d.Month AND m.Stage = d.Stage
+        SET m.Rounds = m.Rounds - d.Rounds, m.Total_Funding = m.Total_Funding - d.Total
+        WHERE m.Industry_ID = COALESCE(OLD.Industry_ID, 0) AND m.City_ID = COALESCE(OLD.City_ID, 0);
+
+        INSERT INTO monthly_funding_summary (Month, Industry_ID, City_ID, Stage, Rounds, Total_Funding)
+        SELECT * FROM (
+            SELECT month_start(Date) AS Month, COALESCE(NEW.Industry_ID, 0) AS Industry_ID,
+                   COALESCE(NEW.City_ID, 0) AS City_ID, Stage, COUNT(*) AS Rounds,
+                   COALESCE(SUM(Amount), 0) AS Total
+            FROM funding_rounds
+            WHERE Startup_ID = NEW.Startup_ID AND Date IS NOT NULL
+            GROUP BY month_start(Date), Stage
+        ) d
+        ON DUPLICATE KEY UPDATE
+            Rounds = monthly_funding_summary.Rounds + d.Rounds,
+            Total_Funding = monthly_funding_summary.Total_Funding + d.Total;
+    END IF;
+END //
+
+-- Runs while the startup's funding rounds still exist
+CREATE TRIGGER startup_summary_before_delete
+BEFORE DELETE ON startups
+FOR EACH ROW
+FOLLOWS prevent_startup_delete
+BEGIN
+    DECLARE v_rounds INT DEFAULT 0;
+    DECLARE v_total DECIMAL(18,2) DEFAULT 0;
+
+    SELECT Rounds, Total_Funding INTO v_rounds, v_total
+    FROM startup_funding_summary WHERE Startup_ID = OLD.Startup_ID;
+
+    UPDATE stage_funding_summary ss
+    JOIN (
+        SELECT Stage, COUNT(*) AS Rounds, COALESCE(SUM(Amount), 0) AS Total
+        FROM funding_rounds
+        WHERE Startup_ID = OLD.Startup_ID
+        GROUP BY Stage
+    ) d ON ss.Stage = d.Stage
+    SET ss.Rounds = ss.Rounds - d.Rounds, ss.Total_Funding = ss.Total_Funding - d.Total;
+
+    UPDATE monthly_funding_summary m
+    JOIN (
+        SELECT month_start(Date) AS Month, Stage, COUNT(*) AS Rounds, COALESCE(SUM(Amount), 0) AS Total
+        FROM funding_rounds
+        WHERE Startup_ID = OLD.Startup_ID AND Date IS NOT NULL
+        GROUP BY month_start(Date), Stage
+    ) d ON m.Month = d.Month AND m.Stage = d.Stage
+    SET m.Rounds = m.Rounds - d.Rounds, m.Total_Funding = m.Total_Funding - d.Total
+    WHERE m.Industry_ID = COALESCE(OLD.Industry_ID, 0) AND m.City_ID = COALESCE(OLD.City_ID, 0);
+
+    IF OLD.Industry_ID IS NOT NULL THEN
+        UPDATE industry_funding_summary
+        SET Startups = Startups - 1, Rounds = Rounds - v_rounds, Total_Funding = Total_Funding - v_total
+        WHERE Industry_ID = OLD.Industry_ID;
+    END IF;
+
+    IF OLD.City_ID IS NOT NULL THEN
+        UPDATE city_funding_summary
+        SET Startups = Startups - 1, Rounds = Rounds - v_rounds, Total_Funding = Total_Funding - v_total
+        WHERE City_ID = OLD.City_ID;
+    END IF;
+
+    DELETE FROM startup_funding_summary WHERE Startup_ID = OLD.Startup_ID;
+END //
+
+-- Runs after the cascade has removed the rounds, so extrema no longer include them
+CREATE TRIGGER startup_summary_after_delete
+AFTER DELETE ON startups
+FOR EACH ROW
+BEGIN
+    DECLARE v_done INT DEFAULT 0;
+    DECLARE v_stage VARCHAR(50);
+    DECLARE stage_cursor CURSOR FOR SELECT Stage FROM stage_funding_summary;
+    DECLARE CONTINUE HANDLER FOR NOT FOUND SET v_done = 1;
+
+    IF OLD.Industry_ID IS NOT NULL THEN
+        CALL refresh_industry_extrema(OLD.Industry_ID);
+    END IF;
+    IF OLD.City_ID IS NOT NULL THEN
+        CALL refresh_city_extrema(OLD.City_ID);
+    END IF;
+
+    OPEN stage_cursor;
+    stage_loop: LOOP
+        FETCH stage_cursor INTO v_stage;
+        IF v_done = 1 THEN
+            LEAVE stage_loop;
+        END IF;
+        CALL refresh_stage_extrema(v_stage);
+    END LOOP;
+    CLOSE stage_cursor;
+END //
+
+DELIMITER ;
@@ -7,11 +7,14 @@ BEFORE DELETE ON startups
 FOR EACH ROW
 BEGIN
     DECLARE recent_funding_count INT;
+    -- A constant bound, so a partitioned funding_rounds (partitioning.sql) only reads the
+    -- partitions from a year ago on
+    DECLARE one_year_ago DATE DEFAULT DATE_SUB(CURDATE(), INTERVAL 1 YEAR);
     
     SELECT COUNT(*) INTO recent_funding_count
     FROM funding_rounds
     WHERE Startup_ID = OLD.Startup_ID
-    AND Date >= DATE_SUB(CURDATE(), INTERVAL 1 YEAR);
+    AND Date >= one_year_ago;
     
     IF recent_funding_count > 0 THEN
         SIGNAL SQLSTATE '45000'
@@ -0,0 +1,23 @@
+-- Set-based replacements for the per-startup scalar functions. get_total_funding() and
+-- count_milestones() run one query per call, so using them over a list of startups costs
+-- one lookup per row; these views answer for every startup at once and join like tables.
+-- Load after summary_tables.sql.
+
+-- get_total_funding() for every startup (0 if it has no rounds), from the funding rollup.
+-- startup_summary_insert gives every startup its rollup row, so this is a plain projection:
+-- MySQL merges it into the outer query, where idx_sfs_total and idx_sfs_max still apply
+CREATE OR REPLACE VIEW startup_funding_totals AS
+SELECT Startup_ID, Rounds, Total_Funding, Max_Funding
+FROM startup_funding_summary;
+
+-- count_milestones() for every startup that has milestones (the rest are 0)
+CREATE OR REPLACE VIEW startup_milestone_counts AS
+SELECT Startup_ID, COUNT(*) AS Milestones
+FROM startup_milestones
+GROUP BY Startup_ID;
+
+-- Average round size. Computed from the rounds themselves: the rollups count rounds with no
+-- Amount, which AVG() skips
+CREATE OR REPLACE VIEW funding_average AS
+SELECT AVG(Amount) AS Avg_Funding
+FROM funding_rounds;
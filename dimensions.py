@@ -0,0 +1,90 @@
+# dimensions.py
+# Small lookup tables (countries, cities, industries) held in memory for the form selectboxes.
+# Loaded once per process and dropped whenever a write touches the table.
+import threading
+import time
+
+import pandas as pd
+import streamlit as st
+
+from config import LOOKUP_TTL
+from db import read_df, query_cache, PoolExhaustedError, DatabaseUnavailableError, _report_unavailable
+
+DIMENSION_QUERIES = {
+    'countries': "SELECT Country_ID AS ID, Name AS Label FROM countries ORDER BY Name",
+    'cities': "SELECT City_ID AS ID, Name AS Label FROM cities ORDER BY Name",
+    # Sector alone is not unique, so the sub-sector is part of the label
+    'industries': """
+        SELECT Industry_ID AS ID,
+               CASE WHEN Sub_Sector IS NULL OR Sub_Sector = '' THEN Sector
+                    ELSE CONCAT(Sector, ' (', Sub_Sector, ')') END AS Label
+        FROM industries
+        ORDER BY Sector, Sub_Sector
+    """,
+}
+
+
+class Dimension:
+    def __init__(self, ids, labels):
+        self.ids = ids                                  # selectbox options, in display order
+        self.labels = dict(zip(ids, labels))            # id -> label
+        self.ids_by_label = dict(zip(labels, ids))      # label -> id
+        self.positions = {id_: i for i, id_ in enumerate(ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def label(self, id_):
+        return self.labels.get(id_, "Unknown")
+
+    # Selectbox index for the current value; falls back to the first option
+    # (integer columns with NULLs come back as float NaN, see materialize.py)
+    def index(self, id_, default=0):
+        if pd.isna(id_):
+            return default
+        return self.positions.get(int(id_), default)
+
+
+_dimensions = {}   # name -> (Dimension, loaded_at)
+_lock = threading.Lock()
+
+
+def _load(name):
+    # ttl=0: the Dimension object is the cache, no need to keep the frame as well
+    df = read_df(DIMENSION_QUERIES[name], ttl=0)
+    return Dimension([int(i) for i in df['ID']], [str(label) for label in df['Label']])
+
+
+def get_dimension(name):
+    with _lock:
+        entry = _dimensions.get(name)
+    # The TTL only matters for rows changed outside the app; our own writes drop the entry at once
+    if entry is not None and time.monotonic() - entry[1] < LOOKUP_TTL:
+        return entry[0]
+    version = query_cache.version({name})
+    dimension = _load(name)
+    with _lock:
+        # Skip storing if a write landed while we were loading; the next call reloads
+        if query_cache.version({name}) == version:
+            _dimensions[name] = (dimension, time.monotonic())
+    return dimension
+
+
+# Page-side variant: reports the error and returns None, like execute_query
+def load_dimension(name):
+    try:
+        return get_dimension(name)
+    except (PoolExhaustedError, DatabaseUnavailableError) as err:
+        _report_unavailable(err)
+    except Exception as e:
+        st.error(f"❌ Query Error: {e}")
+    return None
+
+
+def invalidate_dimensions(tables):
+    with _lock:
+        for name in tables:
+            _dimensions.pop(name, None)
+
+
+query_cache.add_listener(invalidate_dimensions)
@@ -0,0 +1,281 @@
+# export.py
+# Streams a query result to a CSV or Parquet file. Rows come from an unbuffered cursor, so
+# MySQL sends them as they are consumed; each chunk is converted, written and dropped, and
+# memory stays at one chunk however large the result is.
+import argparse
+import os
+import time
+from dataclasses import dataclass
+
+import mysql.connector
+import streamlit as st
+from mysql.connector import FieldType
+
+from config import DB_CONFIG, EXPORT_CONFIG
+from db import read_df
+from instrumentation import Timer
+from materialize import column_kinds, iter_frames
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet support is optional
+    pa = pq = None
+
+FORMATS = ['csv', 'parquet']
+
+# Seconds the server waits on a slow reader (e.g. Parquet compression) before dropping the stream
+NET_WRITE_TIMEOUT = 600
+
+
+@dataclass
+class ExportProgress:
+    path: str
+    rows: int = 0
+    bytes: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    total: int = None       # expected rows, when the caller knows
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def mb_per_sec(self):
+        return self.bytes / 2 ** 20 / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def fraction(self):
+        if not self.total:
+            return None
+        return min(self.rows / self.total, 1.0)
+
+    def summary(self):
+        return (f"{self.rows:,} rows · {self.bytes / 2 ** 20:,.1f} MB in {self.seconds:.1f}s "
+                f"({self.rows_per_sec:,.0f} rows/s, {self.mb_per_sec:.1f} MB/s)")
+
+
+def _arrow_schema(description, kinds):
+    fields = []
+    for column, kind in zip(description, kinds):
+        name, type_code = column[0], column[1]
+        if kind == 'float64':
+            arrow_type = pa.float64()
+        elif kind == 'int64':
+            arrow_type = pa.int64()
+        elif type_code in (FieldType.DATE, FieldType.NEWDATE):
+            arrow_type = pa.date32()
+        elif type_code in (FieldType.DATETIME, FieldType.TIMESTAMP):
+            arrow_type = pa.timestamp('us')
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+class _CsvWriter:
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.header = True
+
+    def write(self, df):
+        df.to_csv(self.file, header=self.header, index=False)
+        self.header = False
+
+    def tell(self):
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetWriter:
+    # Fixed schema from the column types, so a chunk that is all NULL still matches
+    def __init__(self, path, description, kinds):
+        self.schema = _arrow_schema(description, kinds)
+        self.sink = pa.OSFile(path, 'wb')
+        self.writer = pq.ParquetWriter(self.sink, self.schema)
+
+    def write(self, df):
+        self.writer.write_table(pa.Table.from_pandas(df, schema=self.schema, preserve_index=False))
+
+    def tell(self):
+        return self.sink.tell()
+
+    def close(self):
+        self.writer.close()
+        self.sink.close()
+
+
+def _connect():
+    # Own connection, not a pooled one: a long export must not hold a slot the pages need
+    conn = mysql.connector.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    cursor.execute(f"SET SESSION net_write_timeout = {NET_WRITE_TIMEOUT}")
+    cursor.close()
+    return conn
+
+
+# Writes the result of `query` to `path`; on_chunk(progress) is called after every chunk
+def export_query(query, params, path, fmt='csv', chunk_size=None, total=None, on_chunk=None):
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    if fmt == 'parquet' and pq is None:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+    chunk_size = chunk_size or EXPORT_CONFIG['chunk_size']
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    timer = Timer(query, source='export')
+    progress = ExportProgress(path, total=total)
+    started = time.perf_counter()
+    writer = None
+    try:
+        with timer.phase('connect'):
+            conn = _connect()
+        try:
+            cursor = conn.cursor()
+            with timer.phase('execute'):
+                cursor.execute(query, params or ())
+            kinds = column_kinds(cursor.description)
+            writer = _ParquetWriter(path, cursor.description, kinds) if fmt == 'parquet' else _CsvWriter(path)
+            with timer.phase('fetch'):
+                for df in iter_frames(cursor, fetch_size=chunk_size):
+                    # Integer columns with NULLs come back float64; keep them integers in the file
+                    for column, kind in zip(df.columns, kinds):
+                        if kind == 'int64' and df[column].dtype != 'int64':
+                            df[column] = df[column].astype('Int64')
+                    writer.write(df)
+                    progress.rows += len(df)
+                    progress.chunks += 1
+                    progress.bytes = writer.tell()
+                    progress.seconds = time.perf_counter() - started
+                    if on_chunk:
+                        on_chunk(progress)
+            cursor.close()
+        finally:
+            conn.close()
+        writer.close()
+        writer = None
+    except Exception as err:
+        if writer is not None:
+            writer.close()
+        # No half-written files left behind
+        if os.path.exists(path):
+            os.remove(path)
+        timer.finish(rows=progress.rows, error=err)
+        raise
+    progress.bytes = os.path.getsize(path)
+    progress.seconds = time.perf_counter() - started
+    timer.finish(rows=progress.rows, nbytes=progress.bytes)
+    return progress
+
+
+def export_path(name, fmt):
+    return os.path.join(EXPORT_CONFIG['dir'], f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.{fmt}")
+
+
+# Deletes exports older than keep_hours from the export directory (ones left by sessions
+# that ended); returns how many were removed
+def prune_exports(keep_hours=None):
+    keep_hours = EXPORT_CONFIG['keep_hours'] if keep_hours is None else keep_hours
+    folder = EXPORT_CONFIG['dir']
+    if not os.path.isdir(folder):
+        return 0
+    cutoff = time.time() - keep_hours * 3600
+    removed = 0
+    for entry in os.scandir(folder):
+        if entry.is_file() and entry.name.endswith(tuple('.' + fmt for fmt in FORMATS)) and entry.stat().st_mtime < cutoff:
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass    # in use or already gone
+    return removed
+
+
+def _read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+# Export controls under a table or query result; `name` keys the widgets and the saved file
+def export_panel(name, query, params=None, count_query=None, count_params=None):
+    with st.expander("Export"):
+        formats = FORMATS if pq is not None else ['csv']
+        col1, col2 = st.columns([2, 1])
+        fmt = col1.radio("Format", formats, horizontal=True, key=f"{name}_export_format")
+        if col2.button("Export", key=f"{name}_export", use_container_width=True):
+            total = None
+            if count_query:
+                try:
+                    total = int(read_df(count_query, count_params or params, ttl=0).iloc[0, 0])
+                except Exception:
+                    total = None   # progress still reports rows and throughput
+            bar = st.progress(0.0) if total else None
+            status = st.empty()
+
+            def show(progress):
+                if bar is not None:
+                    bar.progress(progress.fraction, text=f"{progress.rows:,} / {progress.total:,} rows")
+                status.caption(progress.summary())
+
+            prune_exports()
+            try:
+                result = export_query(query, params, export_path(name, fmt), fmt, total=total, on_chunk=show)
+            except (mysql.connector.Error, OSError, RuntimeError, ValueError) as err:
+                st.error(f"❌ Export Failed: {err}")
+            else:
+                status.caption(result.summary())
+                # Only the latest export per session and name is kept
+                previous = st.session_state.get(f"{name}_export_file")
+                if previous and previous != result.path and os.path.exists(previous):
+                    os.remove(previous)
+                st.session_state[f"{name}_export_file"] = result.path
+
+        path = st.session_state.get(f"{name}_export_file")
+        if path and os.path.exists(path):
+            size = os.path.getsize(path)
+            if size <= EXPORT_CONFIG['download_mb'] * 2 ** 20:
+                # Read on click only, not into memory on every rerun
+                st.download_button(f"Download {os.path.basename(path)}", lambda: _read_file(path),
+                                   file_name=os.path.basename(path), key=f"{name}_export_download",
+                                   mime='text/csv' if path.endswith('.csv') else 'application/octet-stream')
+            else:
+                st.caption(f"Saved to `{path}` ({size / 2 ** 20:,.0f} MB, too large to download here)")
+
+
+def main():
+    # Imported here: pagination imports this module for export_panel
+    from pagination import build_view_query
+    from table_specs import TABLE_SPECS
+
+    parser = argparse.ArgumentParser(description="Stream a View All table or a SQL query to CSV/Parquet")
+    parser.add_argument("source", help=f"one of {', '.join(TABLE_SPECS)}, or a SELECT statement")
+    parser.add_argument("path", help="output file (.csv or .parquet)")
+    parser.add_argument("--format", choices=FORMATS, help="default: from the file extension")
+    parser.add_argument("--sort", help="sort column label of the table (default: its first)")
+    parser.add_argument("--descending", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=EXPORT_CONFIG['chunk_size'])
+    args = parser.parse_args()
+
+    fmt = args.format or ('parquet' if args.path.lower().endswith(('.parquet', '.pq')) else 'csv')
+    total = None
+    if args.source in TABLE_SPECS:
+        spec = TABLE_SPECS[args.source]
+        sort_expr = spec.sort_columns[args.sort or next(iter(spec.sort_columns))]
+        query, count_query, params = build_view_query(spec, sort_expr, args.descending)
+        total = int(read_df(count_query, ttl=0).iloc[0, 0])
+    else:
+        query, params = args.source, None
+
+    def progress(p):
+        done = f" ({p.fraction:.0%})" if p.fraction is not None else ""
+        print(f"chunk {p.chunks}: {p.summary()}{done}")
+
+    result = export_query(query, params, args.path, fmt, args.chunk_size, total, on_chunk=progress)
+    print(f"\n{result.path}: {result.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# funding.py
+# Funding round writes that carry their investors: many rounds per call, one round trip,
+# one transaction (the add_funding_batch procedure in db/funding_writes.sql).
+import json
+from dataclasses import dataclass, field
+from datetime import date
+
+from config import FUNDING_STAGES
+from db import _acquire, query_cache
+from query_cache import written_tables
+
+ADD_FUNDING_BATCH = "CALL add_funding_batch(%s)"
+
+
+@dataclass
+class FundingRound:
+    round_id: int
+    startup_id: int
+    date: date
+    amount: float
+    stage: str
+    investor_ids: list = field(default_factory=list)
+
+
+def validate_round(r):
+    # Same rules as the funding_rounds CHECK constraints, caught before the round trip
+    if r.stage not in FUNDING_STAGES:
+        raise ValueError(f"Round {r.round_id}: stage '{r.stage}' is not allowed")
+    if r.amount is None or r.amount <= 0:
+        raise ValueError(f"Round {r.round_id}: amount must be > 0")
+
+
+def _payload(rounds):
+    return json.dumps([
+        {
+            'round_id': int(r.round_id),
+            'startup_id': int(r.startup_id),
+            'date': r.date.isoformat() if r.date else None,
+            'amount': float(r.amount),
+            'stage': r.stage,
+            'investors': sorted({int(i) for i in r.investor_ids}),
+        }
+        for r in rounds
+    ])
+
+
+# Raises ValueError for invalid rounds and mysql.connector.Error if the batch is rolled back
+def add_funding_rounds(rounds):
+    rounds = list(rounds)
+    if not rounds:
+        return 0
+    round_ids = [r.round_id for r in rounds]
+    if len(set(round_ids)) != len(round_ids):
+        raise ValueError("Round IDs repeat within the batch")
+    for r in rounds:
+        validate_round(r)
+
+    conn = _acquire()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(ADD_FUNDING_BATCH, (_payload(rounds),))
+        cursor.close()
+        conn.commit()
+    finally:
+        conn.close()
+    query_cache.invalidate(written_tables(ADD_FUNDING_BATCH))
+    return len(rounds)
+
+
+def add_funding_round(round_id, startup_id, round_date, amount, stage, investor_ids=()):
+    return add_funding_rounds([FundingRound(round_id, startup_id, round_date, amount, stage, list(investor_ids))])
@@ -0,0 +1,152 @@
+# index_advisor.py
+# Runs EXPLAIN on every SELECT the app issues and reports full scans and filesorts.
+# Exits non-zero when any are found, so it can gate changes to the queries.
+import argparse
+import ast
+import glob
+import re
+import sys
+
+from db import get_pool
+from pagination import build_page_query
+from pickers import ENTITIES, search_query
+from query_cache import normalize_sql
+from statements import STATEMENTS
+from table_specs import TABLE_SPECS
+
+# Stand-ins for %s parameters when explaining a query: LIMIT needs a number, LIKE a prefix
+# pattern (as the pickers and View All filters send), anything else a quoted literal, which
+# MySQL converts for numeric columns without losing their index
+SAMPLE_LIMIT = "26"
+SAMPLE_PATTERN = "'A%'"
+SAMPLE_VALUE = "'1'"
+# Rows per page for the View All queries
+PAGE_SIZE = 25
+
+_PLACEHOLDER = r"%(?:\(\w+\))?s"
+
+
+def sample_sql(sql):
+    sql = re.sub(rf"\bLIMIT {_PLACEHOLDER}", "LIMIT " + SAMPLE_LIMIT, sql)
+    sql = re.sub(rf"\bLIKE {_PLACEHOLDER}", lambda m: "LIKE " + SAMPLE_PATTERN, sql)
+    return re.sub(_PLACEHOLDER, lambda m: SAMPLE_VALUE, sql)
+
+
+def _is_select(sql):
+    # SQL is written in upper case here; "Select Startup" style labels are not queries
+    return bool(re.match(r"(SELECT|WITH)\s", sql)) and bool(re.search(r"\bFROM\b", sql))
+
+
+# The queries the app builds at run time, rendered the way it renders them
+def rendered_queries():
+    queries = [(sql, f"statements.STATEMENTS[{name!r}]") for name, sql in STATEMENTS.items()]
+    for spec in TABLE_SPECS.values():
+        for label, sort_expr in spec.sort_columns.items():
+            descending = spec.default_descending
+            sql, _ = build_page_query(spec, sort_expr, descending, PAGE_SIZE)
+            queries.append((sql, f"View All {spec.name}: sorted by {label}"))
+            # Later pages add the keyset condition (its values are bound); a non-NULL sort value
+            # is the common case
+            sql, _ = build_page_query(spec, sort_expr, descending, PAGE_SIZE, cursor=(0, 0))
+            queries.append((sql, f"View All {spec.name}: sorted by {label}, next page"))
+        for label, filter_expr in spec.filter_columns.items():
+            first_sort = next(iter(spec.sort_columns.values()))
+            sql, _ = build_page_query(spec, first_sort, spec.default_descending, PAGE_SIZE, filter_expr, "A")
+            queries.append((sql, f"View All {spec.name}: filtered on {label}"))
+    queries += [(search_query(entity), f"{entity} picker search") for entity in ENTITIES]
+    return queries
+
+
+# Complete SQL string constants in the sources. f-strings and str.format templates are only
+# fragments until rendered, so they are skipped: rendered_queries() covers the ones the app builds
+def source_queries(paths):
+    queries = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        fragments = {id(v) for n in ast.walk(tree) if isinstance(n, ast.JoinedStr) for v in n.values}
+        for node in ast.walk(tree):
+            if id(node) in fragments or not (isinstance(node, ast.Constant) and isinstance(node.value, str)):
+                continue
+            if re.search(r"\{\w*\}", node.value):
+                continue
+            queries.append((node.value, f"{path}:{node.lineno}"))
+    return queries
+
+
+def collect_queries(paths):
+    queries = {}
+    for text, origin in rendered_queries() + source_queries(paths):
+        sql = normalize_sql(text)
+        if _is_select(sql):
+            queries.setdefault(sample_sql(sql), origin)
+    return queries
+
+
+def explain(cursor, sql):
+    cursor.execute("EXPLAIN " + sql)
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def find_issues(plan, min_rows):
+    issues = []
+    for step in plan:
+        table = step.get('table')
+        rows = step.get('rows') or 0
+        extra = step.get('Extra') or ""
+        if table is None or table.startswith("<"):
+            continue  # derived tables / unions are judged by their own steps
+        if step.get('type') == "ALL" and rows >= min_rows:
+            issues.append(f"full table scan on {table} (~{rows} rows)")
+        elif step.get('type') == "index" and rows >= min_rows:
+            issues.append(f"full index scan on {table} (~{rows} rows)")
+        if "Using filesort" in extra and rows >= min_rows:
+            issues.append(f"filesort on {table} (~{rows} rows)")
+    return issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN every app query and report full scans/filesorts")
+    parser.add_argument("paths", nargs="*", help="Python files to scan (default: all *.py here)")
+    parser.add_argument("--min-rows", type=int, default=1000,
+                        help="ignore scans the optimizer estimates below this many rows")
+    parser.add_argument("--verbose", action="store_true", help="print the plan of every query")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob("*.py"))
+    queries = collect_queries(paths)
+
+    conn = get_pool().acquire()
+    flagged = 0
+    try:
+        cursor = conn.cursor()
+        for sql, origin in queries.items():
+            try:
+                plan = explain(cursor, sql)
+            except Exception as e:
+                print(f"[ERROR] {origin}: {e}\n    {sql[:120]}")
+                flagged += 1
+                continue
+            issues = find_issues(plan, args.min_rows)
+            if issues:
+                flagged += 1
+                print(f"[WARN] {origin}: {sql[:120]}")
+                for issue in issues:
+                    print(f"    - {issue}")
+            elif args.verbose:
+                print(f"[OK] {origin}: {sql[:120]}")
+            if args.verbose:
+                for step in plan:
+                    print(f"    {step.get('table')}: type={step.get('type')} key={step.get('key')} "
+                          f"rows={step.get('rows')} extra={step.get('Extra')}")
+        cursor.close()
+    finally:
+        conn.close()
+
+    print(f"\n{len(queries)} queries checked, {flagged} with issues")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# instrumentation.py
+# Timing for every query db.py runs: connect / execute / fetch split, rows, bytes and the
+# page/tab that issued it. Recent records stay in a ring buffer; per-query latency
+# histograms cover everything since start-up. Optionally appended to a JSON-lines file.
+import bisect
+import contextvars
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict, field
+
+import pandas as pd
+
+from config import INSTRUMENTATION_CONFIG
+from query_cache import normalize_sql
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+_tag = contextvars.ContextVar('query_tag', default='')
+
+
+def set_tag(tag):
+    _tag.set(tag)
+
+
+def current_tag():
+    return _tag.get()
+
+
+# Run fn in a worker thread with the caller's tag (contextvars do not cross threads by themselves)
+def with_current_context(fn):
+    ctx = contextvars.copy_context()
+    return lambda *args, **kwargs: ctx.run(fn, *args, **kwargs)
+
+
+@dataclass
+class QueryRecord:
+    sql: str
+    tag: str
+    source: str               # 'db', 'cache', 'write' or 'export'
+    connect_ms: float = 0.0
+    execute_ms: float = 0.0
+    fetch_ms: float = 0.0
+    total_ms: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    error: str = None
+    at: float = field(default_factory=time.time)
+
+
+class QueryHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.bytes = 0
+
+    def add(self, record):
+        self.counts[bisect.bisect_left(BUCKETS_MS, record.total_ms)] += 1
+        self.calls += 1
+        self.errors += record.error is not None
+        self.total_ms += record.total_ms
+        self.max_ms = max(self.max_ms, record.total_ms)
+        self.rows += record.rows
+        self.bytes += record.bytes
+
+    # Upper bound of the bucket holding the q-th quantile, capped at the slowest call seen
+    def percentile(self, q):
+        target = q * self.calls
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                bound = BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max_ms
+                return round(min(bound, self.max_ms), 2)
+        return 0.0
+
+
+class QueryLog:
+    def __init__(self, ring_size=1000, log_path=None, slow_ms=500):
+        self.slow_ms = slow_ms
+        self.log_path = log_path
+        self._recent = deque(maxlen=ring_size)
+        self._histograms = {}   # (normalized sql, source) -> QueryHistogram
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+
+    def record(self, record):
+        record.sql = normalize_sql(record.sql)
+        with self._lock:
+            self._recent.append(record)
+            key = (record.sql, record.source)
+            if key not in self._histograms:
+                self._histograms[key] = QueryHistogram()
+            self._histograms[key].add(record)
+        if self.log_path:
+            line = json.dumps(asdict(record), default=str)
+            with self._log_lock:
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+
+    def recent(self):
+        with self._lock:
+            records = list(self._recent)
+        return pd.DataFrame([asdict(r) for r in records]) if records else pd.DataFrame()
+
+    def summary(self):
+        with self._lock:
+            items = list(self._histograms.items())
+        rows = []
+        for (sql, source), h in items:
+            rows.append({
+                'Query': sql,
+                'Source': source,
+                'Calls': h.calls,
+                'Errors': h.errors,
+                'Avg_ms': round(h.total_ms / h.calls, 2),
+                'p50_ms': h.percentile(0.50),
+                'p95_ms': h.percentile(0.95),
+                'p99_ms': h.percentile(0.99),
+                'Max_ms': round(h.max_ms, 2),
+                'Avg_Rows': round(h.rows / h.calls, 1),
+                'Total_MB': round(h.bytes / 1024 / 1024, 3),
+            })
+        return pd.DataFrame(rows).sort_values('p95_ms', ascending=False) if rows else pd.DataFrame()
+
+    def histogram(self, sql, source='db'):
+        with self._lock:
+            h = self._histograms.get((sql, source))
+            counts = list(h.counts) if h else [0] * (len(BUCKETS_MS) + 1)
+        labels = [f"≤{b} ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]} ms"]
+        return pd.DataFrame({'Bucket': labels, 'Calls': counts})
+
+    def slow(self):
+        df = self.recent()
+        if len(df) == 0:
+            return df
+        return df[df['total_ms'] >= self.slow_ms].sort_values('total_ms', ascending=False)
+
+    def clear(self):
+        with self._lock:
+            self._recent.clear()
+            self._histograms.clear()
+
+
+query_log = QueryLog(**INSTRUMENTATION_CONFIG)
+
+
+class Timer:
+    # Splits one query into phases: with timer.phase('execute'): ...
+    def __init__(self, sql, source='db'):
+        self.record = QueryRecord(sql=sql, tag=current_tag(), source=source)
+        self._start = time.perf_counter()
+
+    def phase(self, name):
+        return _Phase(self.record, name + '_ms')
+
+    def finish(self, rows=0, nbytes=0, error=None):
+        self.record.total_ms = round((time.perf_counter() - self._start) * 1000, 3)
+        self.record.rows = rows
+        self.record.bytes = nbytes
+        self.record.error = None if error is None else f"{type(error).__name__}: {error}"
+        query_log.record(self.record)
+
+
+class _Phase:
+    def __init__(self, record, attr):
+        self.record = record
+        self.attr = attr
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb):
+        setattr(self.record, self.attr, round((time.perf_counter() - self._start) * 1000, 3))
@@ -0,0 +1,38 @@
+# lazy_tabs.py
+# Tabs whose bodies only run when selected, plus a per-session memo for what they load.
+import time
+
+import streamlit as st
+
+from config import CACHE_CONFIG
+from db import execute_query, query_cache
+from instrumentation import current_tag, set_tag
+from query_cache import read_tables
+
+
+# st.tabs runs every tab body on each rerun. With on_change="rerun" the selection is tracked
+# and each tab's .open says whether it is showing, so callers guard bodies with `if tab.open:`.
+def lazy_tabs(labels, key):
+    tabs = st.tabs(labels, key=key, on_change="rerun")
+    # Queries from here on are attributed to "Page/Tab"
+    selected = st.session_state.get(key) or labels[0]
+    set_tag(f"{current_tag().split('/')[0]}/{selected}")
+    return tabs
+
+
+# execute_query remembered in this session until a write bumps one of its tables or the TTL
+# passes, so switching back to a tab costs no query and no shared-cache lookup.
+def session_query(query, params=None, ttl=None, prepared=False):
+    ttl = CACHE_CONFIG['default_ttl'] if ttl is None else ttl
+    memo = st.session_state.setdefault('_session_queries', {})
+    key = query_cache.make_key(query, params)
+    version = query_cache.version(read_tables(query))
+
+    entry = memo.get(key)
+    if entry is not None and entry[0] == version and time.monotonic() - entry[1] < ttl:
+        return entry[2]
+
+    df = execute_query(query, params, ttl, prepared)
+    if df is not None:
+        memo[key] = (version, time.monotonic(), df)
+    return df
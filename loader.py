@@ -0,0 +1,121 @@
+# loader.py
+# Runs a page's independent reads side by side, each on its own pooled connection, so the
+# page waits for roughly its slowest query instead of the sum. Every read has a timeout:
+# MySQL stops a SELECT at the deadline (MAX_EXECUTION_TIME), and one that has still not
+# returned is ended with KILL QUERY. Results come back per name, so one slow or failing
+# read does not lose the others.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+
+import mysql.connector
+
+from config import POOL_CONFIG, LOADER_CONFIG
+from db import read_df, CancelToken, QueryCancelledError, QUERY_TIMEOUT
+from instrumentation import with_current_context
+
+# More workers than pooled connections would only queue inside the pool
+_executor = ThreadPoolExecutor(max_workers=POOL_CONFIG['pool_size'], thread_name_prefix="loader")
+
+
+@dataclass
+class Load:
+    query: str
+    params: tuple = None
+    ttl: int = None
+    timeout: float = None       # seconds; None -> LOADER_CONFIG['timeout']
+    prepared: bool = False
+    dtypes: dict = None
+
+
+@dataclass
+class LoadResult:
+    name: str
+    df: object = None
+    status: str = 'ok'          # 'ok', 'timeout', 'cancelled' or 'error'
+    error: Exception = None
+    ms: float = 0.0
+
+    @property
+    def ok(self):
+        return self.status == 'ok'
+
+    def message(self):
+        if self.status == 'timeout':
+            return f"{self.name} timed out after {self.ms / 1000:.1f}s"
+        if self.status == 'cancelled':
+            return f"{self.name} was cancelled"
+        return f"{self.name} failed: {self.error}"
+
+
+class LoadBatch:
+    # Submits every load at once; wait() collects them, cancelling any that pass their timeout
+    def __init__(self, loads):
+        self._started = time.perf_counter()
+        self._tokens = {}
+        self._futures = {}
+        self._deadlines = {}
+        self._results = {}
+        for name, load in loads.items():
+            timeout = LOADER_CONFIG['timeout'] if load.timeout is None else load.timeout
+            token = CancelToken()
+            self._tokens[name] = token
+            self._deadlines[name] = self._started + timeout
+            self._futures[name] = _executor.submit(
+                with_current_context(read_df), load.query, load.params, load.ttl, load.prepared,
+                load.dtypes, max_ms=timeout * 1000, cancel=token
+            )
+
+    def _elapsed_ms(self):
+        return (time.perf_counter() - self._started) * 1000
+
+    def _stop(self, name, status):
+        if name in self._results:
+            return
+        self._futures[name].cancel()         # not started yet: never runs
+        # Running: KILL QUERY, from a side thread so the page does not wait on it
+        threading.Thread(target=self._tokens[name].cancel, daemon=True).start()
+        self._results[name] = LoadResult(name, status=status, ms=self._elapsed_ms())
+
+    def cancel(self, name=None):
+        for n in ([name] if name else list(self._futures)):
+            if not self._futures[n].done():
+                self._stop(n, 'cancelled')
+
+    def _collect(self, name):
+        future = self._futures[name]
+        try:
+            result = LoadResult(name, df=future.result(), ms=self._elapsed_ms())
+        except QueryCancelledError as err:
+            result = LoadResult(name, status='cancelled', error=err, ms=self._elapsed_ms())
+        except mysql.connector.Error as err:
+            status = 'timeout' if err.errno == QUERY_TIMEOUT else 'error'
+            result = LoadResult(name, status=status, error=err, ms=self._elapsed_ms())
+        except Exception as err:
+            result = LoadResult(name, status='error', error=err, ms=self._elapsed_ms())
+        self._results[name] = result
+
+    def wait(self):
+        pending = {name for name in self._futures if name not in self._results}
+        while pending:
+            now = time.perf_counter()
+            for name in [n for n in pending if self._deadlines[n] <= now]:
+                # A timed-out read is not waited for; the kill ends it in the background
+                self._stop(name, 'timeout')
+                pending.discard(name)
+            if not pending:
+                break
+            futures = {self._futures[n]: n for n in pending}
+            next_deadline = min(self._deadlines[n] for n in pending)
+            done, _ = wait(futures, timeout=max(next_deadline - time.perf_counter(), 0), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures[future]
+                self._collect(name)
+                pending.discard(name)
+        return {name: self._results[name] for name in self._futures}
+
+
+# {name: Load} -> {name: LoadResult}
+def load_all(loads):
+    return LoadBatch(loads).wait()
@@ -0,0 +1,188 @@
+# materialize.py
+# DataFrames built straight from a cursor. Rows are fetched FETCH_SIZE at a time and each
+# column of a chunk is turned into a NumPy array right away, so the full result never sits
+# in memory as Python tuples. DECIMAL/FLOAT columns become float64 and integer columns int64
+# (float64 if they hold NULLs, like pd.read_sql). Other columns stay as they come back unless
+# the caller declares a dtype for them, e.g. {'Date': 'datetime64'}.
+import argparse
+import time
+import tracemalloc
+import warnings
+
+import mysql.connector
+import numpy as np
+import pandas as pd
+from mysql.connector import FieldType
+
+from config import DB_CONFIG
+
+FETCH_SIZE = 10_000
+
+FLOAT_TYPES = {FieldType.DECIMAL, FieldType.NEWDECIMAL, FieldType.FLOAT, FieldType.DOUBLE}
+INT_TYPES = {FieldType.TINY, FieldType.SHORT, FieldType.INT24, FieldType.LONG, FieldType.LONGLONG,
+             FieldType.YEAR}
+
+# Declarable per-column dtypes
+DTYPES = ('float64', 'int64', 'datetime64', 'category', 'object')
+
+
+def column_kinds(description, dtypes=None):
+    dtypes = dtypes or {}
+    kinds = []
+    for column in description:
+        name, type_code = column[0], column[1]
+        if name in dtypes:
+            if dtypes[name] not in DTYPES:
+                raise ValueError(f"Unknown dtype {dtypes[name]!r} for column {name}")
+            kinds.append(dtypes[name])
+        elif type_code in FLOAT_TYPES:
+            kinds.append('float64')
+        elif type_code in INT_TYPES:
+            kinds.append('int64')
+        else:
+            kinds.append('object')
+    return kinds
+
+
+# One column of a chunk (an object array) to its dtype; NULL becomes NaN / NaT
+def _convert(values, kind):
+    if kind == 'float64':
+        return values.astype('float64')
+    if kind == 'datetime64':
+        return pd.to_datetime(values).to_numpy().astype('datetime64[us]')
+    if kind == 'int64':
+        try:
+            return values.astype('int64')
+        except TypeError:
+            return values.astype('float64')
+    return values.copy()
+
+
+# Per chunk: one converted array per column
+def _column_chunks(cursor, kinds, fetch_size):
+    while True:
+        rows = cursor.fetchmany(fetch_size)
+        if not rows:
+            break
+        # Rows -> 2-D object block in one C-level pass, then sliced into columns
+        block = np.empty((len(rows), len(kinds)), dtype=object)
+        block[:] = rows
+        yield [_convert(block[:, i], kind) for i, kind in enumerate(kinds)]
+
+
+def _frame(columns, kinds, arrays):
+    data = {name: pd.Categorical(array) if kind == 'category' else array
+            for name, kind, array in zip(columns, kinds, arrays)}
+    return pd.DataFrame(data, columns=columns)
+
+
+def frame_from_cursor(cursor, dtypes=None, fetch_size=FETCH_SIZE):
+    columns = [c[0] for c in cursor.description]
+    kinds = column_kinds(cursor.description, dtypes)
+    parts = list(zip(*_column_chunks(cursor, kinds, fetch_size))) or [[] for _ in columns]
+    arrays = []
+    for kind, chunks in zip(kinds, parts):
+        if not chunks:
+            arrays.append(_convert(np.empty(0, dtype=object), kind))
+        elif len(chunks) == 1:
+            arrays.append(chunks[0])
+        else:
+            arrays.append(np.concatenate(chunks))
+    return _frame(columns, kinds, arrays)
+
+
+# One DataFrame per fetched chunk, for callers that write results out instead of keeping them
+def iter_frames(cursor, dtypes=None, fetch_size=FETCH_SIZE):
+    columns = [c[0] for c in cursor.description]
+    kinds = column_kinds(cursor.description, dtypes)
+    for arrays in _column_chunks(cursor, kinds, fetch_size):
+        yield _frame(columns, kinds, arrays)
+
+
+# ---------- benchmark: old read_sql path vs. fetchall + from_records vs. chunked ----------
+
+BENCH_QUERY = """
+SELECT fr.Round_ID, fr.Startup_ID, s.Name AS Startup, fr.Date, fr.Amount, fr.Stage
+FROM funding_rounds fr
+JOIN startups s ON fr.Startup_ID = s.Startup_ID
+ORDER BY fr.Round_ID
+LIMIT %s
+"""
+BENCH_DTYPES = {'Date': 'datetime64', 'Stage': 'category'}
+
+
+def _read_sql(conn, limit):
+    # pandas warns that raw DBAPI connections are untested; this is the path being replaced
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        return pd.read_sql(BENCH_QUERY, conn, params=(limit,))
+
+
+def _from_records(conn, limit):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(BENCH_QUERY, (limit,))
+        rows = cursor.fetchall()
+        return pd.DataFrame.from_records(rows, columns=[c[0] for c in cursor.description], coerce_float=True)
+    finally:
+        cursor.close()
+
+
+def _chunked(conn, limit):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(BENCH_QUERY, (limit,))
+        return frame_from_cursor(cursor, BENCH_DTYPES)
+    finally:
+        cursor.close()
+
+
+PATHS = {'read_sql': _read_sql, 'from_records': _from_records, 'chunked': _chunked}
+
+
+def benchmark(database=None, limit=1_000_000, runs=3):
+    config = {**DB_CONFIG, 'database': database or DB_CONFIG['database']}
+    drivers = ['pure', 'c_ext'] if mysql.connector.HAVE_CEXT else ['pure']
+    rows = []
+    for driver in drivers:
+        conn = mysql.connector.connect(**config, use_pure=(driver == 'pure'))
+        try:
+            for path, fetch in PATHS.items():
+                fetch(conn, 10)  # warm-up
+                samples = []
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    df = fetch(conn, limit)
+                    samples.append((time.perf_counter() - start) * 1000)
+                # Memory in a separate run: tracemalloc slows allocation-heavy code down
+                del df
+                tracemalloc.start()
+                df = fetch(conn, limit)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                rows.append({
+                    'driver': driver,
+                    'path': path,
+                    'rows': len(df),
+                    'median_ms': float(np.median(samples)),
+                    'peak_mb': peak / 2 ** 20,
+                    'df_mb': df.memory_usage(deep=True).sum() / 2 ** 20,
+                    'Amount': str(df['Amount'].dtype),
+                    'Date': str(df['Date'].dtype),
+                })
+        finally:
+            conn.close()
+    result = pd.DataFrame(rows)
+    base = result[result['path'] == 'read_sql'].set_index('driver')
+    result['speedup'] = base.loc[result['driver'], 'median_ms'].to_numpy() / result['median_ms']
+    result['memory_saved'] = 1 - result['peak_mb'] / base.loc[result['driver'], 'peak_mb'].to_numpy()
+    return result.round(3)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare DataFrame materialization paths on a large result set")
+    parser.add_argument("--database", help="database to read (default: DB_CONFIG); see benchmark.py --backend mysql")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="LIMIT on the funding_rounds query")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    print(benchmark(args.database, args.rows, args.runs).to_string(index=False))
@@ -0,0 +1,134 @@
+# pagination.py
+from dataclasses import dataclass, field
+
+import pandas as pd
+import streamlit as st
+
+from db import execute_query
+from export import export_panel
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+@dataclass
+class TableSpec:
+    name: str                 # widget / session-state key prefix
+    columns: str              # SELECT list
+    from_clause: str          # FROM ... JOIN ...
+    key: str                  # unique key expression, tiebreaker for every sort
+    sort_columns: dict        # label -> SQL expression
+    filter_columns: dict = field(default_factory=dict)  # label -> SQL expression (prefix match)
+    default_descending: bool = False
+
+
+def _py(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value.item() if hasattr(value, 'item') else value
+
+
+def escape_like(text):
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _keyset_condition(sort_expr, key, cursor, descending):
+    # Rows strictly after the last row shown, in (sort_expr, key) order.
+    # MySQL sorts NULLs first ascending and last descending.
+    sort_value, key_value = cursor
+    op = '<' if descending else '>'
+    if sort_expr == key:
+        return f"{key} {op} %s", [key_value]
+    if sort_value is None:
+        if descending:
+            return f"({sort_expr} IS NULL AND {key} < %s)", [key_value]
+        return f"(({sort_expr} IS NULL AND {key} > %s) OR {sort_expr} IS NOT NULL)", [key_value]
+    condition = f"({sort_expr} {op} %s OR ({sort_expr} = %s AND {key} {op} %s)"
+    if descending:
+        condition += f" OR {sort_expr} IS NULL"
+    return condition + ")", [sort_value, sort_value, key_value]
+
+
+def _filter_condition(filter_expr, filter_text):
+    if filter_expr and filter_text:
+        return [f"{filter_expr} LIKE %s"], [escape_like(filter_text) + '%']
+    return [], []
+
+
+def _order_by(spec, sort_expr, descending):
+    direction = 'DESC' if descending else 'ASC'
+    return f"{spec.key} {direction}" if sort_expr == spec.key else f"{sort_expr} {direction}, {spec.key} {direction}"
+
+
+def build_page_query(spec, sort_expr, descending, page_size, filter_expr=None, filter_text="", cursor=None):
+    conditions, params = _filter_condition(filter_expr, filter_text)
+    if cursor is not None:
+        condition, values = _keyset_condition(sort_expr, spec.key, cursor, descending)
+        conditions.append(condition)
+        params.extend(values)
+
+    query = f"SELECT {spec.columns}, {sort_expr} AS _sort_key, {spec.key} AS _row_key FROM {spec.from_clause}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    # One extra row tells us whether there is a next page
+    query += f" ORDER BY {_order_by(spec, sort_expr, descending)} LIMIT %s"
+    params.append(page_size + 1)
+    return query, params
+
+
+# Every row of the current view (sort and filter, no paging) and its row count, for export
+def build_view_query(spec, sort_expr, descending, filter_expr=None, filter_text=""):
+    conditions, params = _filter_condition(filter_expr, filter_text)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    query = f"SELECT {spec.columns} FROM {spec.from_clause}{where} ORDER BY {_order_by(spec, sort_expr, descending)}"
+    count_query = f"SELECT COUNT(*) AS Row_Count FROM {spec.from_clause}{where}"
+    return query, count_query, params
+
+
+def paginated_table(spec):
+    col1, col2, col3, col4, col5 = st.columns([2, 1, 2, 2, 1])
+    sort_label = col1.selectbox("Sort by", list(spec.sort_columns), key=f"{spec.name}_sort")
+    descending = col2.selectbox(
+        "Order", ["Ascending", "Descending"], index=1 if spec.default_descending else 0, key=f"{spec.name}_order"
+    ) == "Descending"
+    filter_label, filter_text = None, ""
+    if spec.filter_columns:
+        filter_label = col3.selectbox("Filter on", list(spec.filter_columns), key=f"{spec.name}_filter_col")
+        filter_text = col4.text_input("Starts with", key=f"{spec.name}_filter").strip()
+    page_size = col5.selectbox("Rows", PAGE_SIZES, key=f"{spec.name}_page_size")
+
+    # Cursor stack: entry i is the last (sort, key) pair before page i; reset when the view changes
+    view = (sort_label, descending, filter_label, filter_text, page_size)
+    state_key = f"{spec.name}_cursors"
+    if st.session_state.get(f"{spec.name}_view") != view:
+        st.session_state[f"{spec.name}_view"] = view
+        st.session_state[state_key] = [None]
+    cursors = st.session_state[state_key]
+
+    sort_expr = spec.sort_columns[sort_label]
+    filter_expr = spec.filter_columns.get(filter_label) if filter_label else None
+    query, params = build_page_query(spec, sort_expr, descending, page_size, filter_expr, filter_text, cursors[-1])
+    df = execute_query(query, params)
+    if df is None:
+        return None
+
+    has_next = len(df) > page_size
+    df = df.iloc[:page_size]
+    st.dataframe(df.drop(columns=['_sort_key', '_row_key']), use_container_width=True, hide_index=True)
+
+    page = len(cursors)
+    first_row = (page - 1) * page_size + 1 if len(df) else 0
+    nav1, nav2, nav3 = st.columns([1, 3, 1])
+    if nav1.button("◀ Previous", disabled=page == 1, key=f"{spec.name}_prev", use_container_width=True):
+        cursors.pop()
+        st.rerun()
+    nav2.caption(f"Page {page} · rows {first_row}–{first_row + len(df) - 1 if len(df) else 0}")
+    if nav3.button("Next ▶", disabled=not has_next, key=f"{spec.name}_next", use_container_width=True):
+        last = df.iloc[-1]
+        cursors.append((_py(last['_sort_key']), _py(last['_row_key'])))
+        st.rerun()
+
+    view_query, count_query, view_params = build_view_query(spec, sort_expr, descending, filter_expr, filter_text)
+    export_panel(spec.name, view_query, view_params, count_query=count_query)
+    return df
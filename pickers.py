@@ -0,0 +1,67 @@
+# pickers.py
+import streamlit as st
+
+from db import execute_query
+from pagination import escape_like
+
+# entity -> (table, id column, name column); every name column is indexed
+ENTITIES = {
+    'startup': ('startups', 'Startup_ID', 'Name'),
+    'investor': ('investors', 'Investor_ID', 'Name'),
+    'founder': ('founders', 'Founder_ID', 'Name'),
+}
+
+PICKER_LIMIT = 20
+
+
+def search_query(entity):
+    table, id_col, name_col = ENTITIES[entity]
+    return f"SELECT {id_col} AS ID, {name_col} AS Name FROM {table} WHERE {name_col} LIKE %s ORDER BY {name_col} LIMIT %s"
+
+
+def search_entities(entity, prefix, limit=PICKER_LIMIT):
+    return execute_query(search_query(entity), (escape_like(prefix) + '%', limit))
+
+
+def entity_name(entity, entity_id):
+    table, id_col, name_col = ENTITIES[entity]
+    df = execute_query(f"SELECT {name_col} AS Name FROM {table} WHERE {id_col} = %s", (int(entity_id),))
+    return df.iloc[0]['Name'] if df is not None and len(df) > 0 else None
+
+
+# Search-as-you-type selectbox. Typing reruns the script, so call this outside st.form.
+# Pass default_label when the caller already has the default's name to skip the lookup.
+def entity_picker(label, entity, key, default_id=None, default_label=None):
+    prefix = st.text_input(f"Search {label}", key=f"{key}_search", placeholder="Type the first letters of the name")
+    df = search_entities(entity, prefix.strip())
+    names = dict(zip(df['ID'].astype(int), df['Name'])) if df is not None else {}
+
+    options = list(names)
+    if default_id is not None:
+        default_id = int(default_id)
+        if default_id not in names:
+            name = default_label if default_label is not None else entity_name(entity, default_id)
+            if name is not None:
+                names[default_id] = name
+                options.insert(0, default_id)
+
+    if not options:
+        st.caption(f"No {label.lower()} matches '{prefix}'")
+        return None
+    if len(names) >= PICKER_LIMIT:
+        st.caption(f"Showing the first {PICKER_LIMIT} matches - keep typing to narrow down")
+
+    index = options.index(default_id) if default_id in names else 0
+    return st.selectbox(label, options, index=index, format_func=names.get, key=key)
+
+
+# Multi-select over the same prefix search; chosen entries stay listed while the search changes
+def entity_multipicker(label, entity, key):
+    prefix = st.text_input(f"Search {label}", key=f"{key}_search", placeholder="Type the first letters of the name")
+    known = st.session_state.setdefault(f"{key}_names", {})
+    names = {i: known[i] for i in st.session_state.get(key, []) if i in known}
+    df = search_entities(entity, prefix.strip())
+    if df is not None:
+        names.update(zip(df['ID'].astype(int), df['Name']))
+    known.update(names)
+    return st.multiselect(label, list(names), format_func=names.get, key=key)
@@ -0,0 +1,170 @@
+# query_cache.py
+import re
+import threading
+import time
+from collections import OrderedDict
+
+_READ_TABLES = re.compile(r'\b(?:FROM|JOIN)\s+`?(\w+)`?', re.IGNORECASE)
+_WRITE_TABLE = re.compile(
+    r'^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM|CALL)\s+`?(\w+)`?',
+    re.IGNORECASE
+)
+
+# Foreign keys cascade (or SET NULL) into these tables, so a write to the key also changes them
+CASCADES = {
+    'countries': ['cities', 'investors'],
+    'cities': ['startups'],
+    'industries': ['startups'],
+    'startups': ['founders', 'funding_rounds', 'startup_milestones', 'acquisitions'],
+    'funding_rounds': ['funding_round_investors'],
+    'investors': ['funding_round_investors'],
+}
+
+# Rollup tables maintained by triggers (db/summary_tables.sql) on these base tables
+TRIGGERS = {
+    'startups': ['startup_funding_summary', 'industry_funding_summary', 'city_funding_summary', 'stage_funding_summary',
+                 'monthly_funding_summary'],
+    'funding_rounds': ['startup_funding_summary', 'industry_funding_summary', 'city_funding_summary', 'stage_funding_summary',
+                       'monthly_funding_summary'],
+}
+
+# Views (db/views.sql) and the tables they read
+VIEWS = {
+    'startup_funding_totals': ['startup_funding_summary'],
+    'startup_milestone_counts': ['startup_milestones'],
+    'funding_average': ['funding_rounds'],
+}
+
+# Stored procedures and the tables they write
+PROCEDURES = {
+    'add_funding': ['funding_rounds', 'funding_round_investors'],
+    'add_funding_batch': ['funding_rounds', 'funding_round_investors'],
+    'record_acq': ['acquisitions'],
+    'rebuild_funding_summaries': TRIGGERS['funding_rounds'],
+}
+
+
+def normalize_sql(query):
+    return ' '.join(query.split()).rstrip(';')
+
+
+def read_tables(query):
+    tables = {t.lower() for t in _READ_TABLES.findall(query)}
+    for view in tables & VIEWS.keys():
+        tables.update(VIEWS[view])
+    return frozenset(tables)
+
+
+def written_tables(query):
+    match = _WRITE_TABLE.match(query)
+    if not match:
+        return set()
+    target = match.group(1).lower()
+    return set(PROCEDURES.get(target, [target]))
+
+
+def with_cascades(tables):
+    pending, seen = list(tables), set()
+    while pending:
+        table = pending.pop()
+        if table not in seen:
+            seen.add(table)
+            pending.extend(CASCADES.get(table, []))
+            pending.extend(TRIGGERS.get(table, []))
+    return seen
+
+
+class QueryCache:
+    # LRU over DataFrames, bounded by their in-memory size, with per-entry TTL
+    # and table-level invalidation
+    def __init__(self, max_bytes=64 * 1024 * 1024, default_ttl=300):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        self._entries = OrderedDict()  # key -> (df, tables, expires_at, nbytes)
+        self._bytes = 0
+        self._versions = {}  # table -> write counter
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0, 'invalidations': 0, 'skipped': 0}
+
+    @staticmethod
+    def make_key(query, params=None, dtypes=None):
+        key = normalize_sql(query), repr(tuple(params)) if params else ''
+        return key + (tuple(sorted(dtypes.items())),) if dtypes else key
+
+    def version(self, tables):
+        with self._lock:
+            return tuple(self._versions.get(t, 0) for t in sorted(tables))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            if entry[2] < time.monotonic():
+                self._drop(key)
+                self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def put(self, key, df, tables, ttl=None, version=None, nbytes=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        if nbytes is None:
+            nbytes = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            # A write landed while this result was being fetched; it may already be stale
+            if version is not None and version != tuple(self._versions.get(t, 0) for t in sorted(tables)):
+                self._stats['skipped'] += 1
+                return
+            if ttl <= 0 or nbytes > self.max_bytes:
+                self._stats['skipped'] += 1
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (df, tables, time.monotonic() + ttl, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    # callback(tables) runs after every invalidation, for in-process state derived from those tables
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def invalidate(self, tables):
+        tables = with_cascades(tables)
+        if not tables:
+            return tables
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+            stale = [key for key, entry in self._entries.items() if entry[1] & tables]
+            for key in stale:
+                self._drop(key)
+            self._stats['invalidations'] += len(stale)
+        for callback in self._listeners:
+            callback(tables)
+        return tables
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[3]
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
@@ -0,0 +1,218 @@
+# statements.py
+# Every SQL statement app.py runs, by name. Values are always bound parameters, never
+# formatted into the text, and each statement is prepared once per pooled connection
+# (db.ConnectionPool.prepared), then re-executed with new values.
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from analytics import (
+    INDUSTRY_FUNDING_QUERY, TOP_STARTUPS_QUERY, STAGE_DISTRIBUTION_QUERY, CITY_STARTUPS_QUERY,
+    NESTED_QUERY, SECTORS_QUERY, AGGREGATE_METRICS
+)
+from db import execute_query, execute_insert_update, read_df
+
+STATEMENTS = {
+    # Startups
+    'startup_insert': "INSERT INTO startups (Startup_ID, Name, Founded_Year, City_ID, Industry_ID) VALUES (%s, %s, %s, %s, %s)",
+    'startup_by_id': "SELECT * FROM startups WHERE Startup_ID = %s",
+    'startup_update': "UPDATE startups SET Name = %s, Founded_Year = %s, City_ID = %s, Industry_ID = %s WHERE Startup_ID = %s",
+    'startup_delete': "DELETE FROM startups WHERE Startup_ID = %s",
+
+    # Investors
+    'investor_insert': "INSERT INTO investors (Investor_ID, Name, Type, Country_ID) VALUES (%s, %s, %s, %s)",
+    'investor_by_id': "SELECT * FROM investors WHERE Investor_ID = %s",
+    'investor_update': "UPDATE investors SET Name = %s, Type = %s, Country_ID = %s WHERE Investor_ID = %s",
+    'investor_delete': "DELETE FROM investors WHERE Investor_ID = %s",
+
+    # Funding rounds (inserts go through funding.add_funding_rounds). A round is looked up by
+    # Round_ID and Date, so a partitioned funding_rounds (db/partitioning.sql) only opens the
+    # round's own partition
+    'round_ids_for_startup': "SELECT Round_ID, Date FROM funding_rounds WHERE Startup_ID = %s ORDER BY Round_ID",
+    'round_by_id': """
+        SELECT fr.*, s.Name AS Startup_Name
+        FROM funding_rounds fr JOIN startups s ON fr.Startup_ID = s.Startup_ID
+        WHERE fr.Round_ID = %s AND fr.Date <=> %s
+    """,
+    'round_update': "UPDATE funding_rounds SET Date = %s, Amount = %s, Stage = %s, Startup_ID = %s WHERE Round_ID = %s AND Date <=> %s",
+    'round_delete': "DELETE FROM funding_rounds WHERE Round_ID = %s AND Date <=> %s",
+
+    # Founders
+    'founder_insert': "INSERT INTO founders (Founder_ID, Name, Startup_ID, Role, LinkedIn_URL) VALUES (%s, %s, %s, %s, %s)",
+    'founder_by_id': """
+        SELECT f.*, s.Name AS Startup_Name
+        FROM founders f LEFT JOIN startups s ON f.Startup_ID = s.Startup_ID
+        WHERE f.Founder_ID = %s
+    """,
+    'founder_update': "UPDATE founders SET Name = %s, Role = %s, LinkedIn_URL = %s, Startup_ID = %s WHERE Founder_ID = %s",
+    'founder_delete': "DELETE FROM founders WHERE Founder_ID = %s",
+
+    # Acquisitions
+    'acquisition_insert': "INSERT INTO acquisitions (AcquisitionID, Acquirer_Startup_ID, Target_Startup_ID, Date, Amount) VALUES (%s, %s, %s, %s, %s)",
+    'acquisitions_by_acquirer': """
+        SELECT a.AcquisitionID, a.Acquirer_Startup_ID, a.Target_Startup_ID, s2.Name AS Target, s1.Name AS Acquirer, a.Date, a.Amount
+        FROM acquisitions a
+        JOIN startups s1 ON a.Acquirer_Startup_ID = s1.Startup_ID
+        JOIN startups s2 ON a.Target_Startup_ID = s2.Startup_ID
+        WHERE a.Acquirer_Startup_ID = %s
+        ORDER BY a.Date DESC
+    """,
+    'acquisition_targets_by_acquirer': """
+        SELECT a.AcquisitionID, s2.Name AS Target, a.Date
+        FROM acquisitions a
+        JOIN startups s2 ON a.Target_Startup_ID = s2.Startup_ID
+        WHERE a.Acquirer_Startup_ID = %s
+        ORDER BY a.Date DESC
+    """,
+    'acquisition_update': "UPDATE acquisitions SET Acquirer_Startup_ID = %s, Target_Startup_ID = %s, Date = %s, Amount = %s WHERE AcquisitionID = %s",
+    'acquisition_delete': "DELETE FROM acquisitions WHERE AcquisitionID = %s",
+
+    # Analytics
+    'industry_funding': INDUSTRY_FUNDING_QUERY,
+    'top_startups': TOP_STARTUPS_QUERY,
+    'stage_distribution': STAGE_DISTRIBUTION_QUERY,
+    'city_startups': CITY_STARTUPS_QUERY,
+    'nested': NESTED_QUERY,
+    'sectors': SECTORS_QUERY,
+}
+
+# Join Query: one statement per filter combination, so each keeps its own plan
+JOIN_SELECT = """
+    SELECT
+        s.Name AS Startup_Name,
+        i.Sector AS Industry,
+        c.Name AS City,
+        fr.Stage AS Funding_Stage,
+        fr.Amount AS Funding_Amount,
+        fr.Date AS Funding_Date
+    FROM startups s
+    LEFT JOIN industries i ON s.Industry_ID = i.Industry_ID
+    LEFT JOIN cities c ON s.City_ID = c.City_ID
+    LEFT JOIN funding_rounds fr ON s.Startup_ID = fr.Startup_ID
+    WHERE 1=1{filters}
+    ORDER BY fr.Date DESC LIMIT 50
+"""
+JOIN_FILTERS = {
+    (False, False): '',
+    (True, False): ' AND i.Sector = %s',
+    (False, True): ' AND fr.Stage = %s',
+    (True, True): ' AND i.Sector = %s AND fr.Stage = %s',
+}
+for (by_sector, by_stage), filters in JOIN_FILTERS.items():
+    STATEMENTS[f"join_{int(by_sector)}{int(by_stage)}"] = JOIN_SELECT.format(filters=filters)
+
+# Aggregate Query: ORDER BY cannot be a bound parameter, so there is one statement per
+# (group, metric); LIMIT is bound
+AGGREGATE_SELECTS = {
+    'Industry': """
+        SELECT
+            i.Sector AS Category,
+            COALESCE(SUM(f.Startups), 0) AS Total_Startups,
+            COALESCE(SUM(f.Rounds), 0) AS Total_Rounds,
+            COALESCE(SUM(f.Total_Funding), 0) AS Total_Funding,
+            COALESCE(SUM(f.Total_Funding) / NULLIF(SUM(f.Rounds), 0), 0) AS Avg_Funding,
+            COALESCE(MIN(f.Min_Funding), 0) AS Min_Funding,
+            COALESCE(MAX(f.Max_Funding), 0) AS Max_Funding
+        FROM industries i
+        LEFT JOIN industry_funding_summary f ON i.Industry_ID = f.Industry_ID
+        GROUP BY i.Sector
+        ORDER BY {order_by} DESC
+        LIMIT %s
+    """,
+    'City': """
+        SELECT
+            c.Name AS Category,
+            COALESCE(SUM(f.Startups), 0) AS Total_Startups,
+            COALESCE(SUM(f.Rounds), 0) AS Total_Rounds,
+            COALESCE(SUM(f.Total_Funding), 0) AS Total_Funding,
+            COALESCE(SUM(f.Total_Funding) / NULLIF(SUM(f.Rounds), 0), 0) AS Avg_Funding
+        FROM cities c
+        LEFT JOIN city_funding_summary f ON c.City_ID = f.City_ID
+        GROUP BY c.Name
+        ORDER BY {order_by} DESC
+        LIMIT %s
+    """,
+    'Funding Stage': """
+        SELECT
+            Stage AS Category,
+            Rounds AS Total_Rounds,
+            Total_Funding,
+            COALESCE(Total_Funding / NULLIF(Rounds, 0), 0) AS Avg_Funding,
+            COALESCE(Min_Funding, 0) AS Min_Funding,
+            COALESCE(Max_Funding, 0) AS Max_Funding
+        FROM stage_funding_summary
+        WHERE Rounds > 0
+        ORDER BY {order_by} DESC
+        LIMIT %s
+    """,
+}
+for group, select in AGGREGATE_SELECTS.items():
+    for metric, column in AGGREGATE_METRICS.items():
+        STATEMENTS[f"aggregate_{group}_{metric}".lower().replace(' ', '_')] = select.format(order_by=column)
+
+
+def join_statement(sector=None, stage=None):
+    name = f"join_{int(bool(sector))}{int(bool(stage))}"
+    return name, tuple(v for v in (sector, stage) if v)
+
+
+def aggregate_statement(group_by, metric):
+    return f"aggregate_{group_by}_{metric}".lower().replace(' ', '_')
+
+
+def named_query(name, params=None, ttl=None):
+    return execute_query(STATEMENTS[name], params, ttl, prepared=True)
+
+
+def named_write(name, params=None):
+    return execute_insert_update(STATEMENTS[name], params, prepared=True)
+
+
+# Prepared vs. plain-text execution of the app's hot reads, against the configured database
+BENCH_SAMPLES = {
+    'startup_by_id': "SELECT Startup_ID FROM startups LIMIT 200",
+    'investor_by_id': "SELECT Investor_ID FROM investors LIMIT 200",
+    'round_by_id': "SELECT Round_ID, Date FROM funding_rounds LIMIT 200",
+    'founder_by_id': "SELECT Founder_ID FROM founders LIMIT 200",
+    'round_ids_for_startup': "SELECT Startup_ID FROM startups LIMIT 200",
+    'acquisitions_by_acquirer': "SELECT Acquirer_Startup_ID FROM acquisitions WHERE Acquirer_Startup_ID IS NOT NULL LIMIT 200",
+}
+
+
+def benchmark(runs=200, seed=42):
+    rng = random.Random(seed)
+    cases = []
+    for name, sample in BENCH_SAMPLES.items():
+        # Sampled rows are the statement's parameters: an ID, then any other key columns
+        keys = [(int(row[0]),) + row[1:] for row in read_df(sample, ttl=0).itertuples(index=False, name=None)]
+        if keys:
+            cases.append((name, [rng.choice(keys) for _ in range(runs)]))
+    sectors = read_df(SECTORS_QUERY, ttl=0)['Sector'].tolist()
+    if sectors:
+        join_name = join_statement(sector=sectors[0])[0]
+        cases.append((join_name, [(rng.choice(sectors),) for _ in range(runs)]))
+    cases.append((aggregate_statement('Industry', 'Total Funding'), [(rng.randint(5, 20),) for _ in range(runs)]))
+
+    rows = []
+    for name, params in cases:
+        for prepared in (False, True):
+            # Warm-up: connections opened and, for the prepared path, the statement prepared
+            read_df(STATEMENTS[name], params[0], ttl=0, prepared=prepared)
+            samples = []
+            for p in params:
+                start = time.perf_counter()
+                read_df(STATEMENTS[name], p, ttl=0, prepared=prepared)
+                samples.append((time.perf_counter() - start) * 1000)
+            s = pd.Series(samples)
+            rows.append({'statement': name, 'path': 'prepared' if prepared else 'text',
+                         'mean_ms': s.mean(), 'p50_ms': s.median(), 'p95_ms': s.quantile(0.95)})
+    return pd.DataFrame(rows).round(3)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark prepared statements against plain text queries")
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    print(benchmark(args.runs).to_string(index=False))
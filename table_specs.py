@@ -0,0 +1,61 @@
+# table_specs.py
+# The View All tables: what each one selects, sorts and filters on
+from pagination import TableSpec
+
+STARTUPS_TABLE = TableSpec(
+    name="startups_table",
+    columns="s.Startup_ID, s.Name, s.Founded_Year, c.Name AS City, i.Sector",
+    from_clause="""startups s
+    LEFT JOIN cities c ON s.City_ID = c.City_ID
+    LEFT JOIN industries i ON s.Industry_ID = i.Industry_ID""",
+    key="s.Startup_ID",
+    sort_columns={"Startup ID": "s.Startup_ID", "Name": "s.Name", "Founded Year": "s.Founded_Year"},
+    filter_columns={"Name": "s.Name", "City": "c.Name", "Sector": "i.Sector"}
+)
+
+INVESTORS_TABLE = TableSpec(
+    name="investors_table",
+    columns="i.Investor_ID, i.Name, i.Type, c.Name AS Country",
+    from_clause="investors i LEFT JOIN countries c ON i.Country_ID = c.Country_ID",
+    key="i.Investor_ID",
+    sort_columns={"Investor ID": "i.Investor_ID", "Name": "i.Name"},
+    filter_columns={"Name": "i.Name", "Type": "i.Type", "Country": "c.Name"}
+)
+
+FUNDING_TABLE = TableSpec(
+    name="funding_table",
+    columns="fr.Round_ID, s.Name AS Startup, fr.Date, fr.Amount, fr.Stage",
+    from_clause="funding_rounds fr JOIN startups s ON fr.Startup_ID = s.Startup_ID",
+    key="fr.Round_ID",
+    sort_columns={"Round ID": "fr.Round_ID", "Date": "fr.Date", "Amount": "fr.Amount"},
+    filter_columns={"Startup": "s.Name", "Stage": "fr.Stage"}
+)
+
+FOUNDERS_TABLE = TableSpec(
+    name="founders_table",
+    columns="f.Founder_ID, f.Name, s.Name AS Startup, f.Role, f.LinkedIn_URL",
+    from_clause="founders f LEFT JOIN startups s ON f.Startup_ID = s.Startup_ID",
+    key="f.Founder_ID",
+    sort_columns={"Founder ID": "f.Founder_ID", "Name": "f.Name"},
+    filter_columns={"Name": "f.Name", "Startup": "s.Name", "Role": "f.Role"}
+)
+
+ACQUISITIONS_TABLE = TableSpec(
+    name="acquisitions_table",
+    columns="s1.Name AS Acquirer, s2.Name AS Target, a.Date, a.Amount",
+    from_clause="""acquisitions a
+    JOIN startups s1 ON a.Acquirer_Startup_ID = s1.Startup_ID
+    JOIN startups s2 ON a.Target_Startup_ID = s2.Startup_ID""",
+    key="a.AcquisitionID",
+    sort_columns={"Date": "a.Date", "Amount": "a.Amount"},
+    filter_columns={"Acquirer": "s1.Name", "Target": "s2.Name"},
+    default_descending=True
+)
+
+TABLE_SPECS = {
+    'startups': STARTUPS_TABLE,
+    'investors': INVESTORS_TABLE,
+    'funding_rounds': FUNDING_TABLE,
+    'founders': FOUNDERS_TABLE,
+    'acquisitions': ACQUISITIONS_TABLE,
+}
@@ -0,0 +1,114 @@
+# test_analytics_engine.py
+# FactSet's group-bys checked against the trigger rollups (as datagen.summaries builds them)
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_engine import FactSet
+from datagen import generate, summaries
+
+
+@pytest.fixture(scope="module")
+def data():
+    data = generate(3000, seed=5)
+    rounds = data['funding_rounds']
+    # Some rounds without an amount, and one stage whose rounds all lack one
+    rng = np.random.default_rng(5)
+    rounds.loc[rng.random(len(rounds)) < 0.05, 'Amount'] = np.nan
+    rounds.loc[rounds['Stage'] == rounds['Stage'].value_counts().index[-1], 'Amount'] = np.nan
+    return data
+
+
+@pytest.fixture(scope="module")
+def facts(data):
+    startups = data['startups'] \
+        .merge(data['industries'][['Industry_ID', 'Sector']], on='Industry_ID', how='left') \
+        .merge(data['cities'][['City_ID', 'Name']].rename(columns={'Name': 'City'}), on='City_ID', how='left') \
+        .sort_values('Startup_ID')
+    sectors = pd.Series(sorted(data['industries']['Sector'].unique()))
+    cities = pd.Series(sorted(data['cities']['Name'].unique()))
+    rounds = data['funding_rounds'].sort_values('Round_ID')
+    return FactSet.build(startups, rounds, sectors, cities)
+
+
+@pytest.fixture(scope="module")
+def rollups(data):
+    return summaries(data)
+
+
+def _by_label(rollup, dim, id_col, label):
+    joined = rollup.merge(dim[[id_col, label]], on=id_col)
+    return joined.groupby(label).agg(Startups=('Startups', 'sum'), Rounds=('Rounds', 'sum'),
+                                     Total_Funding=('Total_Funding', 'sum'), Min_Funding=('Min_Funding', 'min'),
+                                     Max_Funding=('Max_Funding', 'max'))
+
+
+def _check(stats, expected, startups=True):
+    stats = stats.set_index('Category').loc[expected.index]
+    if startups:
+        assert stats['Total_Startups'].tolist() == expected['Startups'].tolist()
+    assert stats['Total_Rounds'].tolist() == expected['Rounds'].tolist()
+    assert np.allclose(stats['Total_Funding'], expected['Total_Funding'])
+    assert np.allclose(stats['Min_Funding'], expected['Min_Funding'].fillna(0.0))
+    assert np.allclose(stats['Max_Funding'], expected['Max_Funding'].fillna(0.0))
+
+
+def test_sector_stats_match_industry_rollup(facts, data, rollups):
+    expected = _by_label(rollups['industry_funding_summary'], data['industries'], 'Industry_ID', 'Sector')
+    _check(facts.group_stats('Sector'), expected)
+
+
+def test_city_stats_match_city_rollup(facts, data, rollups):
+    expected = _by_label(rollups['city_funding_summary'], data['cities'], 'City_ID', 'Name')
+    _check(facts.group_stats('City'), expected)
+
+
+def test_stage_stats_match_stage_rollup(facts, rollups):
+    expected = rollups['stage_funding_summary'].set_index('Stage')
+    _check(facts.group_stats('Stage', startups=False), expected, startups=False)
+    totals = facts.stage_totals().loc[expected.index]
+    assert totals['Total_Rounds'].tolist() == expected['Rounds'].tolist()
+
+
+def test_null_amounts(facts, data):
+    stats = facts.group_stats('Stage', startups=False).set_index('Category')
+    assert np.isfinite(stats[['Total_Funding', 'Avg_Funding', 'Min_Funding', 'Max_Funding']].to_numpy()).all()
+    rounds = data['funding_rounds']
+    unpriced = rounds.groupby('Stage')['Amount'].count().loc[lambda s: s == 0].index
+    assert len(unpriced) == 1
+    assert stats.loc[unpriced[0], 'Total_Rounds'] > 0
+    assert stats.loc[unpriced[0], ['Total_Funding', 'Avg_Funding', 'Max_Funding']].tolist() == [0.0, 0.0, 0.0]
+    # Average over the rounds that have an amount
+    mean = rounds.groupby('Stage')['Amount'].mean().dropna()
+    assert np.allclose(stats.loc[mean.index, 'Avg_Funding'], mean)
+
+
+def test_startup_totals_match_startup_rollup(facts, rollups):
+    expected = rollups['startup_funding_summary'].sort_values('Startup_ID')
+    total, rounds = facts.startup_totals()
+    assert rounds.tolist() == expected['Rounds'].tolist()
+    assert np.allclose(total, expected['Total_Funding'])
+
+
+def test_filtered_stats_match_pandas(facts, data):
+    rounds = data['funding_rounds'].copy()
+    rounds['Year'] = pd.to_datetime(rounds['Date']).dt.year
+    keep = facts.mask(years=(2018, 2020))
+    stats = facts.group_stats('Stage', keep, startups=True).set_index('Category')
+    window = rounds[rounds['Year'].between(2018, 2020)]
+    expected = window.groupby('Stage').agg(Startups=('Startup_ID', 'nunique'), Rounds=('Round_ID', 'size'),
+                                           Total=('Amount', 'sum'))
+    assert stats.loc[expected.index, 'Total_Startups'].tolist() == expected['Startups'].tolist()
+    assert stats.loc[expected.index, 'Total_Rounds'].tolist() == expected['Rounds'].tolist()
+    assert np.allclose(stats.loc[expected.index, 'Total_Funding'], expected['Total'])
+
+
+def test_append_equals_build(facts, data):
+    rounds = data['funding_rounds'].sort_values('Round_ID')
+    half = len(rounds) // 2
+    startups = facts.startups
+    first = FactSet.build(startups, rounds.iloc[:half], startups['Sector'].cat.categories,
+                          startups['City'].cat.categories)
+    appended = first.append(rounds.iloc[half:])
+    assert appended.watermark == int(rounds['Round_ID'].max())
+    pd.testing.assert_frame_equal(appended.group_stats('Sector'), facts.group_stats('Sector'))
@@ -0,0 +1,85 @@
+# test_bulk_import.py
+import datetime
+
+import pandas as pd
+
+from bulk_import import SPECS, check_columns, validate
+
+
+def _seen(spec):
+    return {column: set() for column in spec.unique}
+
+
+def _reasons(rejected):
+    return dict(zip(rejected['Row'], rejected['Reason']))
+
+
+def test_funding_rounds_rejects_with_first_failing_reason():
+    spec = SPECS['funding_rounds']
+    chunk = pd.DataFrame({
+        'Round_ID': ['1', '2', '3', '4', '5', '6', '7', '2.5', ''],
+        'Startup': ['Acme', ' acme ', 'Nobody', 'Acme', 'Acme', 'Acme', 'Acme', 'Acme', 'Acme'],
+        'Date': ['2021-03-04', '', '2021-01-01', 'not a date', '2021-01-01', '2021-01-01', '2021-01-01',
+                 '2021-01-01', '2021-01-01'],
+        'Amount': ['100', '250.5', '10', '10', '-5', 'ten', '10', '10', '10'],
+        'Stage': ['Seed', 'Series A', 'Seed', 'Seed', 'Seed', 'Seed', 'Series Z', 'Seed', 'Seed'],
+    })
+    clean, rejected = validate(chunk, spec, {'startups': {'acme': 11}}, _seen(spec))
+
+    assert list(clean.columns) == spec.columns
+    assert clean['Round_ID'].tolist() == [1, 2]
+    assert clean['Startup_ID'].tolist() == [11, 11]
+    assert clean['Date'].tolist() == [datetime.date(2021, 3, 4), None]
+    assert clean['Amount'].tolist() == [100.0, 250.5]
+    assert _reasons(rejected) == {
+        3: "Unknown startup",
+        4: "Date is not a valid date",
+        5: "Amount must be > 0",
+        6: "Amount is not a number",
+        7: "Stage not in the allowed list",
+        8: "Round_ID is not an integer",
+        9: "Round_ID is required",
+    }
+    # Rejected rows keep the file's own values
+    assert rejected.loc[rejected['Row'] == 3, 'Startup'].item() == 'Nobody'
+
+
+def test_duplicates_within_and_across_chunks():
+    spec = SPECS['startups']
+    seen = _seen(spec)
+    first = pd.DataFrame({'Startup_ID': [1, 2, 2], 'Name': ['A', 'B', 'C'], 'Founded_Year': [2010, 2011, 2012]})
+    clean, rejected = validate(first, spec, {'cities': {}, 'industries': {}}, seen)
+    assert clean['Startup_ID'].tolist() == [1, 2]
+    assert _reasons(rejected) == {3: "Duplicate Startup_ID in file"}
+    assert seen['Startup_ID'] == {1, 2} and seen['Name'] == {'A', 'B'}
+
+    second = pd.DataFrame({'Startup_ID': [3, 4], 'Name': ['A', 'D'], 'Founded_Year': [2010, 1800]},
+                          index=[3, 4])
+    clean, rejected = validate(second, spec, {'cities': {}, 'industries': {}}, seen)
+    assert clean.empty
+    reasons = _reasons(rejected)
+    assert reasons[4] == "Duplicate Name in file"
+    assert reasons[5].startswith("Founded_Year outside")
+    # A rejected row does not claim its key
+    assert 4 not in seen['Startup_ID']
+
+
+def test_lookup_names_and_column_case():
+    spec = SPECS['startups']
+    chunk = pd.DataFrame({'startup_id': [1, 2], 'NAME': ['A', 'B'], 'city': ['Pune', None],
+                          'Industry': ['Fintech', 'Edtech']})
+    maps = {'cities': {'pune': 5}, 'industries': {'fintech': 7}}
+    clean, rejected = validate(chunk, spec, maps, _seen(spec))
+    assert clean.to_dict('records') == [
+        {'Startup_ID': 1, 'Name': 'A', 'Founded_Year': None, 'City_ID': 5, 'Industry_ID': 7}]
+    assert _reasons(rejected) == {2: "Unknown industry"}
+
+
+def test_missing_required_columns():
+    check_columns(pd.DataFrame(columns=['Round_ID', 'Startup', 'Amount', 'Stage']), SPECS['funding_rounds'])
+    try:
+        check_columns(pd.DataFrame(columns=['Round_ID', 'Amount']), SPECS['funding_rounds'])
+    except ValueError as e:
+        assert 'Startup_ID' in str(e) and 'Stage' in str(e)
+    else:
+        raise AssertionError("expected ValueError")
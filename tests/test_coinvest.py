@@ -0,0 +1,82 @@
+# test_coinvest.py
+from collections import Counter
+from itertools import permutations
+
+import numpy as np
+import pandas as pd
+
+from coinvest import CoInvestIndex, _key, _members, _merge, _pairs
+
+
+def _frame(rows):
+    return pd.DataFrame(rows, columns=['Round_ID', 'Investor_ID', 'Startup_ID'])
+
+
+def _expected_pairs(rows):
+    by_round = {}
+    for round_id, investor_id, _ in rows:
+        by_round.setdefault(round_id, []).append(investor_id)
+    return Counter((a << 32) | b for investors in by_round.values() for a, b in permutations(investors, 2))
+
+
+def _random_rows(rng, rounds=60, investors=15):
+    rows = []
+    for round_id in range(1, rounds + 1):
+        size = rng.integers(0, 6)
+        rows += [(round_id, int(i), round_id % 9 + 1) for i in rng.choice(investors, size, replace=False) + 1]
+    return rows
+
+
+def test_pairs_match_brute_force():
+    rng = np.random.default_rng(7)
+    rows = _random_rows(rng)
+    keys, counts = _pairs(_members(_frame(rows))[0])
+    assert np.all(np.diff(keys) > 0)
+    assert dict(zip(keys.tolist(), counts.tolist())) == _expected_pairs(rows)
+
+
+def test_pairs_of_single_investor_rounds_and_empty():
+    keys, counts = _pairs(_members(_frame([(1, 4, 1), (2, 5, 1)]))[0])
+    assert len(keys) == 0 and len(counts) == 0
+    keys, counts = _pairs(np.empty(0, dtype='int64'))
+    assert len(keys) == 0 and len(counts) == 0
+
+
+def test_merge_adds_subtracts_and_drops_zeroes():
+    keys = np.array([10, 20, 30], dtype='int64')
+    weights = np.array([1, 2, 3], dtype='int64')
+    merged = _merge(keys, weights, np.array([5, 10, 25, 30, 40], dtype='int64'),
+                    np.array([2, -1, 1, 1, -1], dtype='int64'))
+    assert merged[0].tolist() == [5, 20, 25, 30]
+    assert merged[1].tolist() == [2, 2, 1, 4]
+    unchanged = _merge(keys, weights, np.empty(0, dtype='int64'), np.empty(0, dtype='int64'))
+    assert unchanged[0] is keys and unchanged[1] is weights
+
+
+def _assert_same(patched, rebuilt):
+    for name in ('members', 'startups', 'holdings', 'keys', 'weights'):
+        assert np.array_equal(getattr(patched, name), getattr(rebuilt, name)), name
+
+
+def test_patch_equals_rebuild():
+    rng = np.random.default_rng(11)
+    rows = _random_rows(rng)
+    index = CoInvestIndex.build(_frame(rows))
+    for step in range(5):
+        changed = set(rng.choice(70, 8, replace=False).tolist())   # some rounds are new
+        kept = [r for r in rows if r[0] not in changed]
+        fresh = [(round_id, int(i), int(rng.integers(1, 10)))
+                 for round_id in sorted(changed) for i in rng.choice(15, rng.integers(0, 5), replace=False) + 1]
+        rows = kept + fresh
+        index = index.patch(changed, _frame(fresh), step + 1, frozenset())
+        _assert_same(index, CoInvestIndex.build(_frame(rows)))
+        assert index.watermark == step + 1
+
+
+def test_patch_removing_a_round():
+    rows = [(1, 1, 1), (1, 2, 1), (2, 1, 2), (2, 2, 2), (2, 3, 2)]
+    index = CoInvestIndex.build(_frame(rows)).patch({2}, _frame([]), 1, frozenset())
+    _assert_same(index, CoInvestIndex.build(_frame(rows[:2])))
+    assert index.shared_rounds(1, 2) == 1
+    assert index.shared_rounds(1, 3) == 0
+    assert np.array_equal(index.holdings, np.sort(_key(np.array([1, 2]), np.array([1, 1]))))
@@ -0,0 +1,104 @@
+# test_materialize.py
+import datetime
+
+import numpy as np
+import pandas as pd
+from mysql.connector import FieldType
+
+from materialize import column_kinds, frame_from_cursor, iter_frames
+
+
+class FakeCursor:
+    # Just what materialize reads: description and fetchmany
+    def __init__(self, description, rows):
+        self.description = description
+        self.rows = list(rows)
+        self.fetches = []
+
+    def fetchmany(self, size):
+        chunk, self.rows = self.rows[:size], self.rows[size:]
+        self.fetches.append(len(chunk))
+        return chunk
+
+
+DESCRIPTION = [('Round_ID', FieldType.LONG), ('Amount', FieldType.NEWDECIMAL),
+               ('Date', FieldType.DATE), ('Stage', FieldType.VAR_STRING)]
+
+
+def _rows(n):
+    return [(i, None if i % 4 == 0 else float(i) * 1.5,
+             None if i % 5 == 0 else datetime.date(2020, 1, 1) + datetime.timedelta(days=i), f"S{i % 3}")
+            for i in range(1, n + 1)]
+
+
+def test_column_kinds_from_type_codes_and_declared_dtypes():
+    assert column_kinds(DESCRIPTION) == ['int64', 'float64', 'object', 'object']
+    assert column_kinds(DESCRIPTION, {'Date': 'datetime64', 'Stage': 'category'}) == \
+        ['int64', 'float64', 'datetime64', 'category']
+
+
+def test_unknown_dtype_is_rejected():
+    try:
+        column_kinds(DESCRIPTION, {'Date': 'date'})
+    except ValueError as e:
+        assert 'Date' in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_frame_matches_rows_across_chunk_boundaries():
+    rows = _rows(25)
+    cursor = FakeCursor(DESCRIPTION, rows)
+    df = frame_from_cursor(cursor, {'Date': 'datetime64', 'Stage': 'category'}, fetch_size=10)
+    assert cursor.fetches == [10, 10, 5, 0]
+    assert list(df.columns) == ['Round_ID', 'Amount', 'Date', 'Stage']
+    assert df['Round_ID'].dtype == 'int64'
+    assert df['Round_ID'].tolist() == list(range(1, 26))
+    assert df['Amount'].dtype == 'float64'
+    assert df['Amount'].isna().tolist() == [r[1] is None for r in rows]
+    assert np.allclose(df['Amount'].dropna(), [r[1] for r in rows if r[1] is not None])
+    assert df['Date'].dtype.kind == 'M'
+    assert df['Date'].isna().tolist() == [r[2] is None for r in rows]
+    assert df['Date'].dropna().tolist() == [pd.Timestamp(r[2]) for r in rows if r[2] is not None]
+    assert isinstance(df['Stage'].dtype, pd.CategoricalDtype)
+    assert df['Stage'].tolist() == [r[3] for r in rows]
+
+
+def test_exact_multiple_of_fetch_size():
+    df = frame_from_cursor(FakeCursor(DESCRIPTION, _rows(20)), fetch_size=10)
+    assert len(df) == 20
+    assert df['Round_ID'].tolist() == list(range(1, 21))
+
+
+def test_null_int_column_falls_back_to_float():
+    description = [('Startup_ID', FieldType.LONG), ('City_ID', FieldType.LONG)]
+    df = frame_from_cursor(FakeCursor(description, [(1, 7), (2, None), (3, 9)]))
+    assert df['Startup_ID'].dtype == 'int64'
+    assert df['City_ID'].dtype == 'float64'
+    assert df['City_ID'].isna().tolist() == [False, True, False]
+
+
+def test_null_int_in_one_chunk_only():
+    # The chunk with the NULL is float64, the others int64; concatenated it is float64
+    description = [('City_ID', FieldType.LONG)]
+    df = frame_from_cursor(FakeCursor(description, [(1,), (2,), (None,), (4,)]), fetch_size=2)
+    assert df['City_ID'].dtype == 'float64'
+    assert df['City_ID'].tolist()[:2] == [1.0, 2.0] and np.isnan(df['City_ID'][2])
+
+
+def test_empty_result_keeps_columns_and_dtypes():
+    df = frame_from_cursor(FakeCursor(DESCRIPTION, []), {'Date': 'datetime64'})
+    assert len(df) == 0
+    assert list(df.columns) == ['Round_ID', 'Amount', 'Date', 'Stage']
+    assert df['Round_ID'].dtype == 'int64'
+    assert df['Amount'].dtype == 'float64'
+    assert df['Date'].dtype.kind == 'M'
+
+
+def test_iter_frames_yields_one_frame_per_chunk():
+    rows = _rows(25)
+    frames = list(iter_frames(FakeCursor(DESCRIPTION, rows), {'Date': 'datetime64'}, fetch_size=10))
+    assert [len(f) for f in frames] == [10, 10, 5]
+    joined = pd.concat(frames, ignore_index=True)
+    whole = frame_from_cursor(FakeCursor(DESCRIPTION, rows), {'Date': 'datetime64'}, fetch_size=10)
+    pd.testing.assert_frame_equal(joined, whole)
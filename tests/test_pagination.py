@@ -0,0 +1,73 @@
+# test_pagination.py
+# Keyset paging checked by walking every page against SQLite, which orders NULLs the way
+# MySQL does (first ascending, last descending)
+import sqlite3
+
+import pytest
+
+from pagination import TableSpec, build_page_query, build_view_query, escape_like
+
+SPEC = TableSpec(name="t", columns="t.id, t.v", from_clause="t", key="t.id",
+                 sort_columns={"ID": "t.id", "Value": "t.v"})
+
+VALUES = [5, None, 3, 5, None, 1, 3, 3, None, 8, 5, 2, None, 8]
+
+
+@pytest.fixture(scope="module")
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", list(enumerate(VALUES, start=1)))
+    yield conn
+    conn.close()
+
+
+def _run(conn, query, params):
+    return conn.execute(query.replace("%s", "?"), params).fetchall()
+
+
+def _walk(conn, sort_expr, descending, page_size):
+    ids, cursor = [], None
+    while True:
+        query, params = build_page_query(SPEC, sort_expr, descending, page_size, cursor=cursor)
+        rows = _run(conn, query, params)
+        page = rows[:page_size]
+        ids += [row[0] for row in page]
+        if len(rows) <= page_size:
+            return ids
+        cursor = (page[-1][2], page[-1][3])     # _sort_key, _row_key
+
+
+@pytest.mark.parametrize("sort_expr", ["t.id", "t.v"])
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("page_size", [1, 3, 4, 14, 20])
+def test_pages_cover_the_full_order_once(conn, sort_expr, descending, page_size):
+    query, _, params = build_view_query(SPEC, sort_expr, descending)
+    expected = [row[0] for row in _run(conn, query, params)]
+    assert _walk(conn, sort_expr, descending, page_size) == expected
+
+
+def test_null_cursor_conditions():
+    query, params = build_page_query(SPEC, "t.v", False, 25, cursor=(None, 7))
+    assert "((t.v IS NULL AND t.id > %s) OR t.v IS NOT NULL)" in query
+    assert params == [7, 26]
+    query, params = build_page_query(SPEC, "t.v", True, 25, cursor=(None, 7))
+    assert "(t.v IS NULL AND t.id < %s)" in query
+    assert params == [7, 26]
+
+
+def test_value_cursor_conditions():
+    query, params = build_page_query(SPEC, "t.v", True, 10, cursor=(3, 7))
+    assert "(t.v < %s OR (t.v = %s AND t.id < %s) OR t.v IS NULL)" in query
+    assert query.endswith("ORDER BY t.v DESC, t.id DESC LIMIT %s")
+    assert params == [3, 3, 7, 11]
+    query, params = build_page_query(SPEC, "t.id", False, 10, cursor=(7, 7))
+    assert "WHERE t.id > %s ORDER BY t.id ASC LIMIT %s" in query
+    assert params == [7, 11]
+
+
+def test_filter_is_a_prefix_match_before_the_keyset():
+    query, params = build_page_query(SPEC, "t.v", False, 10, "t.v", "50%_off", cursor=(3, 7))
+    assert "WHERE t.v LIKE %s AND (t.v > %s" in query
+    assert params == ["50\\%\\_off%", 3, 3, 7, 11]
+    assert escape_like("a\\b") == "a\\\\b"
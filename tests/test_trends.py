@@ -0,0 +1,67 @@
+# test_trends.py
+import numpy as np
+import pandas as pd
+
+from trends import long_form, stage_mix, trend
+
+
+def _rollup(rows):
+    df = pd.DataFrame(rows, columns=['Month', 'Sector', 'Stage', 'Rounds', 'Total_Funding'])
+    df['Month'] = pd.to_datetime(df['Month'])
+    df['Sector'] = df['Sector'].astype('category')
+    df['Stage'] = df['Stage'].astype('category')
+    return df
+
+
+ROWS = [
+    ('2021-01-01', 'Fintech', 'Seed', 2, 30.0),
+    ('2021-02-01', 'Fintech', 'Series A', 1, 70.0),
+    ('2021-02-01', 'Edtech', 'Seed', 3, 0.0),        # rounds without amounts: a zero total
+    ('2021-07-01', 'Health', 'Seed', 1, 5.0),
+]
+
+
+def test_quarterly_totals_with_empty_periods():
+    wide = trend(_rollup(ROWS), months=3)
+    assert wide.index.tolist() == pd.to_datetime(['2021-01-01', '2021-04-01', '2021-07-01']).tolist()
+    assert wide['Total_Funding'].tolist() == [100.0, 0.0, 5.0]
+
+
+def test_zero_total_group_keeps_its_column():
+    wide = trend(_rollup(ROWS), months=3, by='Sector')
+    assert list(wide.columns) == ['Fintech', 'Health', 'Edtech']
+    assert wide['Edtech'].tolist() == [0.0, 0.0, 0.0]
+    rounds = trend(_rollup(ROWS), months=3, by='Sector', metric='Rounds')
+    assert rounds.dtypes.eq('int64').all()
+    assert rounds['Edtech'].tolist() == [3, 0, 0]
+
+
+def test_unused_categories_get_no_column():
+    df = _rollup(ROWS)
+    df['Sector'] = df['Sector'].cat.add_categories(['Agritech'])
+    assert 'Agritech' not in trend(df, months=12, by='Sector').columns
+
+
+def test_groups_past_top_n_fold_into_other():
+    wide = trend(_rollup(ROWS), months=12, by='Sector', top_n=2)
+    assert list(wide.columns) == ['Fintech', 'Other']
+    assert wide.loc['2021-01-01'].tolist() == [100.0, 5.0]
+
+
+def test_stage_mix_with_a_zero_total_period():
+    rows = ROWS + [('2021-04-01', 'Edtech', 'Seed', 2, 0.0)]
+    mix = stage_mix(_rollup(rows), months=3)
+    assert np.allclose(mix.loc['2021-01-01', ['Seed', 'Series A']].to_numpy(), [0.3, 0.7])
+    assert mix.loc['2021-04-01'].tolist() == [0.0, 0.0]      # no funding: no shares, not NaN
+
+
+def test_long_form():
+    wide = trend(_rollup(ROWS), months=12, by='Sector')
+    long = long_form(wide, group='Sector', value='Funding')
+    assert list(long.columns) == ['Period', 'Sector', 'Funding']
+    assert len(long) == 3 and long['Funding'].sum() == 105.0
+
+
+def test_empty_rollup():
+    wide = trend(_rollup([]), months=3, by='Sector')
+    assert wide.empty
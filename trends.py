@@ -0,0 +1,99 @@
+# trends.py
+# Funding over time for the Analytics page's Trends tab. Triggers keep rounds and funding
+# per month x industry x city x stage (monthly_funding_summary in db/summary_tables.sql), so
+# a multi-year view reads one row per group and month however many rounds there are. The
+# rollup is read once (query cache) and every interval, breakdown and filter is worked out
+# from it in pandas/NumPy: months are bucketed to quarters or years arithmetically and
+# summed per (period, group) with one bincount over the category codes.
+import numpy as np
+import pandas as pd
+
+from db import execute_query
+
+TRENDS_SELECT = """
+SELECT m.Month, COALESCE(i.Sector, 'Unknown') AS Sector, COALESCE(c.Name, 'Unknown') AS City,
+       m.Stage, m.Rounds, m.Total_Funding
+FROM monthly_funding_summary m
+LEFT JOIN industries i ON m.Industry_ID = i.Industry_ID
+LEFT JOIN cities c ON m.City_ID = c.City_ID
+WHERE m.Rounds > 0
+"""
+TRENDS_DTYPES = {'Month': 'datetime64', 'Sector': 'category', 'City': 'category', 'Stage': 'category'}
+
+# Months per period
+FREQUENCIES = {'Monthly': 1, 'Quarterly': 3, 'Yearly': 12}
+BREAKDOWNS = {'None': None, 'Industry': 'Sector', 'City': 'City', 'Funding Stage': 'Stage'}
+METRICS = {'Total Funding': 'Total_Funding', 'Rounds': 'Rounds'}
+
+# Breakdowns with more groups than this fold the smallest into "Other"
+TOP_GROUPS = 8
+
+
+# Page-side: the whole rollup, shared through the query cache until a funding or startup
+# write bumps monthly_funding_summary's version
+def load_trends():
+    return execute_query(TRENDS_SELECT, prepared=True, dtypes=TRENDS_DTYPES)
+
+
+# Rows of the rollup for one industry (Sector) and/or city, as a view of the loaded frame
+def filter_trends(df, sector=None, city=None):
+    keep = np.ones(len(df), dtype=bool)
+    if sector:
+        keep &= (df['Sector'] == sector).to_numpy()
+    if city:
+        keep &= (df['City'] == city).to_numpy()
+    return df[keep]
+
+
+# Monthly rollup rows -> one row per period of `months` months (1, 3 or 12; calendar-aligned),
+# one column per group of `by` (or a single `metric` column); periods without rounds are 0
+def trend(df, months=3, by=None, metric='Total_Funding', top_n=TOP_GROUPS):
+    values = df[metric].to_numpy(dtype='float64')
+    buckets = df['Month'].to_numpy().astype('datetime64[M]').astype('int64') // months
+    first = buckets.min() if len(buckets) else 0
+    periods = int(buckets.max() - first + 1) if len(buckets) else 0
+    index = pd.DatetimeIndex(((np.arange(periods) + first) * months).astype('datetime64[M]'), name='Month')
+
+    if by is None:
+        columns = [metric]
+        slots = np.zeros(len(df), dtype='int64')
+    else:
+        groups = df[by] if isinstance(df[by].dtype, pd.CategoricalDtype) else df[by].astype('category')
+        codes = groups.cat.codes.to_numpy()
+        labels = list(groups.cat.categories)
+        grouped = codes >= 0
+        rows = np.bincount(codes[grouped], minlength=len(labels))
+        totals = np.bincount(codes[grouped], weights=values[grouped], minlength=len(labels))
+        # Every group with rows, largest total first (a zero total still gets its column)
+        order = np.argsort(-totals, kind='stable')
+        order = order[rows[order] > 0]
+        keep = order[:top_n - 1] if len(order) > top_n else order
+        # Groups past the top, and rows with no group (code -1, the extra last slot), fold
+        # into one trailing "Other" column
+        remap = np.full(len(labels) + 1, len(keep))
+        remap[keep] = np.arange(len(keep))
+        other = len(order) > len(keep) or not grouped.all()
+        columns = [labels[i] for i in keep] + (['Other'] if other else [])
+        slots = remap[codes]
+
+    cells = np.bincount((buckets - first) * len(columns) + slots, weights=values,
+                        minlength=periods * len(columns)).reshape(periods, len(columns))
+    if pd.api.types.is_integer_dtype(df[metric].dtype):
+        cells = cells.round().astype('int64')
+    return pd.DataFrame(cells, index=index, columns=pd.Index(columns, name=by))
+
+
+# Each stage's share of the period's funding (or rounds)
+def stage_mix(df, months=3, metric='Total_Funding'):
+    wide = trend(df, months, 'Stage', metric, top_n=max(len(df['Stage'].unique()), 1))
+    totals = wide.sum(axis=1)
+    return wide.div(totals.where(totals > 0), axis=0).fillna(0.0)
+
+
+# Wide trend -> long frame for Plotly Express: Period, <group column>, value
+def long_form(wide, group='Group', value='Value'):
+    if wide.columns.name is None:
+        # No breakdown: the single metric column
+        return pd.DataFrame({'Period': wide.index, value: wide.iloc[:, 0].to_numpy()})
+    wide = wide.rename_axis(index='Period', columns=group)
+    return wide.reset_index().melt(id_vars='Period', var_name=group, value_name=value)